@@ -7,6 +7,8 @@ from typing import Any
 import sqlglot
 from sqlglot import exp
 
+from semantic_patterns.adapters.sql_cache import parse_sql
+
 
 class Dialect(str, Enum):
     """Supported SQL dialects for LookML generation."""
@@ -68,7 +70,7 @@ class SqlRenderer:
             return expr
 
         try:
-            parsed = sqlglot.parse_one(expr, dialect=self._sqlglot_dialect)
+            parsed = parse_sql(expr, self._sqlglot_dialect)
         except Exception:
             # If parsing fails, return original
             return expr
@@ -104,7 +106,7 @@ class SqlRenderer:
             return []
 
         try:
-            parsed = sqlglot.parse_one(expr, dialect=self._sqlglot_dialect)
+            parsed = parse_sql(expr, self._sqlglot_dialect)
             return [col.name for col in parsed.find_all(exp.Column)]
         except Exception:
             return []
@@ -8,6 +8,7 @@ from semantic_patterns.adapters.lookml.renderers import (
     DimensionRenderer,
     DynamicFilteredPopStrategy,
     ExploreRenderer,
+    FieldIndex,
     LookerNativePopStrategy,
     MeasureRenderer,
     PopRenderer,
@@ -22,6 +23,7 @@ __all__ = [
     "DynamicFilteredPopStrategy",
     "ExploreGenerator",
     "ExploreRenderer",
+    "FieldIndex",
     "LookMLGenerator",
     "LookerNativePopStrategy",
     "MeasureRenderer",
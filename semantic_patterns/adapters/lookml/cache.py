@@ -0,0 +1,79 @@
+"""Persistent render cache for generated view files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from semantic_patterns import __version__
+from semantic_patterns.cache import DiskCache, MemoryCache, cache_key
+from semantic_patterns.domain import ProcessedModel
+
+if TYPE_CHECKING:
+    from semantic_patterns.adapters.lookml.paths import OutputPaths
+
+
+class RenderCache:
+    """
+    Cache of rendered view files, keyed by what they are rendered from.
+
+    The key hashes the ProcessedModel (after prefixing and schema
+    overrides), the generator settings for that model, the build options
+    and the semantic-patterns version, so any change to the inputs of a
+    render misses. Entries hold file contents by file name, so a hit is
+    valid for any output location.
+    """
+
+    NAMESPACE = "render"
+
+    def __init__(self, cache: DiskCache, settings: str = "") -> None:
+        self._cache = cache
+        self.settings = settings
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, cache_dir: Path, max_size_mb: int, settings: str = "") -> RenderCache:
+        """Open (or create) the render cache under cache_dir."""
+        return cls(
+            DiskCache(cache_dir, cls.NAMESPACE, max_size_mb * 1024 * 1024), settings
+        )
+
+    @classmethod
+    def in_memory(cls, max_size_mb: int, settings: str = "") -> RenderCache:
+        """Create a render cache held in memory (e.g. for watch mode)."""
+        return cls(MemoryCache(cls.NAMESPACE, max_size_mb * 1024 * 1024), settings)
+
+    def key(self, model: ProcessedModel, generator_settings: str) -> str:
+        """Stable key for rendering model with the given generator settings."""
+        # Source file lists only feed the manifest, never the output
+        model_json = model.model_dump_json(exclude={"source_files"})
+        return cache_key(
+            self.NAMESPACE, __version__, self.settings, generator_settings, model_json
+        )
+
+    def get(
+        self, key: str, model_name: str, paths: OutputPaths
+    ) -> dict[Path, str] | None:
+        """Return the cached files for key placed under paths, else None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        domain_path = paths.view_domain_path(model_name)
+        return {domain_path / name: content for name, content in entry.items()}
+
+    def put(self, key: str, files: dict[Path, str]) -> None:
+        """Store freshly rendered files under key."""
+        self._cache.put(key, {path.name: content for path, content in files.items()})
+
+    def save(self) -> None:
+        """Persist the cache index, evicting entries over the size cap."""
+        self._cache.save()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of models served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -5,16 +5,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import lkml
-
 from semantic_patterns.adapters.dialect import Dialect, get_default_dialect
 from semantic_patterns.adapters.lookml.renderers.calendar import (
     CalendarRenderer,
     PopCalendarConfig,
 )
 from semantic_patterns.adapters.lookml.renderers.explore import ExploreRenderer
+from semantic_patterns.adapters.lookml.serializer import (
+    dump_lookml,
+    validate_serializer,
+    with_includes,
+)
 from semantic_patterns.adapters.lookml.types import ExploreConfig
-from semantic_patterns.domain import ProcessedModel
+from semantic_patterns.domain import EntityGraph, ProcessedModel
 
 if TYPE_CHECKING:
     from semantic_patterns.adapters.lookml.paths import OutputPaths
@@ -28,8 +31,11 @@ class ExploreGenerator:
     - {explore}.explore.lkml - Explore definition with joins (includes embedded calendar view if needed)
     """
 
-    def __init__(self, dialect: Dialect | None = None) -> None:
+    def __init__(
+        self, dialect: Dialect | None = None, serializer: str = "native"
+    ) -> None:
         self.dialect = dialect or get_default_dialect()
+        self.serializer = validate_serializer(serializer)
         self.calendar_renderer = CalendarRenderer(self.dialect)
         self.explore_renderer = ExploreRenderer(self.calendar_renderer)
 
@@ -37,6 +43,7 @@ class ExploreGenerator:
         self,
         explores: list[ExploreConfig],
         models: dict[str, ProcessedModel],
+        graph: EntityGraph | None = None,
     ) -> dict[str, str]:
         """
         Generate all explore files.
@@ -44,14 +51,16 @@ class ExploreGenerator:
         Args:
             explores: List of explore configurations
             models: Dict of all models by name
+            graph: Entity index of models (built once here if not given)
 
         Returns:
             Dict of {filename: content}
         """
         files: dict[str, str] = {}
+        graph = EntityGraph.ensure(graph, models)
 
         for explore_config in explores:
-            explore_files = self.generate_explore(explore_config, models)
+            explore_files = self.generate_explore(explore_config, models, graph)
             files.update(explore_files)
 
         return files
@@ -60,9 +69,11 @@ class ExploreGenerator:
         self,
         explore_config: ExploreConfig,
         models: dict[str, ProcessedModel],
+        graph: EntityGraph | None = None,
     ) -> dict[str, str]:
         """Generate files for a single explore."""
         files: dict[str, str] = {}
+        graph = EntityGraph.ensure(graph, models)
 
         # Get fact model
         fact_model = models.get(explore_config.fact_model)
@@ -71,10 +82,12 @@ class ExploreGenerator:
             return files
 
         # Render explore
-        explore_dict, includes = self.explore_renderer.render(explore_config, fact_model, models)
+        explore_dict, includes = self.explore_renderer.render(
+            explore_config, fact_model, models, graph
+        )
 
         # Collect joined models for calendar
-        joined_models = self._get_joined_models(fact_model, models)
+        joined_models = self._get_joined_models(fact_model, graph, explore_config)
 
         # Generate calendar view if has date options
         date_options = self.calendar_renderer.collect_date_options(
@@ -107,9 +120,11 @@ class ExploreGenerator:
         explore_config: ExploreConfig,
         models: dict[str, ProcessedModel],
         paths: OutputPaths,
+        graph: EntityGraph | None = None,
     ) -> dict[Path, str]:
         """Generate files for a single explore with full paths."""
         files: dict[Path, str] = {}
+        graph = EntityGraph.ensure(graph, models)
 
         # Get fact model
         fact_model = models.get(explore_config.fact_model)
@@ -118,10 +133,12 @@ class ExploreGenerator:
             return files
 
         # Render explore
-        explore_dict, includes = self.explore_renderer.render(explore_config, fact_model, models)
+        explore_dict, includes = self.explore_renderer.render(
+            explore_config, fact_model, models, graph
+        )
 
         # Collect joined models for calendar
-        joined_models = self._get_joined_models(fact_model, models)
+        joined_models = self._get_joined_models(fact_model, graph, explore_config)
 
         # Generate calendar view if has date options
         date_options = self.calendar_renderer.collect_date_options(
@@ -149,11 +166,33 @@ class ExploreGenerator:
 
         return files
 
+    def explore_dependencies(
+        self,
+        explore_config: ExploreConfig,
+        models: dict[str, ProcessedModel],
+        graph: EntityGraph | None = None,
+    ) -> list[str]:
+        """Names of the models an explore file is rendered from."""
+        fact_model = models.get(explore_config.fact_model)
+        if not fact_model:
+            return []
+
+        graph = EntityGraph.ensure(graph, models)
+        names = {fact_model.name}
+        joins = self.explore_renderer.infer_joins(
+            fact_model, models, explore_config, graph
+        )
+        names.update(join.model for join in joins)
+        joined_models = self._get_joined_models(fact_model, graph, explore_config)
+        names.update(m.name for m in joined_models)
+        return sorted(names)
+
     def generate_with_paths(
         self,
         explores: list[ExploreConfig],
         models: dict[str, ProcessedModel],
         paths: OutputPaths,
+        graph: EntityGraph | None = None,
     ) -> dict[Path, str]:
         """
         Generate all explore files with full path information.
@@ -162,15 +201,17 @@ class ExploreGenerator:
             explores: List of explore configurations
             models: Dict of all models by name
             paths: OutputPaths for path generation
+            graph: Entity index of models (built once here if not given)
 
         Returns:
             Dict of {Path: content}
         """
         files: dict[Path, str] = {}
+        graph = EntityGraph.ensure(graph, models)
 
         for explore_config in explores:
             explore_files = self.generate_explore_with_paths(
-                explore_config, models, paths
+                explore_config, models, paths, graph
             )
             files.update(explore_files)
 
@@ -209,78 +250,43 @@ class ExploreGenerator:
     def _get_joined_models(
         self,
         fact_model: ProcessedModel,
-        all_models: dict[str, ProcessedModel],
+        graph: EntityGraph,
+        explore_config: ExploreConfig,
     ) -> list[ProcessedModel]:
         """Get list of models that would be joined to the fact model."""
-        joined: list[ProcessedModel] = []
-
-        # Build lookup: entity_name -> model for primary entities
-        primary_entity_lookup: dict[str, ProcessedModel] = {}
-        for model in all_models.values():
-            if model.name == fact_model.name:
-                continue
-            for entity in model.entities:
-                if entity.type == "primary":
-                    primary_entity_lookup[entity.name] = model
-
-        # Find models for each foreign entity on fact
-        for foreign_entity in fact_model.foreign_entities:
-            if foreign_entity.name in primary_entity_lookup:
-                joined.append(primary_entity_lookup[foreign_entity.name])
-
-        # Find child facts (models with FK to this fact)
-        if fact_model.primary_entity:
-            fact_entity_name = fact_model.primary_entity.name
-            for model in all_models.values():
-                if model.name == fact_model.name:
-                    continue
-                for entity in model.foreign_entities:
-                    if entity.name == fact_entity_name:
-                        joined.append(model)
-
+        # Models for each foreign entity on fact, then child facts
+        # (models with FK to this fact)
+        joined = [target for _, target, _ in graph.parents(fact_model)]
+        joined.extend(child for child, _ in graph.children(fact_model))
+
+        # Models chained further along foreign keys (join_depth > 1)
+        if explore_config.join_depth > 1:
+            names = {model.name for model in joined}
+            exclude = frozenset(explore_config.join_exclusions)
+            for path in graph.paths(fact_model, explore_config.join_depth, exclude):
+                target = path[-1].target
+                if len(path) > 1 and target.name not in names:
+                    names.add(target.name)
+                    joined.append(target)
         return joined
 
     def _serialize_explore(self, explore: dict[str, Any], includes: list[str]) -> str:
         """Serialize explore dict to LookML string with includes."""
-        # Build include statements
-        include_lines = [f'include: "{inc}"' for inc in includes]
-        include_section = "\n".join(include_lines)
-
-        # Serialize explore
-        lookml_dict = {"explores": [explore]}
-        explore_content = lkml.dump(lookml_dict)
-        assert explore_content is not None
-
-        # Combine includes and explore
-        return f"{include_section}\n\n{explore_content}"
+        explore_content = dump_lookml({"explores": [explore]}, self.serializer)
+        return with_includes(includes, explore_content)
 
     def _serialize_explore_with_calendar(
         self, calendar_view: dict[str, Any], explore: dict[str, Any], includes: list[str]
     ) -> str:
         """Serialize explore with embedded calendar view (multiple top-level blocks)."""
-        # Build include statements
-        include_lines = [f'include: "{inc}"' for inc in includes]
-        include_section = "\n".join(include_lines)
-
-        # Serialize calendar view
-        calendar_lookml = {"views": [calendar_view]}
-        calendar_content = lkml.dump(calendar_lookml)
-        assert calendar_content is not None
-
-        # Serialize explore
-        explore_lookml = {"explores": [explore]}
-        explore_content = lkml.dump(explore_lookml)
-        assert explore_content is not None
-
-        # Combine: includes, calendar view, then explore
-        return f"{include_section}\n\n{calendar_content}\n{explore_content}"
+        # Includes, calendar view, then explore
+        calendar_content = self._serialize_view(calendar_view)
+        explore_content = dump_lookml({"explores": [explore]}, self.serializer)
+        return with_includes(includes, calendar_content, explore_content)
 
     def _serialize_view(self, view: dict[str, Any]) -> str:
         """Serialize view dict to LookML string."""
-        lookml_dict = {"views": [view]}
-        result = lkml.dump(lookml_dict)
-        assert result is not None
-        return result
+        return dump_lookml({"views": [view]}, self.serializer)
 
     @staticmethod
     def configs_from_fact_models(fact_models: list[str]) -> list[ExploreConfig]:
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import lkml
-
 from semantic_patterns.adapters.dialect import Dialect, get_default_dialect
+from semantic_patterns.adapters.lookml.renderers.fields import FieldIndex
 from semantic_patterns.adapters.lookml.renderers.view import ViewRenderer
+from semantic_patterns.adapters.lookml.serializer import (
+    dump_lookml,
+    validate_serializer,
+    with_includes,
+)
+from semantic_patterns.adapters.sql_cache import get_sql_parse_cache
 from semantic_patterns.domain import ProcessedModel
 
 if TYPE_CHECKING:
+    from semantic_patterns.adapters.lookml.cache import RenderCache
     from semantic_patterns.adapters.lookml.paths import OutputPaths
 
 
@@ -33,8 +41,10 @@ class LookMLGenerator:
         pop_strategy_type: str = "dynamic",
         model_to_explore: dict[str, str] | None = None,
         model_to_fact: dict[str, str] | None = None,
+        serializer: str = "native",
     ) -> None:
         self.dialect = dialect or get_default_dialect()
+        self.serializer = validate_serializer(serializer)
         self.view_renderer = ViewRenderer(
             self.dialect, pop_strategy_type, model_to_explore, model_to_fact
         )
@@ -57,20 +67,25 @@ class LookMLGenerator:
         """Generate LookML files for a single model."""
         files: dict[str, str] = {}
 
+        # Field lookup shared by all three renderers
+        field_index = FieldIndex.from_model(model)
+
         # Base view (always generated)
-        base_view = self.view_renderer.render_base_view(model)
+        base_view = self.view_renderer.render_base_view(model, field_index)
         base_content = self._serialize_view(base_view)
         files[f"{model.name}.view.lkml"] = base_content
 
         # Metrics refinement (if has metrics)
-        metrics_result = self.view_renderer.render_metrics_refinement(model)
+        metrics_result = self.view_renderer.render_metrics_refinement(
+            model, field_index
+        )
         if metrics_result:
             metrics_view, metrics_includes = metrics_result
             metrics_content = self._serialize_view_with_includes(metrics_view, metrics_includes)
             files[f"{model.name}.metrics.view.lkml"] = metrics_content
 
         # PoP refinement (if has PoP variants)
-        pop_result = self.view_renderer.render_pop_refinement(model)
+        pop_result = self.view_renderer.render_pop_refinement(model, field_index)
         if pop_result:
             pop_view, pop_includes = pop_result
             pop_content = self._serialize_view_with_includes(pop_view, pop_includes)
@@ -98,20 +113,25 @@ class LookMLGenerator:
         """
         files: dict[Path, str] = {}
 
+        # Field lookup shared by all three renderers
+        field_index = FieldIndex.from_model(model)
+
         # Base view (always generated)
-        base_view = self.view_renderer.render_base_view(model)
+        base_view = self.view_renderer.render_base_view(model, field_index)
         base_content = self._serialize_view(base_view)
         files[paths.view_file_path(model.name)] = base_content
 
         # Metrics refinement (if has metrics)
-        metrics_result = self.view_renderer.render_metrics_refinement(model)
+        metrics_result = self.view_renderer.render_metrics_refinement(
+            model, field_index
+        )
         if metrics_result:
             metrics_view, metrics_includes = metrics_result
             metrics_content = self._serialize_view_with_includes(metrics_view, metrics_includes)
             files[paths.view_file_path(model.name, ".metrics")] = metrics_content
 
         # PoP refinement (if has PoP variants)
-        pop_result = self.view_renderer.render_pop_refinement(model)
+        pop_result = self.view_renderer.render_pop_refinement(model, field_index)
         if pop_result:
             pop_view, pop_includes = pop_result
             pop_content = self._serialize_view_with_includes(pop_view, pop_includes)
@@ -119,6 +139,105 @@ class LookMLGenerator:
 
         return files
 
+    def render_settings(self, model: ProcessedModel) -> str:
+        """Generator settings that affect the output for model (cache key part)."""
+        renderer = self.view_renderer
+        return "\0".join(
+            [
+                self.dialect.value,
+                renderer.pop_strategy_type,
+                self.serializer,
+                renderer.model_to_explore.get(model.name, ""),
+                renderer.model_to_fact.get(model.name, ""),
+            ]
+        )
+
+    def render_models(
+        self,
+        models: list[ProcessedModel],
+        paths: OutputPaths,
+        workers: int = 1,
+        chunksize: int | None = None,
+        cache: RenderCache | None = None,
+    ) -> Iterator[tuple[str, dict[Path, str]]]:
+        """
+        Render view files for each model, optionally in a process pool.
+
+        Models render independently, so with ``workers`` > 1 they are fanned
+        out to worker processes, each holding a copy of this generator.
+        Results are yielded in the order of ``models`` regardless of
+        ``workers``, so merged output is identical to a serial run. With a
+        cache, models whose inputs are unchanged are not rendered at all.
+
+        Args:
+            models: Models to render
+            paths: OutputPaths for path generation
+            workers: Number of worker processes (1 renders in-process)
+            chunksize: Models sent to a worker per task (None picks a few
+                chunks per worker)
+            cache: Optional persistent render cache
+
+        Yields:
+            Tuple of (model name, {Path: content}) per model
+        """
+        keys: list[str | None] = []
+        cached: list[dict[Path, str] | None] = []
+        misses: list[ProcessedModel] = []
+        for model in models:
+            key: str | None = None
+            files: dict[Path, str] | None = None
+            if cache is not None:
+                key = cache.key(model, self.render_settings(model))
+                files = cache.get(key, model.name, paths)
+            keys.append(key)
+            cached.append(files)
+            if files is None:
+                misses.append(model)
+
+        rendered = self._render_all(misses, paths, workers, chunksize)
+        for model, key, files in zip(models, keys, cached):
+            if files is None:
+                files = next(rendered)
+                if cache is not None and key is not None:
+                    cache.put(key, files)
+            yield model.name, files
+
+        if cache is not None:
+            cache.save()
+
+    def _render_all(
+        self,
+        models: list[ProcessedModel],
+        paths: OutputPaths,
+        workers: int,
+        chunksize: int | None,
+    ) -> Iterator[dict[Path, str]]:
+        """Render models serially or in a process pool, preserving order."""
+        if workers <= 1 or len(models) < 2:
+            for model in models:
+                yield self.generate_model_with_paths(model, paths)
+            return
+
+        workers = min(workers, len(models))
+        if chunksize is None:
+            chunksize = max(1, len(models) // (workers * 4))
+        # Source file lists are only needed for the manifest, not rendering
+        payloads = [model.model_copy(update={"source_files": []}) for model in models]
+
+        # Workers parse SQL through their own caches; fold their counts into
+        # this process's so hit/miss stats cover the whole render
+        sql_cache = get_sql_parse_cache()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(self, paths),
+        ) as pool:
+            for files, hits, misses in pool.map(
+                _render_in_worker, payloads, chunksize=chunksize
+            ):
+                sql_cache.add_counts(hits, misses)
+                yield files
+
     def generate_with_paths(
         self,
         models: list[ProcessedModel],
@@ -162,24 +281,29 @@ class LookMLGenerator:
 
     def _serialize_view(self, view: dict[str, Any]) -> str:
         """Serialize view dict to LookML string."""
-        # Wrap in views array for lkml
-        lookml_dict = {"views": [view]}
-        result = lkml.dump(lookml_dict)
-        assert result is not None
-        return result
+        return dump_lookml({"views": [view]}, self.serializer)
 
     def _serialize_view_with_includes(
         self, view: dict[str, Any], includes: list[str]
     ) -> str:
         """Serialize view dict to LookML string with includes."""
-        # Build include statements
-        include_lines = [f'include: "{inc}"' for inc in includes]
-        include_section = "\n".join(include_lines)
+        return with_includes(includes, self._serialize_view(view))
+
+
+# Per-process generator state, set once by the pool initializer
+_worker_state: tuple[LookMLGenerator, OutputPaths] | None = None
+
+
+def _init_render_worker(generator: LookMLGenerator, paths: OutputPaths) -> None:
+    global _worker_state
+    _worker_state = (generator, paths)
 
-        # Serialize view
-        lookml_dict = {"views": [view]}
-        view_content = lkml.dump(lookml_dict)
-        assert view_content is not None
 
-        # Combine includes and view
-        return f"{include_section}\n\n{view_content}"
+def _render_in_worker(model: ProcessedModel) -> tuple[dict[Path, str], int, int]:
+    """Render one model; also returns this render's SQL cache hits and misses."""
+    assert _worker_state is not None
+    generator, paths = _worker_state
+    sql_cache = get_sql_parse_cache()
+    hits, misses = sql_cache.hits, sql_cache.misses
+    files = generator.generate_model_with_paths(model, paths)
+    return files, sql_cache.hits - hits, sql_cache.misses - misses
@@ -6,6 +6,7 @@ from semantic_patterns.adapters.lookml.renderers.calendar import (
 )
 from semantic_patterns.adapters.lookml.renderers.dimension import DimensionRenderer
 from semantic_patterns.adapters.lookml.renderers.explore import ExploreRenderer
+from semantic_patterns.adapters.lookml.renderers.fields import FieldIndex
 from semantic_patterns.adapters.lookml.renderers.measure import MeasureRenderer
 from semantic_patterns.adapters.lookml.renderers.pop import (
     DynamicFilteredPopStrategy,
@@ -21,6 +22,7 @@ __all__ = [
     "DimensionRenderer",
     "DynamicFilteredPopStrategy",
     "ExploreRenderer",
+    "FieldIndex",
     "LookerNativePopStrategy",
     "MeasureRenderer",
     "PopRenderer",
@@ -16,7 +16,7 @@ from semantic_patterns.adapters.lookml.types import (
     InferredJoin,
     JoinRelationship,
 )
-from semantic_patterns.domain import ProcessedModel
+from semantic_patterns.domain import EntityGraph, ProcessedModel
 
 
 def get_calendar_view_name(explore_name: str) -> str:
@@ -44,6 +44,7 @@ class ExploreRenderer:
         explore_config: ExploreConfig,
         fact_model: ProcessedModel,
         all_models: dict[str, ProcessedModel],
+        graph: EntityGraph | None = None,
     ) -> tuple[dict[str, Any], list[str]]:
         """
         Render explore dict and required includes for lkml serialization.
@@ -52,6 +53,7 @@ class ExploreRenderer:
             explore_config: Configuration for this explore
             fact_model: The fact model for this explore
             all_models: Dict of all models by name (for join inference)
+            graph: Entity index of all_models (built here if not given)
 
         Returns:
             Tuple of (explore dict, list of include paths)
@@ -81,7 +83,7 @@ class ExploreRenderer:
             explore["description"] = explore_config.description
 
         # Infer joins from entity relationships
-        inferred_joins = self.infer_joins(fact_model, all_models, explore_config)
+        inferred_joins = self.infer_joins(fact_model, all_models, explore_config, graph)
 
         # Collect joined models for calendar generation
         joined_models: list[ProcessedModel] = []
@@ -111,42 +113,36 @@ class ExploreRenderer:
         fact_model: ProcessedModel,
         all_models: dict[str, ProcessedModel],
         explore_config: ExploreConfig,
+        graph: EntityGraph | None = None,
     ) -> list[InferredJoin]:
         """
         Infer joins from entity relationships (exclude-based).
 
         Auto-joins ALL entity-linked models by default. Use join_exclusions
-        to exclude specific models from auto-join.
+        to exclude specific models from auto-join. With join_depth > 1,
+        models further along a chain of foreign keys (e.g. a snowflaked
+        dimension of a dimension) are joined too, each off the view before
+        it on its shortest path.
 
         Args:
             fact_model: The fact model for this explore
             all_models: Dict of all models by name
             explore_config: Config for join overrides and exclusions
+            graph: Entity index of all_models (built here if not given)
 
         Returns:
             List of InferredJoin objects
         """
+        graph = EntityGraph.ensure(graph, all_models)
         joins: list[InferredJoin] = []
 
-        # Build lookup: entity_name -> (model, entity) for primary entities
-        # Exclude models in join_exclusions
-        primary_entity_lookup: dict[str, tuple[ProcessedModel, Any]] = {}
-        for model in all_models.values():
-            if model.name == fact_model.name:
-                continue
-            if explore_config.is_excluded(model.name):
-                continue
-            for entity in model.entities:
-                if entity.type == "primary":
-                    primary_entity_lookup[entity.name] = (model, entity)
-
-        # Check each foreign entity on fact model
-        for foreign_entity in fact_model.foreign_entities:
-            if foreign_entity.name not in primary_entity_lookup:
-                continue
-
-            target_model, target_entity = primary_entity_lookup[foreign_entity.name]
+        def excluded(model: ProcessedModel) -> bool:
+            return explore_config.is_excluded(model.name)
 
+        # Models the fact's foreign entities point at
+        for foreign_entity, target_model, target_entity in graph.parents(
+            fact_model, skip=excluded
+        ):
             # Determine relationship (explicit override takes priority)
             relationship = self._determine_relationship(
                 target_model.name, explore_config, JoinRelationship.MANY_TO_ONE
@@ -168,36 +164,54 @@ class ExploreRenderer:
                 )
             )
 
-        # Check for child facts (models with foreign entity pointing to fact)
+        # Child facts (models with foreign entity pointing to fact)
         if fact_model.primary_entity:
             fact_entity_name = fact_model.primary_entity.name
-            for model in all_models.values():
-                if model.name == fact_model.name:
-                    continue
-                if explore_config.is_excluded(model.name):
+            for model, entity in graph.children(fact_model, skip=excluded):
+                # Determine relationship (explicit override takes priority)
+                relationship = self._determine_relationship(
+                    model.name, explore_config, JoinRelationship.ONE_TO_MANY
+                )
+
+                expose = self._determine_expose_level(entity, model, explore_config)
+                # Use entity names (not expressions) for dimension references
+                joins.append(
+                    InferredJoin(
+                        model=model.name,
+                        entity=fact_entity_name,
+                        relationship=relationship,
+                        expose=expose,
+                        fact_entity_name=fact_entity_name,
+                        joined_entity_name=entity.name,
+                    )
+                )
+
+        # Chained joins to models more than one hop away
+        if explore_config.join_depth > 1:
+            joined = {join.model for join in joins}
+            exclude = frozenset(explore_config.join_exclusions)
+            for path in graph.paths(fact_model, explore_config.join_depth, exclude):
+                hop = path[-1]
+                if len(path) == 1 or hop.target.name in joined:
                     continue
-                for entity in model.foreign_entities:
-                    if entity.name == fact_entity_name:
-                        # This model has a FK to our fact model
-                        # Determine relationship (explicit override takes priority)
-                        relationship = self._determine_relationship(
-                            model.name, explore_config, JoinRelationship.ONE_TO_MANY
-                        )
-
-                        expose = self._determine_expose_level(
-                            entity, model, explore_config
-                        )
-                        # Use entity names (not expressions) for dimension references
-                        joins.append(
-                            InferredJoin(
-                                model=model.name,
-                                entity=fact_entity_name,
-                                relationship=relationship,
-                                expose=expose,
-                                fact_entity_name=fact_model.primary_entity.name,
-                                joined_entity_name=entity.name,
-                            )
-                        )
+                joined.add(hop.target.name)
+                joins.append(
+                    InferredJoin(
+                        model=hop.target.name,
+                        entity=hop.foreign_entity.name,
+                        relationship=self._determine_relationship(
+                            hop.target.name,
+                            explore_config,
+                            JoinRelationship.MANY_TO_ONE,
+                        ),
+                        expose=self._determine_expose_level(
+                            hop.foreign_entity, hop.target, explore_config
+                        ),
+                        fact_entity_name=hop.foreign_entity.name,
+                        joined_entity_name=hop.target_entity.name,
+                        from_model=hop.source.name,
+                    )
+                )
 
         return joins
 
@@ -257,12 +271,13 @@ class ExploreRenderer:
         fact_view_name: str,
     ) -> dict[str, Any]:
         """Render a single join to LookML dict."""
+        from_view_name = join.from_model or fact_view_name
         join_dict: dict[str, Any] = {
             "name": join.model,
             "type": "left_outer",
             "relationship": join.relationship.value,
             "sql_on": (
-                f"${{{fact_view_name}.{join.fact_entity_name}}} = "
+                f"${{{from_view_name}.{join.fact_entity_name}}} = "
                 f"${{{join.model}.{join.joined_entity_name}}}"
             ),
         }
@@ -0,0 +1,151 @@
+"""FieldIndex - column/name to LookML field lookup for one model."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import sqlglot.expressions as exp
+
+from semantic_patterns.adapters.lookml.sql_qualifier import _simple_reference
+from semantic_patterns.adapters.sql_cache import parse_sql
+from semantic_patterns.domain import DimensionType, ProcessedModel
+
+# (key, field_name, key is a SQL column rather than a field name)
+_Entry = tuple[str, str, bool]
+
+
+def extract_simple_column(expr: str) -> str | None:
+    """
+    Extract bare column name from simple SQL expressions.
+
+    Examples:
+        "transaction_type" -> "transaction_type"
+        "unique_rental_sk" -> "unique_rental_sk"
+        "UPPER(status)" -> None (not a simple column)
+    """
+    if not expr:
+        return None
+
+    simple = _simple_reference(expr, "")
+    if simple is not None:
+        table, column = simple
+        return None if table else column
+
+    try:
+        parsed = parse_sql(expr)
+        # Check if it's just a bare column (no functions, operators, etc.)
+        if isinstance(parsed, exp.Column) and not parsed.table:
+            return parsed.name
+    except Exception:
+        pass
+
+    return None
+
+
+@dataclass(frozen=True)
+class FieldIndex:
+    """
+    Map of column names and dimension/entity names to LookML field names.
+
+    This allows measures, filters and later dimensions to reference existing
+    fields rather than re-declaring SQL column references. Built once per
+    model with FieldIndex.from_model and shared by the base, metrics and PoP
+    renderers.
+
+    Example:
+        Categorical dimension: name="transaction_type", expr="rental_event_type"
+        Mapping: {
+            "rental_event_type": "transaction_type",  # column -> field
+            "transaction_type": "transaction_type",   # field -> field (identity)
+        }
+
+        Time dimension: name="created_at", expr="rental_created_at_utc"
+        Mapping: {
+            "rental_created_at_utc": "created_at_raw",  # column -> _raw field
+            "created_at": "created_at_raw",             # name -> _raw field
+        }
+
+        Time dimension with variants: name="created_at",
+            variants={utc: col_utc, local: col_local}
+        Mapping: {
+            "col_utc": "created_at_utc_raw",            # variant column -> _raw
+            "col_local": "created_at_local_raw",        # variant column -> _raw
+            "created_at_utc": "created_at_utc_raw",     # variant name -> _raw
+            "created_at_local": "created_at_local_raw", # variant name -> _raw
+        }
+    """
+
+    # Entries contributed by each dimension, in model order
+    dimension_entries: tuple[tuple[_Entry, ...], ...] = ()
+    entity_entries: tuple[_Entry, ...] = ()
+    # Time dimension (or variant) name -> its _raw field
+    raw_fields: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, model: ProcessedModel) -> FieldIndex:
+        """Index a model's dimensions and entities (one parse per expr)."""
+        dimension_entries: list[tuple[_Entry, ...]] = []
+        raw_fields: dict[str, str] = {}
+
+        for dim in model.dimensions:
+            entries: list[_Entry] = []
+            if dim.type == DimensionType.TIME:
+                # Time dimensions become dimension_groups with timeframe suffixes
+                # The _raw timeframe gives the actual timestamp value
+                if dim.has_variants and dim.variants:
+                    for variant_name, variant_expr in dim.variants.items():
+                        variant = f"{dim.name}_{variant_name}"
+                        field_name = f"{variant}_raw"
+                        raw_fields[variant] = field_name
+                        entries.append((variant, field_name, False))
+                        col_name = extract_simple_column(variant_expr)
+                        if col_name:
+                            entries.append((col_name, field_name, True))
+                else:
+                    field_name = f"{dim.name}_raw"
+                    raw_fields[dim.name] = field_name
+                    entries.append((dim.name, field_name, False))
+                    col_name = extract_simple_column(dim.expr) if dim.expr else None
+                    if col_name and col_name != dim.name:
+                        entries.append((col_name, field_name, True))
+            else:
+                # Categorical dimensions map directly
+                entries.append((dim.name, dim.name, False))
+                col_name = extract_simple_column(dim.expr) if dim.expr else None
+                if col_name and col_name != dim.name:
+                    entries.append((col_name, dim.name, True))
+            dimension_entries.append(tuple(entries))
+
+        entity_entries: list[_Entry] = []
+        for entity in model.entities:
+            entity_entries.append((entity.name, entity.name, False))
+            col_name = extract_simple_column(entity.expr) if entity.expr else None
+            if col_name and col_name != entity.name:
+                entity_entries.append((col_name, entity.name, True))
+
+        return cls(
+            dimension_entries=tuple(dimension_entries),
+            entity_entries=tuple(entity_entries),
+            raw_fields=raw_fields,
+        )
+
+    @cached_property
+    def fields(self) -> dict[str, str]:
+        """Complete mapping of column and field names to field names."""
+        return {key: name for key, name, _ in self._entries()}
+
+    @cached_property
+    def columns(self) -> dict[str, str]:
+        """SQL column name -> field name."""
+        return {key: name for key, name, is_column in self._entries() if is_column}
+
+    @cached_property
+    def names(self) -> dict[str, str]:
+        """Dimension / entity name -> field name."""
+        return {key: name for key, name, is_column in self._entries() if not is_column}
+
+    def _entries(self) -> list[_Entry]:
+        return [e for entries in self.dimension_entries for e in entries] + list(
+            self.entity_entries
+        )
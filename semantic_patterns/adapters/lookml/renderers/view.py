@@ -5,11 +5,9 @@ Composes dimensions, measures, and metrics into complete view structures.
 
 from typing import Any
 
-import sqlglot
-import sqlglot.expressions as exp
-
 from semantic_patterns.adapters.dialect import Dialect
 from semantic_patterns.adapters.lookml.renderers.dimension import DimensionRenderer
+from semantic_patterns.adapters.lookml.renderers.fields import FieldIndex
 from semantic_patterns.adapters.lookml.sql_qualifier import qualify_table_columns
 from semantic_patterns.adapters.lookml.renderers.measure import MeasureRenderer
 from semantic_patterns.adapters.lookml.renderers.pop import (
@@ -50,114 +48,17 @@ class ViewRenderer:
         self.model_to_explore = model_to_explore or {}
         self.model_to_fact = model_to_fact or {}
 
-    @staticmethod
-    def _build_defined_fields(model: ProcessedModel) -> dict[str, str]:
-        """
-        Build map of column_name -> field_name for dimensions and entities.
-
-        This allows measures to reference existing dimensions rather than
-        re-declaring SQL column references.
-
-        Returns:
-            Dict mapping column names AND dimension names to LookML field names
-
-        Example:
-            Categorical dimension: name="transaction_type", expr="rental_event_type"
-            Mapping: {
-                "rental_event_type": "transaction_type",  # column -> field
-                "transaction_type": "transaction_type",   # field -> field (identity)
-            }
-
-            Time dimension: name="created_at", expr="rental_created_at_utc"
-            Mapping: {
-                "rental_created_at_utc": "created_at_raw",  # column -> _raw field
-                "created_at": "created_at_raw",             # name -> _raw field
-            }
-
-            Time dimension with variants: name="created_at", variants={utc: col_utc, local: col_local}
-            Mapping: {
-                "col_utc": "created_at_utc_raw",      # variant column -> variant _raw field
-                "col_local": "created_at_local_raw", # variant column -> variant _raw field
-                "created_at_utc": "created_at_utc_raw",    # variant name -> variant _raw field
-                "created_at_local": "created_at_local_raw", # variant name -> variant _raw field
-            }
-        """
-        mapping: dict[str, str] = {}
-
-        # Add dimensions
-        for dim in model.dimensions:
-            if dim.type == DimensionType.TIME:
-                # Time dimensions become dimension_groups with timeframe suffixes
-                # The _raw timeframe gives the actual timestamp value
-                if dim.has_variants and dim.variants:
-                    # Map each variant's column and name to its _raw field
-                    for variant_name, variant_expr in dim.variants.items():
-                        field_name = f"{dim.name}_{variant_name}_raw"
-                        # Map variant dimension name (e.g., "created_at_utc")
-                        mapping[f"{dim.name}_{variant_name}"] = field_name
-                        # Map variant SQL column (e.g., "rental_created_at_utc")
-                        col_name = ViewRenderer._extract_simple_column(variant_expr)
-                        if col_name:
-                            mapping[col_name] = field_name
-                else:
-                    # Non-variant time dimension
-                    field_name = f"{dim.name}_raw"
-                    # Map dimension name to _raw field
-                    mapping[dim.name] = field_name
-                    # Map SQL column to _raw field
-                    if dim.expr:
-                        col_name = ViewRenderer._extract_simple_column(dim.expr)
-                        if col_name and col_name != dim.name:
-                            mapping[col_name] = field_name
-            else:
-                # Categorical dimensions map directly
-                mapping[dim.name] = dim.name
-                if dim.expr:
-                    col_name = ViewRenderer._extract_simple_column(dim.expr)
-                    if col_name and col_name != dim.name:
-                        mapping[col_name] = dim.name
-
-        # Add entities
-        for entity in model.entities:
-            # Map entity name to itself
-            mapping[entity.name] = entity.name
-
-            # Also map column name to entity name
-            if entity.expr:
-                col_name = ViewRenderer._extract_simple_column(entity.expr)
-                if col_name and col_name != entity.name:
-                    mapping[col_name] = entity.name
-
-        return mapping
-
-    @staticmethod
-    def _extract_simple_column(expr: str) -> str | None:
-        """
-        Extract bare column name from simple SQL expressions.
-
-        Examples:
-            "transaction_type" -> "transaction_type"
-            "unique_rental_sk" -> "unique_rental_sk"
-            "UPPER(status)" -> None (not a simple column)
-        """
-        if not expr:
-            return None
-
-        try:
-            parsed = sqlglot.parse_one(expr)
-            # Check if it's just a bare column (no functions, operators, etc.)
-            if isinstance(parsed, exp.Column) and not parsed.table:
-                return parsed.name
-        except Exception:
-            pass
-
-        return None
-
-    def render_base_view(self, model: ProcessedModel) -> dict[str, Any]:
+    def render_base_view(
+        self, model: ProcessedModel, field_index: FieldIndex | None = None
+    ) -> dict[str, Any]:
         """
         Render the base view with dimensions and entities.
 
         This is the main view file: {model}.view.lkml
+
+        Args:
+            model: Model to render
+            field_index: Precomputed FieldIndex for the model (built if omitted)
         """
         view: dict[str, Any] = {
             "name": model.name,
@@ -169,12 +70,13 @@ class ViewRenderer:
 
         # Build field mapping progressively as we render dimensions
         # This allows later dimensions to reference earlier ones
+        index = field_index or FieldIndex.from_model(model)
         defined_fields: dict[str, str] = {}
 
         # Render dimensions - separate regular dimensions from dimension_groups
         dimensions = []
         dimension_groups = []
-        for dim in model.dimensions:
+        for dim, entries in zip(model.dimensions, index.dimension_entries):
             # Render this dimension with access to previously-defined dimensions
             dim_results = self.dimension_renderer.render(dim, defined_fields)
 
@@ -185,43 +87,15 @@ class ViewRenderer:
 
             # Add this dimension to the mapping for subsequent dimensions
             # Time dimensions map to _raw field, categorical dimensions map directly
-            if dim.type == DimensionType.TIME:
-                if dim.has_variants and dim.variants:
-                    # Map each variant's column and name to its _raw field
-                    for variant_name, variant_expr in dim.variants.items():
-                        field_name = f"{dim.name}_{variant_name}_raw"
-                        defined_fields[f"{dim.name}_{variant_name}"] = field_name
-                        col_name = self._extract_simple_column(variant_expr)
-                        if col_name:
-                            defined_fields[col_name] = field_name
-                else:
-                    # Non-variant time dimension
-                    field_name = f"{dim.name}_raw"
-                    defined_fields[dim.name] = field_name
-                    if dim.expr:
-                        col_name = self._extract_simple_column(dim.expr)
-                        if col_name and col_name != dim.name:
-                            defined_fields[col_name] = field_name
-            else:
-                # Categorical dimensions map directly
-                defined_fields[dim.name] = dim.name
-                if dim.expr:
-                    col_name = self._extract_simple_column(dim.expr)
-                    if col_name and col_name != dim.name:
-                        defined_fields[col_name] = dim.name
+            defined_fields.update((key, name) for key, name, _ in entries)
 
         # Render entities as hidden dimensions with primary key
         entity_dims = self._render_entities(model.entities, defined_fields)
         if entity_dims:
             dimensions.extend(entity_dims)
 
-        # Add entities to the field mapping
-        for entity in model.entities:
-            defined_fields[entity.name] = entity.name
-            if entity.expr:
-                col_name = self._extract_simple_column(entity.expr)
-                if col_name and col_name != entity.name:
-                    defined_fields[col_name] = entity.name
+        # Entities complete the field mapping
+        defined_fields = index.fields
 
         if dimensions:
             view["dimensions"] = dimensions
@@ -248,7 +122,9 @@ class ViewRenderer:
 
         return view
 
-    def render_metrics_refinement(self, model: ProcessedModel) -> tuple[dict[str, Any], list[str]] | None:
+    def render_metrics_refinement(
+        self, model: ProcessedModel, field_index: FieldIndex | None = None
+    ) -> tuple[dict[str, Any], list[str]] | None:
         """
         Render metrics as a refinement view with includes.
 
@@ -258,8 +134,8 @@ class ViewRenderer:
         if not model.metrics:
             return None
 
-        # Build field mapping for measure rendering
-        defined_fields = self._build_defined_fields(model)
+        # Field mapping for measure rendering
+        defined_fields = (field_index or FieldIndex.from_model(model)).fields
         measure_renderer = MeasureRenderer(self.dialect, defined_fields)
 
         # Build measure lookup for simple metrics
@@ -286,7 +162,9 @@ class ViewRenderer:
             includes,
         )
 
-    def render_pop_refinement(self, model: ProcessedModel) -> tuple[dict[str, Any], list[str]] | None:
+    def render_pop_refinement(
+        self, model: ProcessedModel, field_index: FieldIndex | None = None
+    ) -> tuple[dict[str, Any], list[str]] | None:
         """
         Render PoP variants as a refinement view with includes.
 
@@ -320,8 +198,8 @@ class ViewRenderer:
             dynamic_strategy = DynamicFilteredPopStrategy(calendar_view_name=fact_view_name)
             # Build measures lookup for expression resolution
             measures_dict = {m.name: m for m in model.measures}
-            # Build defined_fields for filter rendering (so filters use field refs)
-            defined_fields = self._build_defined_fields(model)
+            # Field mapping for filter rendering (so filters use field refs)
+            defined_fields = (field_index or FieldIndex.from_model(model)).fields
             # Use render_all for dynamic strategy (generates measures per output type)
             for metric in model.metrics:
                 if metric.has_pop:
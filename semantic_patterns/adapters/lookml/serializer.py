@@ -0,0 +1,222 @@
+"""LookML serialization.
+
+LookMLWriter streams the view / explore dicts produced by the renderers
+straight into one output buffer. It follows the layout rules of
+``lkml.dump`` (lkml.simple.DictParser) exactly but skips building lkml's
+intermediate parse tree, which dominated serialization time on large
+projects. The key tables (plural, quoted and expression keys) are taken
+from lkml.keys so both serializers always agree on quoting.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import lkml
+from lkml.keys import (
+    EXPR_BLOCK_KEYS,
+    KEYS_WITH_NAME_FIELDS,
+    PLURAL_KEYS,
+    QUOTED_LITERAL_KEYS,
+    singularize,
+)
+
+# Valid values for the serializer mode flag
+SERIALIZERS = ("native", "lkml")
+
+_INDENT = "  "
+
+# What was written last at the current nesting level; drives blank lines
+_START = "start"  # beginning of the document
+_NONE = "none"  # first item inside a block or list
+_BLOCK = "block"
+_PAIR = "pair"
+_LIST = "list"
+
+
+class LookMLWriter:
+    """
+    Streaming LookML writer for dicts of views, explores and their fields.
+
+    Produces byte-for-byte the same text as ``lkml.dump``:
+
+        writer = LookMLWriter()
+        writer.dump({"views": [{"name": "orders", "sql_table_name": "..."}]})
+    """
+
+    def __init__(self) -> None:
+        self._out: list[str] = []
+        self._level = 0
+        self._latest = _START
+        self._parent_key: str | None = None
+
+    def dump(self, obj: dict[str, Any]) -> str:
+        """Serialize a LookML dict to text."""
+        self._out = []
+        self._level = 0
+        self._latest = _START
+        self._parent_key = None
+        for key, value in obj.items():
+            self._write_any(key, value)
+        return "".join(self._out)
+
+    # Whitespace -------------------------------------------------------------
+
+    def _newline_indent(self) -> str:
+        return "\n" + _INDENT * self._level
+
+    def _prefix(self) -> str:
+        if self._latest == _START:
+            return ""
+        if self._latest == _BLOCK:
+            return "\n" + self._newline_indent()
+        return self._newline_indent()
+
+    # Nodes ------------------------------------------------------------------
+
+    def _is_plural_key(self, key: str) -> bool:
+        singular_key = singularize(key)
+        return (
+            singular_key in PLURAL_KEYS
+            and not (
+                singular_key == "allowed_value"
+                and (self._parent_key or "").rstrip("s") == "access_grant"
+            )
+            and not (self._parent_key == "query" and singular_key != "filters")
+        )
+
+    def _write_any(self, key: str, value: Any) -> None:
+        if isinstance(value, str):
+            self._write_pair(key, value)
+        elif isinstance(value, (list, tuple)):
+            if self._is_plural_key(key):
+                self._expand_list(key, value)
+            else:
+                self._write_list(key, value)
+        elif isinstance(value, dict):
+            if key in KEYS_WITH_NAME_FIELDS or "name" not in value:
+                self._write_block(key, value, None)
+            else:
+                items = {k: v for k, v in value.items() if k != "name"}
+                self._write_block(key, items, value["name"])
+        else:
+            raise TypeError("Value must be a string, list, tuple, or dict.")
+
+    def _expand_list(self, key: str, values: list[Any] | tuple[Any, ...]) -> None:
+        if key != "filters":
+            singular_key = singularize(key)
+            for value in values:
+                self._write_any(singular_key, value)
+        elif "name" in values[0]:
+            # Filter-only fields: filter: name { ... }
+            for value in values:
+                items = {k: v for k, v in value.items() if k != "name"}
+                self._write_block("filter", items, value["name"])
+        elif "field" in values[0] and "value" in values[0]:
+            # Legacy syntax: filters: { field: x value: "y" }
+            for value in values:
+                self._write_block("filters", value, None)
+        else:
+            self._write_list(key, values)
+
+    def _write_block(self, key: str, items: dict[str, Any], name: Any) -> None:
+        out = self._out
+        if self._latest not in (_START, _NONE):
+            prefix = "\n" + self._newline_indent()
+        else:
+            prefix = self._prefix()
+        out.append(f"{prefix}{key}: {name} {{" if name else f"{prefix}{key}: {{")
+
+        prev_parent_key = self._parent_key
+        latest_at_this_level = self._latest
+        self._parent_key = key
+        self._latest = _NONE
+        self._level += 1
+        start = len(out)
+        for child_key, child_value in items.items():
+            self._write_any(child_key, child_value)
+        self._level -= 1
+        self._latest = latest_at_this_level
+        self._parent_key = prev_parent_key
+
+        out.append(self._newline_indent() + "}" if len(out) > start else "}")
+        self._latest = _BLOCK
+
+    def _write_list(self, key: str, values: list[Any] | tuple[Any, ...]) -> None:
+        out = self._out
+        # `suggestions` is only quoted when it's a list
+        force_quote = key == "suggestions"
+        prev_parent_key = self._parent_key
+        self._parent_key = key
+        out.append(f"{self._prefix()}{key}: [")
+
+        pair_mode = bool(values) and not isinstance(values[0], (str, int))
+        if len(values) >= 5 or pair_mode:
+            # One item per line, with a trailing comma
+            self._latest = _NONE
+            self._level += 1
+            for i, value in enumerate(values):
+                if i:
+                    out.append(",")
+                if pair_mode:
+                    [(item_key, item_value)] = value.items()
+                    self._write_pair(item_key, item_value)
+                else:
+                    out.append(self._newline_indent())
+                    out.append(_token(key, value, force_quote))
+            self._level -= 1
+            out.append("," + self._newline_indent() + "]" if values else "]")
+        else:
+            out.append(", ".join(_token(key, value, force_quote) for value in values))
+            out.append("]")
+
+        self._parent_key = prev_parent_key
+        self._latest = _LIST
+
+    def _write_pair(self, key: str, value: str) -> None:
+        force_quote = self._parent_key == "filters" and key != "field"
+        self._out.append(f"{self._prefix()}{key}: {_token(key, value, force_quote)}")
+        self._latest = _PAIR
+
+
+def _token(key: str, value: Any, force_quote: bool = False) -> str:
+    """Format a value, quoting or ;;-terminating it as the key requires."""
+    if force_quote or key in QUOTED_LITERAL_KEYS:
+        escaped = value.replace(r"\"", '"').replace('"', r"\"")
+        return f'"{escaped}"'
+    if key in EXPR_BLOCK_KEYS:
+        return f"{value.strip()} ;;"
+    return str(value)
+
+
+def dump_lookml(obj: dict[str, Any], serializer: str = "native") -> str:
+    """
+    Serialize a LookML dict to text.
+
+    Args:
+        obj: Dict such as {"views": [...]} or {"explores": [...]}
+        serializer: "native" (LookMLWriter) or "lkml" (lkml.dump)
+
+    Returns:
+        LookML text
+    """
+    if validate_serializer(serializer) == "lkml":
+        result = lkml.dump(obj)
+        assert result is not None
+        return result
+    return LookMLWriter().dump(obj)
+
+
+def validate_serializer(serializer: str) -> str:
+    """Return serializer unchanged, raising ValueError if it is unknown."""
+    if serializer not in SERIALIZERS:
+        raise ValueError(
+            f"Invalid serializer '{serializer}'. Valid: {list(SERIALIZERS)}"
+        )
+    return serializer
+
+
+def with_includes(includes: list[str], *sections: str) -> str:
+    """Prefix serialized sections with include statements."""
+    include_section = "\n".join(f'include: "{inc}"' for inc in includes)
+    return f"{include_section}\n\n" + "\n".join(sections)
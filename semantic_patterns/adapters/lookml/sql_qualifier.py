@@ -3,14 +3,20 @@
 Handles the LookML distinction between:
 - Field references: ${dimension_name} - references to defined dimensions/measures
 - SQL references: ${TABLE}.column_name - raw SQL column access
+
+Bare columns are swapped for ``exp.Var`` nodes holding the LookML
+reference, which sqlglot writes out verbatim, so the expression is
+generated in a single pass with no string rewriting afterwards.
 """
 
 import re
+from functools import cache
 
-import sqlglot
 import sqlglot.expressions as exp
+from sqlglot.dialects.dialect import Dialect as SqlglotDialect
 
 from semantic_patterns.adapters.dialect import Dialect, SqlRenderer, get_default_dialect
+from semantic_patterns.adapters.sql_cache import parse_sql
 
 
 # Map our Dialect enum to sqlglot dialect strings
@@ -31,6 +37,68 @@ def _get_sqlglot_dialect(dialect: Dialect | None) -> str:
     return SQLGLOT_DIALECT_MAP.get(dialect, "redshift")
 
 
+# Unquoted SQL identifier; anything else goes through sqlglot
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*", re.ASCII)
+
+
+@cache
+def _reserved_words(sqlglot_dialect: str) -> frozenset[str]:
+    """Words sqlglot may parse as something other than a column.
+
+    Keywords (DATE, NULL, CURRENT_DATE, USER, ...) and no-paren functions
+    (e.g. Redshift SYSDATE) - never handled by the fast path.
+    """
+    dialect = SqlglotDialect.get_or_raise(sqlglot_dialect)
+    return frozenset(
+        word.upper()
+        for word in [
+            *dialect.tokenizer_class.KEYWORDS,
+            *dialect.parser_class.NO_PAREN_FUNCTION_PARSERS,
+        ]
+    )
+
+
+def _simple_reference(expr: str, sqlglot_dialect: str) -> tuple[str, str] | None:
+    """
+    Split a bare ``column`` or ``table.column`` reference without parsing.
+
+    Returns:
+        Tuple of (table, column) with table "" for a bare column, or None
+        if expr is anything more complex
+    """
+    parts = expr.strip().split(".")
+    if len(parts) > 2:
+        return None
+    reserved = _reserved_words(sqlglot_dialect)
+    for part in parts:
+        if not _IDENTIFIER.fullmatch(part) or part.upper() in reserved:
+            return None
+    if len(parts) == 1:
+        return "", parts[0]
+    return parts[0], parts[1]
+
+
+def _to_lookml(
+    parsed: exp.Expression, sqlglot_dialect: str, fields: dict[str, str]
+) -> str:
+    """Generate SQL with bare columns written as ${field} or ${TABLE}.col."""
+
+    def to_reference(node: exp.Expression) -> exp.Expression:
+        if not isinstance(node, exp.Column) or node.table:
+            return node
+        if node.name in fields:
+            return exp.Var(this=f"${{{fields[node.name]}}}")
+        # Keep quotes the author wrote ("My Col"); never add new ones
+        identifier = node.this
+        if isinstance(identifier, exp.Identifier) and identifier.quoted:
+            column = identifier.sql(dialect=sqlglot_dialect)
+        else:
+            column = node.name
+        return exp.Var(this=f"${{TABLE}}.{column}")
+
+    return parsed.transform(to_reference, copy=False).sql(dialect=sqlglot_dialect)
+
+
 def qualify_table_columns(expr: str, dialect: Dialect | None = None) -> str:
     """
     Simple helper to qualify bare columns with ${TABLE}.
@@ -52,25 +120,22 @@ def qualify_table_columns(expr: str, dialect: Dialect | None = None) -> str:
 
     sqlglot_dialect = _get_sqlglot_dialect(dialect)
 
+    # Fast path: plain column references need no parse
+    simple = _simple_reference(expr, sqlglot_dialect)
+    if simple is not None:
+        ref_table, ref_column = simple
+        if ref_table:
+            return f"{ref_table}.{ref_column}"
+        return f"${{TABLE}}.{ref_column}"
+
     try:
-        parsed = sqlglot.parse_one(expr, dialect=sqlglot_dialect)
+        parsed = parse_sql(expr, sqlglot_dialect)
     except Exception:
         return expr
 
-    # Add ${TABLE} to bare columns
-    for column in parsed.find_all(exp.Column):
-        if column.table is None or column.table == "":
-            column.set("table", exp.to_identifier("__LOOKML_TABLE__"))
-
-    # Output SQL in the same dialect to preserve function syntax
-    result = parsed.sql(dialect=sqlglot_dialect)
-
-    # Replace marker with ${TABLE}
-    result = re.sub(r'"?__LOOKML_TABLE__"?\."?(\w+)"?', r'${TABLE}.\1', result)
-    result = re.sub(r"'?__LOOKML_TABLE__'?\.'?(\w+)'?", r'${TABLE}.\1', result)
-    result = re.sub(r'`?__LOOKML_TABLE__`?\.`?(\w+)`?', r'${TABLE}.\1', result)
-
-    return result
+    # Add ${TABLE} to bare columns, output in the same dialect to preserve
+    # function syntax
+    return _to_lookml(parsed, sqlglot_dialect, {})
 
 
 class LookMLSqlQualifier:
@@ -117,40 +182,24 @@ class LookMLSqlQualifier:
 
         fields = defined_fields if defined_fields is not None else self.defined_fields
 
+        # Fast path: plain column references need no parse
+        simple = _simple_reference(expr, self._sqlglot_dialect)
+        if simple is not None:
+            ref_table, ref_column = simple
+            if ref_table:
+                return f"{ref_table}.{ref_column}"
+            if ref_column in fields:
+                return f"${{{fields[ref_column]}}}"
+            return f"${{TABLE}}.{ref_column}"
+
         # Parse expression with dialect awareness
         # This ensures date function keywords (day, month, year) are recognized
         # as date parts rather than column references
         try:
-            parsed = sqlglot.parse_one(expr, dialect=self._sqlglot_dialect)
+            parsed = parse_sql(expr, self._sqlglot_dialect)
         except Exception:
             # If parsing fails, return original
             return expr
 
-        # Find all column references without table qualifiers
-        for column in parsed.find_all(exp.Column):
-            if column.table is None or column.table == "":
-                column_name = column.name
-
-                if column_name in fields:
-                    # Mark for field reference replacement
-                    column.set("table", exp.to_identifier("__LOOKML_FIELD__"))
-                    column.set("this", exp.to_identifier(fields[column_name]))
-                else:
-                    # Mark for ${TABLE} replacement
-                    column.set("table", exp.to_identifier("__LOOKML_TABLE__"))
-
-        # Get SQL output in the same dialect to preserve function syntax
-        result = parsed.sql(dialect=self._sqlglot_dialect)
-
-        # Replace markers with LookML syntax
-        # Field references: __LOOKML_FIELD__.field_name → ${field_name}
-        result = re.sub(r'"?__LOOKML_FIELD__"?\."?(\w+)"?', r'${\1}', result)
-        result = re.sub(r"'?__LOOKML_FIELD__'?\.'?(\w+)'?", r'${\1}', result)
-        result = re.sub(r'`?__LOOKML_FIELD__`?\.`?(\w+)`?', r'${\1}', result)
-
-        # Table references: __LOOKML_TABLE__.column_name → ${TABLE}.column_name
-        result = re.sub(r'"?__LOOKML_TABLE__"?\."?(\w+)"?', r'${TABLE}.\1', result)
-        result = re.sub(r"'?__LOOKML_TABLE__'?\.'?(\w+)'?", r'${TABLE}.\1', result)
-        result = re.sub(r'`?__LOOKML_TABLE__`?\.`?(\w+)`?', r'${TABLE}.\1', result)
-
-        return result
+        # Columns defined as fields become ${field}, the rest ${TABLE}.column
+        return _to_lookml(parsed, self._sqlglot_dialect, fields)
@@ -55,6 +55,8 @@ class ExploreConfig(BaseModel):
     joins: list[ExploreJoinConfig] = Field(default_factory=list)
     join_exclusions: list[str] = Field(default_factory=list)
     joined_facts: list[str] = Field(default_factory=list)
+    # Max many-to-one hops for auto-joins (1 = only the fact's own foreign keys)
+    join_depth: int = Field(default=1, ge=1)
 
     model_config = {"frozen": True}
 
@@ -93,6 +95,7 @@ class InferredJoin(BaseModel):
     expose: ExposeLevel
     fact_entity_name: str  # Dimension name on fact side (e.g., "facility")
     joined_entity_name: str  # Dimension name on joined side (e.g., "facility")
+    from_model: str | None = None  # Joined view the join hangs off (None = fact)
 
     model_config = {"frozen": True}
 
@@ -0,0 +1,111 @@
+"""Shared memoized sqlglot parsing.
+
+The same dimension, entity and measure expressions are parsed several
+times per model (base view, defined-field lookup, measures, filters).
+parse_sql keeps a bounded LRU of parsed ASTs keyed on (expression,
+dialect) and hands out copies, so callers can mutate the result freely.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import cast
+
+import sqlglot
+import sqlglot.expressions as exp
+
+# Distinct expressions kept; comfortably above a large project's field count
+DEFAULT_MAXSIZE = 4096
+
+
+class SqlParseCache:
+    """
+    Bounded LRU cache of sqlglot ASTs.
+
+    Parse failures are cached too, so a bad expression is only parsed once
+    and re-raises the same error on later lookups.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], exp.Expression | Exception] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def parse(self, expr: str, dialect: str = "") -> exp.Expression:
+        """Parse expr, returning a copy of the cached AST.
+
+        Raises:
+            sqlglot.errors.ParseError: If the expression cannot be parsed
+        """
+        key = (expr, dialect)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if cached is None:
+            try:
+                cached = cast(
+                    exp.Expression, sqlglot.parse_one(expr, dialect=dialect or None)
+                )
+            except Exception as e:
+                cached = e
+            with self._lock:
+                self._entries[key] = cached
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        if isinstance(cached, Exception):
+            raise cached.with_traceback(None)
+        return cached.copy()
+
+    def add_counts(self, hits: int, misses: int) -> None:
+        """Fold in lookups made by another process's cache (render workers)."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of parses served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_cache = SqlParseCache()
+
+
+def parse_sql(expr: str, dialect: str = "") -> exp.Expression:
+    """Parse a SQL expression through the shared cache.
+
+    Args:
+        expr: SQL expression
+        dialect: sqlglot dialect name ("" for sqlglot's default)
+
+    Returns:
+        A fresh copy of the parsed AST
+    """
+    return _cache.parse(expr, dialect)
+
+
+def get_sql_parse_cache() -> SqlParseCache:
+    """The process-wide cache used by parse_sql (for stats)."""
+    return _cache
@@ -22,6 +22,7 @@ export interface ExploreConfig {
   description?: string
   join_exclusions: string[]
   joined_facts: string[]
+  join_depth: number
 }
 
 export interface LookerConfig {
@@ -33,13 +34,15 @@ export interface LookerConfig {
   path: string
   protected_branches: string[]
   commit_message: string
+  large_push_threshold: number
+  blob_workers: number
   base_url: string
   project_id: string
   sync_dev: boolean
 }
 
 export interface OutputOptionsConfig {
-  clean?: string
+  clean?: 'clean' | 'warn' | 'ignore' | null
   manifest: boolean
 }
 
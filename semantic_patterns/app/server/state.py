@@ -6,10 +6,8 @@ from typing import Any
 from pydantic import BaseModel
 
 from semantic_patterns.config import SPConfig, find_config, load_config
-from semantic_patterns.domain import ProcessedModel
-from semantic_patterns.ingestion.builder import DomainBuilder
-from semantic_patterns.ingestion.dbt.loader import DbtLoader
-from semantic_patterns.ingestion.dbt.mapper import DbtMapper
+from semantic_patterns.core.builder import load_models, open_parse_cache
+from semantic_patterns.domain import EntityGraph, ProcessedModel
 
 
 class ServerState(BaseModel):
@@ -18,6 +16,8 @@ class ServerState(BaseModel):
     config_path: Path | None = None
     config: SPConfig | None = None
     models: list[ProcessedModel] = []
+    # Index of loaded models by name and entity (None until loaded)
+    entity_graph: EntityGraph | None = None
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -39,33 +39,9 @@ class ServerState(BaseModel):
         if not input_path.is_absolute():
             input_path = config_path.parent / input_path
 
-        # Load models based on format
-        if self.config.format == "dbt":
-            self.models = self._load_dbt_models(input_path)
-        else:
-            self.models = self._load_native_models(input_path)
-
-    def _load_native_models(self, input_path: Path) -> list[ProcessedModel]:
-        """Load semantic-patterns native format."""
-        return DomainBuilder.from_directory(input_path)
-
-    def _load_dbt_models(self, input_path: Path) -> list[ProcessedModel]:
-        """Load dbt semantic layer format."""
-        loader = DbtLoader(input_path)
-        semantic_models, metrics = loader.load_all()
-
-        # Map dbt format to our format
-        mapper = DbtMapper()
-        mapper.add_semantic_models(semantic_models)
-        mapper.add_metrics(metrics)
-        documents = mapper.get_documents()
-
-        # Build domain models from mapped documents
-        builder = DomainBuilder()
-        for doc in documents:
-            builder.add_document(doc)
-
-        return builder.build()
+        parse_cache = open_parse_cache(self.config, base_dir=config_path.parent)
+        self.models = load_models(self.config, input_path, parse_cache=parse_cache)
+        self.entity_graph = EntityGraph(self.models)
 
     def reload(self) -> None:
         """Reload from current config path."""
@@ -74,10 +50,9 @@ class ServerState(BaseModel):
 
     def get_model(self, name: str) -> ProcessedModel | None:
         """Get a model by name."""
-        for model in self.models:
-            if model.name == name:
-                return model
-        return None
+        if self.entity_graph is None:
+            return None
+        return self.entity_graph.models.get(name)
 
     def get_stats(self) -> dict[str, Any]:
         """Get summary statistics."""
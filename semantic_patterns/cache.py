@@ -0,0 +1,216 @@
+"""Persistent on-disk cache with LRU size cap.
+
+Entries are pickled under ``<root>/<namespace>/`` and tracked by a small
+JSON index recording each entry's size and last use. When the namespace
+grows past ``max_bytes`` the least recently used entries are evicted.
+
+The cache is a pure optimization: unreadable or corrupt entries are
+treated as misses, and write failures are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_DIR = ".sp-cache"
+
+# Bump to invalidate every existing cache entry after a format change
+CACHE_FORMAT_VERSION = 1
+
+_INDEX_FILE = "index.json"
+
+
+def cache_key(*parts: str) -> str:
+    """Build a stable cache key from string parts."""
+    digest = hashlib.sha256()
+    digest.update(str(CACHE_FORMAT_VERSION).encode())
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Pickle-backed key/value store with LRU eviction.
+
+    Usage:
+        cache = DiskCache(Path(".sp-cache"), "parse", max_bytes=64 * 1024 * 1024)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.put(key, value)
+        cache.save()  # persist LRU index, evicting if over the cap
+    """
+
+    def __init__(self, root: Path, namespace: str, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self.directory = self.root / namespace
+        self.hits = 0
+        self.misses = 0
+        self._index: dict[str, dict[str, float]] = self._load_index()
+        self._dirty = False
+
+    def _load_index(self) -> dict[str, dict[str, float]]:
+        """Load the LRU index, starting fresh if it is missing or corrupt."""
+        try:
+            data = json.loads((self.directory / _INDEX_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def _read(self, key: str) -> bytes:
+        return self._entry_path(key).read_bytes()
+
+    def _write(self, key: str, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self._entry_path(key), data)
+
+    def _delete(self, key: str) -> None:
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def _persist_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write(
+            self.directory / _INDEX_FILE,
+            json.dumps(self._index, sort_keys=True).encode(),
+        )
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None on a miss."""
+        if key not in self._index:
+            self.misses += 1
+            return None
+        try:
+            value = pickle.loads(self._read(key))
+        except Exception:
+            # Missing or corrupt entry - drop it and treat as a miss
+            self._index.pop(key, None)
+            self._dirty = True
+            self.misses += 1
+            return None
+
+        self._index[key]["used"] = time.time()
+        self._dirty = True
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key (written atomically)."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write(key, data)
+        except Exception:
+            return
+        self._index[key] = {"size": len(data), "used": time.time()}
+        self._dirty = True
+
+    def discard(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        if self._index.pop(key, None) is not None:
+            self._delete(key)
+            self._dirty = True
+
+    @property
+    def size(self) -> int:
+        """Total bytes of all entries in this namespace."""
+        return int(sum(entry["size"] for entry in self._index.values()))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def evict(self) -> int:
+        """Evict least recently used entries until under max_bytes.
+
+        Returns:
+            Number of entries evicted
+        """
+        total = self.size
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        for key, entry in sorted(self._index.items(), key=lambda kv: kv[1]["used"]):
+            if total <= self.max_bytes:
+                break
+            self._delete(key)
+            del self._index[key]
+            total -= int(entry["size"])
+            evicted += 1
+
+        self._dirty = True
+        return evicted
+
+    def save(self) -> None:
+        """Evict over-cap entries and persist the LRU index."""
+        if not self._dirty:
+            return
+        self.evict()
+        try:
+            self._persist_index()
+        except OSError:
+            return
+        self._dirty = False
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryCache(DiskCache):
+    """
+    In-process variant of DiskCache for long-running commands.
+
+    Values are still stored pickled, so callers get a fresh copy from
+    every get() exactly as with the on-disk cache.
+    """
+
+    def __init__(self, namespace: str, max_bytes: int) -> None:
+        self._entries: dict[str, bytes] = {}
+        super().__init__(Path(), namespace, max_bytes)
+
+    def _load_index(self) -> dict[str, dict[str, float]]:
+        return {}
+
+    def _read(self, key: str) -> bytes:
+        return self._entries[key]
+
+    def _write(self, key: str, data: bytes) -> None:
+        self._entries[key] = data
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def _persist_index(self) -> None:
+        pass
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path via a temp file and rename."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -57,5 +57,15 @@ def clear(service: str, force: bool) -> None:
         else:
             console.print(f"[dim]\u25cb[/dim] {label} was not set")
 
+    # Cached access tokens belong to the cleared credentials
+    if service == "looker" or service == "all":
+        from semantic_patterns.credentials import TokenCache
+        from semantic_patterns.destinations.looker.client import (
+            LOOKER_TOKEN_KEY_PREFIX,
+        )
+
+        if TokenCache().delete(LOOKER_TOKEN_KEY_PREFIX):
+            console.print("[green]\u2713[/green] Cleared cached Looker tokens")
+
     console.print()
     console.print("[dim]Run 'sp build' to re-authenticate[/dim]")
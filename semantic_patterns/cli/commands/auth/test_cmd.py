@@ -120,7 +120,10 @@ def test(service: str, debug: bool) -> None:
 
     elif service == "looker":
         # Load config to get base_url
-        from semantic_patterns.destinations.looker.client import _get_http_client
+        from semantic_patterns.destinations.looker.client import (
+            LookerClient,
+            _get_http_client,
+        )
 
         try:
             client_id = store.get("looker-client-id", prompt_if_missing=False)
@@ -144,7 +147,9 @@ def test(service: str, debug: bool) -> None:
             config = load_config(config_path) if config_path else None
 
             if not config or not config.looker.base_url:
-                console.print("[yellow]\u26a0[/yellow] Credentials found but not tested")
+                console.print(
+                    "[yellow]\u26a0[/yellow] Credentials found but not tested"
+                )
                 console.print(
                     "[dim]Cannot test without looker.base_url in sp.yml[/dim]"
                 )
@@ -159,7 +164,8 @@ def test(service: str, debug: bool) -> None:
             console.print(f"Testing Looker credentials for {config.looker.base_url}...")
 
             with _get_http_client() as client:
-                # Attempt login
+                # Always log in (never reuse a cached token) so the secret
+                # itself is tested
                 response = client.post(
                     f"{config.looker.base_url}/api/4.0/login",
                     data={
@@ -188,7 +194,10 @@ def test(service: str, debug: bool) -> None:
                     return
 
                 data = response.json()
-                access_token = data.get("access_token")
+                # Later pushes can reuse the fresh token
+                access_token = LookerClient(config.looker, console).cache_access_token(
+                    client_id, client_secret, data
+                )
 
                 console.print("[green]\u2713[/green] Authentication successful")
 
@@ -229,9 +238,7 @@ def test(service: str, debug: bool) -> None:
                     "  • SSL issue detected - try: [bold]LOOKER_HTTPS_VERIFY=false sp auth test looker[/bold]"
                 )
             else:
-                console.print(
-                    "  • Check network/firewall settings"
-                )
+                console.print("  • Check network/firewall settings")
                 console.print(
                     "  • Try with proxy: [bold]HTTPS_PROXY=http://proxy:port sp auth test looker[/bold]"
                 )
@@ -11,10 +11,16 @@ from pydantic import ValidationError
 from rich.console import Console
 
 from semantic_patterns.cli import RichCommand
-from semantic_patterns.cli.utils import build_file_tree
+from semantic_patterns.cli.utils import (
+    apply_input_overrides,
+    apply_output_overrides,
+    build_file_tree,
+)
 from semantic_patterns.config import find_config, load_config
 from semantic_patterns.core.builder import run_build
 from semantic_patterns.core.looker_push import handle_looker_push
+from semantic_patterns.core.watch import Watcher
+from semantic_patterns.core.writer import OutputWriteError
 
 console = Console()
 
@@ -47,12 +53,46 @@ console = Console()
     is_flag=True,
     help="Push to Looker without confirmation (when looker.enabled=true)",
 )
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Processes used to parse YAML files (overrides input_options.workers)",
+)
+@click.option(
+    "--render-workers",
+    type=click.IntRange(min=1),
+    help="Processes used to render view files "
+    "(overrides output_options.render_workers)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse every input file, ignoring the .sp-cache/ parse cache",
+)
+@click.option(
+    "--incremental/--full",
+    default=None,
+    help="Re-render only models whose sources changed, or force a full build "
+    "(overrides output_options.incremental)",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    help="Keep running and rebuild affected files when input files change",
+)
 def build(
     config: Path | None,
     dry_run: bool,
     verbose: bool,
     debug: bool,
     push: bool,
+    workers: int | None,
+    render_workers: int | None,
+    no_cache: bool,
+    incremental: bool | None,
+    watch: bool,
 ) -> None:
     """Generate LookML from semantic models.
 
@@ -79,6 +119,21 @@ def build(
         # Build and push to Looker (skip confirmation)
         sp build --push
 
+        # Parse YAML files with 8 worker processes
+        sp build --workers 8
+
+        # Render view files with 4 worker processes
+        sp build --render-workers 4
+
+        # Only re-render models whose source files changed
+        sp build --incremental
+
+        # Rebuild on every save during development
+        sp build --watch
+
+        # Rebuild and push to Looker on every save
+        sp build --watch --push
+
         # Show full stacktraces for debugging
         sp build --debug
     """
@@ -120,6 +175,11 @@ explores:
         console.print(f"[red]Config validation error:[/red] {e}")
         raise click.ClickException(str(e))
 
+    cfg = apply_input_overrides(cfg, workers=workers, no_cache=no_cache)
+    cfg = apply_output_overrides(
+        cfg, incremental=incremental, render_workers=render_workers
+    )
+
     console.print()
     console.print("[bold]semantic-patterns[/bold]", highlight=False)
     console.print()
@@ -131,6 +191,25 @@ explores:
 
     # Run build
     try:
+        if watch:
+            watcher = Watcher(
+                cfg, dry_run=dry_run, verbose=verbose, push=push, debug=debug
+            )
+            stats, elapsed = watcher.build()
+            console.print(
+                f"\n[bold green]Built {stats.files} files in {elapsed:.2f}s"
+                f"[/bold green]"
+            )
+            watcher.push()
+            console.print(
+                f"[dim]Watching {cfg.input_path} for changes (Ctrl+C to stop)[/dim]"
+            )
+            try:
+                watcher.run()
+            except KeyboardInterrupt:
+                console.print("\n[dim]Stopped watching[/dim]")
+            return
+
         files, stats, project_path, all_files = run_build(
             cfg, dry_run=dry_run, verbose=verbose
         )
@@ -142,6 +221,16 @@ explores:
             f"[dim]({stats.dimensions} dims, {stats.measures} measures, "
             f"{stats.metrics} metrics, {stats.explores} explores)[/dim]"
         )
+        if stats.reused:
+            console.print(
+                f"[dim]Reused {stats.reused} unchanged files from the previous "
+                f"build[/dim]"
+            )
+        if not dry_run:
+            console.print(
+                f"[dim]{stats.written} written, {stats.unchanged} unchanged, "
+                f"{stats.deleted} deleted[/dim]"
+            )
 
         # Show file tree in verbose/dry-run mode
         if verbose or dry_run:
@@ -151,8 +240,25 @@ explores:
 
         # Looker push/sync if enabled
         if cfg.looker.enabled:
-            handle_looker_push(cfg, all_files, push=push, dry_run=dry_run, debug=debug)
+            # Orphans removed locally are removed from the repo too
+            deleted = None
+            if cfg.output_options.clean == "clean":
+                deleted = [project_path / rel_path for rel_path in stats.orphaned]
+            handle_looker_push(
+                cfg,
+                all_files,
+                push=push,
+                dry_run=dry_run,
+                debug=debug,
+                deleted=deleted,
+                verbose=verbose,
+            )
 
+    except OutputWriteError as e:
+        if debug:
+            console.print(traceback.format_exc())
+        console.print(f"[red]Write failed:[/red] {e}")
+        raise click.ClickException(str(e))
     except FileNotFoundError as e:
         if debug:
             console.print(traceback.format_exc())
@@ -11,7 +11,9 @@ from pydantic import ValidationError
 from rich.console import Console
 
 from semantic_patterns.cli import RichCommand
+from semantic_patterns.cli.utils import apply_input_overrides
 from semantic_patterns.config import find_config, load_config
+from semantic_patterns.core.builder import load_models, open_parse_cache
 
 console = Console()
 
@@ -28,7 +30,23 @@ console = Console()
     is_flag=True,
     help="Show full exception stacktraces for troubleshooting",
 )
-def validate(config: Path | None, debug: bool) -> None:
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Processes used to parse YAML files (overrides input_options.workers)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse every input file, ignoring the .sp-cache/ parse cache",
+)
+def validate(
+    config: Path | None,
+    debug: bool,
+    workers: int | None,
+    no_cache: bool,
+) -> None:
     """Validate configuration and semantic models.
 
     Checks that:
@@ -80,6 +98,8 @@ def validate(config: Path | None, debug: bool) -> None:
         console.print(f"[red]Config validation error:[/red] {e}")
         raise click.ClickException(str(e))
 
+    cfg = apply_input_overrides(cfg, workers=workers, no_cache=no_cache)
+
     # Check input directory
     if not cfg.input_path.exists():
         console.print(f"[red]Input directory not found:[/red] {cfg.input_path}")
@@ -88,25 +108,7 @@ def validate(config: Path | None, debug: bool) -> None:
 
     # Parse models
     try:
-        from semantic_patterns.ingestion import DbtLoader, DbtMapper, DomainBuilder
-
-        if cfg.format == "dbt":
-            # Load dbt format
-            dbt_loader = DbtLoader(cfg.input_path)
-            semantic_models, metrics = dbt_loader.load_all()
-
-            # Map and build
-            mapper = DbtMapper()
-            mapper.add_semantic_models(semantic_models)
-            mapper.add_metrics(metrics)
-            documents = mapper.get_documents()
-
-            builder = DomainBuilder()
-            for doc in documents:
-                builder.add_document(doc)
-            models = builder.build()
-        else:
-            models = DomainBuilder.from_directory(cfg.input_path)
+        models = load_models(cfg, parse_cache=open_parse_cache(cfg))
 
         console.print(f"[green]Models valid:[/green] {len(models)} models")
 
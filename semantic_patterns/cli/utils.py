@@ -3,9 +3,73 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.tree import Tree
 
+if TYPE_CHECKING:
+    from semantic_patterns.config import SPConfig
+
+
+def apply_input_overrides(
+    config: SPConfig,
+    *,
+    workers: int | None = None,
+    no_cache: bool = False,
+) -> SPConfig:
+    """Apply CLI overrides to the config's input options.
+
+    Args:
+        config: Parsed SPConfig
+        workers: Parse worker count from --workers (None keeps config value)
+        no_cache: Disable the parse cache (--no-cache)
+
+    Returns:
+        Config with overrides applied (the original if nothing changed)
+    """
+    updates: dict[str, object] = {}
+    if workers is not None:
+        updates["workers"] = workers
+    if no_cache:
+        updates["cache"] = False
+
+    if not updates:
+        return config
+
+    input_options = config.input_options.model_copy(update=updates)
+    return config.model_copy(update={"input_options": input_options})
+
+
+def apply_output_overrides(
+    config: SPConfig,
+    *,
+    incremental: bool | None = None,
+    render_workers: int | None = None,
+) -> SPConfig:
+    """Apply CLI overrides to the config's output options.
+
+    Args:
+        config: Parsed SPConfig
+        incremental: Incremental build mode from --incremental/--full
+            (None keeps config value)
+        render_workers: Render worker count from --render-workers
+            (None keeps config value)
+
+    Returns:
+        Config with overrides applied (the original if nothing changed)
+    """
+    updates: dict[str, object] = {}
+    if incremental is not None:
+        updates["incremental"] = incremental
+    if render_workers is not None:
+        updates["render_workers"] = render_workers
+
+    if not updates:
+        return config
+
+    output_options = config.output_options.model_copy(update=updates)
+    return config.model_copy(update={"output_options": output_options})
+
 
 def build_file_tree(files: list[Path], project_path: Path) -> Tree:
     """Build a Rich Tree from generated file paths.
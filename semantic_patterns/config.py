@@ -14,14 +14,35 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from typing_extensions import Self
 
 from semantic_patterns.adapters.dialect import Dialect
+from semantic_patterns.adapters.lookml.serializer import validate_serializer
 from semantic_patterns.adapters.lookml.types import ExploreConfig
+from semantic_patterns.prompts import CleanMode
+
+
+class InputOptionsConfig(BaseModel):
+    """Input loading configuration."""
+
+    workers: int = Field(default=1, ge=1)  # Processes used to parse YAML files
+    cache: bool = True  # Reuse parsed YAML for unchanged files across runs
+    cache_dir: str = ".sp-cache"  # Cache location (relative to working directory)
+    cache_max_mb: int = Field(default=256, ge=1)  # LRU size cap for the cache
+    ignore: list[str] = Field(default_factory=list)  # Extra paths to skip (.spignore)
+
+    model_config = {"frozen": True}
 
 
 class OutputOptionsConfig(BaseModel):
     """Output options configuration."""
 
-    clean: str | None = None  # "clean", "warn", or "ignore" - None prompts on first run
+    clean: CleanMode | None = None  # Orphan handling; None (unset) means "warn"
     manifest: bool = True  # Generate .sp-manifest.json
+    incremental: bool = False  # Re-render only models whose sources changed
+    render_workers: int = Field(default=1, ge=1)  # Processes used to render views
+    render_chunksize: int | None = Field(default=None, ge=1)  # Models per worker task
+    render_cache: bool = True  # Reuse rendered views for unchanged models
+    streaming: bool = False  # Write files as rendered, keeping only their hashes
+    write_workers: int = Field(default=1, ge=1)  # Threads used to write files
+    fsync: bool = False  # Flush written files and their folders to disk
 
     model_config = {"frozen": True}
 
@@ -51,6 +72,7 @@ class OptionsConfig(BaseModel):
 
     dialect: Dialect = Dialect.REDSHIFT
     pop_strategy: str = "dynamic"  # "dynamic" or "native"
+    serializer: str = "native"  # "native" or "lkml"
     date_selector: bool = True
     convert_tz: bool = False  # Convert time dimensions to UTC
     view_prefix: str = ""  # Prefix for view names
@@ -79,6 +101,12 @@ class OptionsConfig(BaseModel):
         # If not Dialect or str, try to convert - will fail if invalid
         return Dialect(v)
 
+    @field_validator("serializer")
+    @classmethod
+    def check_serializer(cls, v: str) -> str:
+        """Validate the LookML serializer name."""
+        return validate_serializer(v)
+
 
 class LookerConfig(BaseModel):
     """Looker destination configuration.
@@ -124,6 +152,9 @@ class LookerConfig(BaseModel):
     path: str = ""  # Path within repo (default: repo root)
     protected_branches: list[str] = Field(default_factory=list)
     commit_message: str = "semantic-patterns: Update LookML"
+    # Upload files as separate blobs once a push changes more than this
+    large_push_threshold: int = Field(default=100, ge=0)
+    blob_workers: int = Field(default=8, ge=1)  # Concurrent blob uploads
 
     # Looker instance settings (optional - for dev environment sync)
     base_url: str = ""  # e.g., https://mycompany.looker.com
@@ -231,6 +262,11 @@ class SPConfig(BaseModel):
           dialect: redshift
           view_prefix: sm_
 
+        input_options:
+          workers: 4  # parse YAML files in parallel
+          cache: true  # reuse parsed files from .sp-cache/
+          ignore: [archive/]  # skipped when searching for YAML files
+
         output_options:
           clean: clean  # or 'warn' or 'ignore'
           manifest: true
@@ -265,6 +301,7 @@ class SPConfig(BaseModel):
     project: str = "semantic-patterns"  # Project name (names output folder)
 
     options: OptionsConfig = Field(default_factory=OptionsConfig)
+    input_options: InputOptionsConfig = Field(default_factory=InputOptionsConfig)
     output_options: OutputOptionsConfig = Field(default_factory=OutputOptionsConfig)
     looker: LookerConfig = Field(default_factory=LookerConfig)
 
@@ -7,6 +7,9 @@ allowing programmatic access to the build process.
 from semantic_patterns.core.builder import (
     BuildStatistics,
     generate_model_file_content,
+    load_models,
+    open_parse_cache,
+    open_render_cache,
     run_build,
 )
 from semantic_patterns.core.looker_push import handle_looker_push
@@ -15,5 +18,8 @@ __all__ = [
     "BuildStatistics",
     "generate_model_file_content",
     "handle_looker_push",
+    "load_models",
+    "open_parse_cache",
+    "open_render_cache",
     "run_build",
 ]
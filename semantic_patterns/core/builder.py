@@ -6,7 +6,7 @@ for generating LookML from semantic models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,8 +14,14 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from semantic_patterns.adapters.lookml.cache import RenderCache
     from semantic_patterns.adapters.lookml.paths import OutputPaths
     from semantic_patterns.config import SPConfig
+    from semantic_patterns.core.incremental import BuildSession
+    from semantic_patterns.domain import ProcessedModel
+    from semantic_patterns.ingestion.cache import ParseCache
 
 # Module-level console for output
 console = Console()
@@ -30,18 +36,25 @@ class BuildStatistics:
     metrics: int = 0
     explores: int = 0
     files: int = 0
+    reused: int = 0  # Files carried over unchanged by an incremental build
+    written: int = 0  # Files whose content changed and were written
+    unchanged: int = 0  # Files already on disk with the same content
+    deleted: int = 0  # Previously generated files removed
+    # Files from the previous build that are no longer generated (relative
+    # to the project path); removed when output_options.clean is "clean"
+    orphaned: list[str] = field(default_factory=list)
 
 
 def generate_model_file_content(
     config: SPConfig,
-    all_files: dict[Path, str],
+    all_files: Mapping[Path, str],
     paths: OutputPaths,
 ) -> str:
     """Generate the .model.lkml file content with domain-structured includes.
 
     Args:
         config: Parsed SPConfig with model settings
-        all_files: Dictionary of file paths to content
+        all_files: Generated files keyed by path (only the paths are used)
         paths: Output paths helper for relative path calculation
 
     Returns:
@@ -72,21 +85,152 @@ def generate_model_file_content(
     return "\n".join(lines)
 
 
+def open_parse_cache(
+    config: SPConfig,
+    base_dir: Path | None = None,
+) -> ParseCache | None:
+    """Open the persistent parse cache configured in input_options.
+
+    Args:
+        config: Parsed SPConfig
+        base_dir: Directory a relative cache_dir is resolved against
+            (defaults to the working directory)
+
+    Returns:
+        ParseCache, or None if caching is disabled
+    """
+    from semantic_patterns.ingestion.cache import ParseCache
+
+    options = config.input_options
+    if not options.cache:
+        return None
+
+    cache_dir = Path(options.cache_dir)
+    if base_dir is not None and not cache_dir.is_absolute():
+        cache_dir = base_dir / cache_dir
+    return ParseCache.open(cache_dir, options.cache_max_mb)
+
+
+def open_render_cache(
+    config: SPConfig,
+    base_dir: Path | None = None,
+) -> RenderCache | None:
+    """Open the persistent render cache.
+
+    Stored next to the parse cache; disabled by output_options.render_cache
+    or whenever the parse cache is off (e.g. ``--no-cache``).
+
+    Args:
+        config: Parsed SPConfig
+        base_dir: Directory a relative cache_dir is resolved against
+            (defaults to the working directory)
+
+    Returns:
+        RenderCache, or None if caching is disabled
+    """
+    from semantic_patterns.adapters.lookml.cache import RenderCache
+
+    options = config.input_options
+    if not options.cache or not config.output_options.render_cache:
+        return None
+
+    cache_dir = Path(options.cache_dir)
+    if base_dir is not None and not cache_dir.is_absolute():
+        cache_dir = base_dir / cache_dir
+    return RenderCache.open(
+        cache_dir, options.cache_max_mb, config.options.model_dump_json()
+    )
+
+
+def input_ignore_patterns(config: SPConfig, input_path: Path) -> list[str]:
+    """Ignore patterns for input discovery from config.
+
+    Adds the output directory when it sits inside the input directory, so
+    generated files are never read back as input.
+    """
+    patterns = list(config.input_options.ignore)
+    try:
+        output = config.output_path.resolve().relative_to(input_path.resolve())
+    except ValueError:
+        return patterns
+    if output.parts:
+        patterns.append(f"/{output.as_posix()}/")
+    return patterns
+
+
+def load_models(
+    config: SPConfig,
+    input_path: Path | None = None,
+    parse_cache: ParseCache | None = None,
+) -> list[ProcessedModel]:
+    """Load and build domain models from the configured input directory.
+
+    Handles both the native semantic-patterns format and dbt format, using
+    the parse settings from ``config.input_options``. For dbt, the input
+    may also point at a compiled ``semantic_manifest.json``.
+
+    Args:
+        config: Parsed SPConfig
+        input_path: Override for config.input_path (e.g. resolved relative
+            to the config file)
+        parse_cache: Persistent parse cache (see open_parse_cache)
+
+    Returns:
+        List of ProcessedModel
+    """
+    from semantic_patterns.ingestion import (
+        DbtLoader,
+        DbtMapper,
+        DomainBuilder,
+        SemanticManifestLoader,
+    )
+
+    path = input_path if input_path is not None else config.input_path
+    workers = config.input_options.workers
+    ignore = input_ignore_patterns(config, path)
+
+    if config.format == "dbt":
+        # Load dbt format and transform to our format
+        if path.suffix == ".json":
+            # Compiled target/semantic_manifest.json - no YAML to walk
+            semantic_models, metrics = SemanticManifestLoader(path).load_all()
+        else:
+            dbt_loader = DbtLoader(
+                path, workers=workers, cache=parse_cache, ignore=ignore
+            )
+            semantic_models, metrics = dbt_loader.load_all()
+
+        # Map dbt format to our format
+        mapper = DbtMapper()
+        mapper.add_semantic_models(semantic_models)
+        mapper.add_metrics(metrics)
+        return DomainBuilder.from_documents(mapper.get_documents())
+
+    # Use native semantic-patterns format
+    return DomainBuilder.from_directory(
+        path, workers=workers, cache=parse_cache, ignore=ignore
+    )
+
+
 def run_build(
     config: SPConfig,
     dry_run: bool = False,
     verbose: bool = False,
-) -> tuple[list[Path], BuildStatistics, Path, dict[Path, str]]:
+    session: BuildSession | None = None,
+) -> tuple[list[Path], BuildStatistics, Path, Mapping[Path, str]]:
     """Execute the build process with domain-based output structure.
 
     Args:
         config: Parsed SPConfig
         dry_run: If True, don't write files
         verbose: If True, show detailed output
+        session: In-memory state from a previous build (watch mode); when
+            given, the build is incremental against that state
 
     Returns:
         Tuple of (list of generated file paths, build statistics,
-        project_path, all_files)
+        project_path, all_files). With output_options.streaming, all_files
+        reads each file back from disk on access instead of holding it.
 
     Raises:
         click.ClickException: If no semantic models are found
@@ -99,8 +243,16 @@ def run_build(
     from semantic_patterns.adapters.lookml.types import (
         ExploreConfig as LookMLExploreConfig,
     )
-    from semantic_patterns.domain import ProcessedModel
-    from semantic_patterns.ingestion import DbtLoader, DbtMapper, DomainBuilder
+    from semantic_patterns.adapters.sql_cache import get_sql_parse_cache
+    from semantic_patterns.core.incremental import (
+        BuildPlan,
+        collect_sources,
+        compute_entity_graph_hash,
+        plan_build,
+        reuse_outputs,
+    )
+    from semantic_patterns.core.writer import FilesOnDisk, OutputWriter, atomic_write
+    from semantic_patterns.domain import EntityGraph
     from semantic_patterns.manifest import (
         ModelSummary,
         OutputInfo,
@@ -132,26 +284,11 @@ def run_build(
         # Loading models
         task = progress.add_task("Loading semantic models...", total=None)
 
-        if config.format == "dbt":
-            # Load dbt format and transform to our format
-            dbt_loader = DbtLoader(config.input_path)
-            semantic_models, metrics = dbt_loader.load_all()
-
-            # Map dbt format to our format
-            mapper = DbtMapper()
-            mapper.add_semantic_models(semantic_models)
-            mapper.add_metrics(metrics)
-            documents = mapper.get_documents()
-
-            # Build domain models from mapped documents
-            builder = DomainBuilder()
-            for doc in documents:
-                builder.add_document(doc)
-            models = builder.build()
+        if session is not None:
+            parse_cache = session.parse_cache
         else:
-            # Use native semantic-patterns format
-            models = DomainBuilder.from_directory(config.input_path)
-
+            parse_cache = open_parse_cache(config)
+        models = load_models(config, parse_cache=parse_cache)
         progress.update(task, completed=True)
 
     if not models:
@@ -182,6 +319,11 @@ def run_build(
                 f"          [cyan]{model.name}[/cyan] "
                 f"[dim]({dims_count} dims, {metrics_count} metrics)[/dim]"
             )
+        if parse_cache is not None:
+            console.print(
+                f"[dim]Parse cache:[/dim] {parse_cache.hits} cached, "
+                f"{parse_cache.misses} parsed"
+            )
 
     # Ensure all models have data_model (for sql_table_name generation)
     # Must be done BEFORE prefix is applied so table name uses original model name
@@ -241,14 +383,104 @@ def run_build(
                 model_to_explore[joined_fact_name] = explore_name
                 model_to_fact[joined_fact_name] = fact_model_name
 
+    # Override schema from config
+    for model in models:
+        if model.data_model:
+            model.data_model = DataModel(
+                name=model.data_model.name,
+                schema_name=config.schema_name,
+                table=model.data_model.table,
+                connection=model.data_model.connection,
+            )
+
+    # Record the source -> model graph and decide what needs rendering.
+    # Input/output options don't change generated content, so they are
+    # left out of the hash.
+    config_hash = compute_config_hash(
+        config, exclude={"input_options", "output_options"}
+    )
+    sources = collect_sources(models)
+    entity_graph_hash = compute_entity_graph_hash(models)
+    # The previous build's outputs drive incremental planning and let the
+    # writer skip files whose content is unchanged
+    if session is not None and session.manifest is not None:
+        previous_manifest: SPManifest | None = session.manifest
+    else:
+        previous_manifest = SPManifest.from_file(paths.manifest_path)
+
+    if session is not None and session.manifest is not None:
+        plan = plan_build(
+            session.manifest, config_hash, sources, models, entity_graph_hash
+        )
+    elif not config.output_options.incremental:
+        plan = BuildPlan.full_build("incremental builds disabled")
+    elif not config.output_options.manifest:
+        plan = BuildPlan.full_build("manifest disabled")
+    else:
+        plan = plan_build(
+            previous_manifest, config_hash, sources, models, entity_graph_hash
+        )
+
+    if verbose and (config.output_options.incremental or session is not None):
+        if plan.full:
+            console.print(f"[dim]Incremental:[/dim] full build ({plan.reason})")
+        else:
+            console.print(
+                f"[dim]Incremental:[/dim] {len(plan.affected_models)} of "
+                f"{len(models)} models changed"
+            )
+
+    sql_cache = get_sql_parse_cache()
+    sql_hits, sql_misses = sql_cache.hits, sql_cache.misses
+
+    if session is not None:
+        render_cache = session.render_cache
+    else:
+        render_cache = open_render_cache(config)
+    render_hits, render_misses = (
+        (render_cache.hits, render_cache.misses) if render_cache else (0, 0)
+    )
+
     # Generate views
     generator = LookMLGenerator(
         dialect=config.options.dialect,
         pop_strategy_type=config.options.pop_strategy,
         model_to_explore=model_to_explore,
         model_to_fact=model_to_fact,
+        serializer=config.options.serializer,
+    )
+    previous_files = session.files if session is not None else None
+    reused: set[Path] = set()
+    output_hashes: dict[Path, str] = {}
+
+    # Streaming builds write each file as soon as it is rendered and keep
+    # only its hash; otherwise contents are collected and written at the end
+    streaming = config.output_options.streaming and not dry_run
+    writer = OutputWriter.from_manifest(
+        paths.project_path,
+        previous_manifest,
+        workers=config.output_options.write_workers,
+        fsync=config.output_options.fsync,
     )
-    all_files: dict[Path, str] = {}
+    if streaming:
+        paths.ensure_directories()
+    contents: dict[Path, str] = {}
+
+    def collect(files: dict[Path, str]) -> dict[Path, str]:
+        """Hash a group of files, writing them straight away when streaming."""
+        hashes: dict[Path, str] = {}
+        for path, content in files.items():
+            hashes[path] = compute_content_hash(content)
+            if not streaming:
+                contents[path] = content
+            elif path in reused:
+                writer.skip(path)
+            else:
+                writer.submit(path, content)
+        return hashes
+
+    output_models: dict[Path, str] = {}
+    explore_dependencies: dict[Path, list[str]] = {}
 
     with Progress(
         SpinnerColumn(),
@@ -258,22 +490,37 @@ def run_build(
     ) as progress:
         task = progress.add_task("Generating view files...", total=len(models))
 
+        model_files: dict[str, dict[Path, str]] = {}
+        to_render: list[ProcessedModel] = []
         for model in models:
-            # Override schema from config
-            if model.data_model:
-                from semantic_patterns.domain import DataModel
-
-                model.data_model = DataModel(
-                    name=model.data_model.name,
-                    schema_name=config.schema_name,
-                    table=model.data_model.table,
-                    connection=model.data_model.connection,
+            files = None
+            if not plan.model_needs_render(model.name):
+                files = reuse_outputs(
+                    paths.project_path, plan.model_outputs(model.name), previous_files
                 )
+            if files is None:
+                to_render.append(model)
+                continue
+            reused.update(files)
+            model_files[model.name] = collect(files)
+            progress.advance(task)
 
-            files = generator.generate_model_with_paths(model, paths)
-            all_files.update(files)
+        for name, files in generator.render_models(
+            to_render,
+            paths,
+            workers=config.output_options.render_workers,
+            chunksize=config.output_options.render_chunksize,
+            cache=render_cache,
+        ):
+            model_files[name] = collect(files)
             progress.advance(task)
 
+        # Merge in model order so output is independent of worker scheduling
+        for model in models:
+            hashes = model_files[model.name]
+            output_hashes.update(hashes)
+            output_models.update(dict.fromkeys(hashes, model.name))
+
     # Generate explores if configured
     if config.explores:
         explore_configs = [
@@ -293,72 +540,155 @@ def run_build(
                     f"{view_prefix}{fact}" if view_prefix else fact
                     for fact in e.joined_facts
                 ],
+                join_depth=e.join_depth,
             )
             for e in config.explores
         ]
 
-        explore_gen = ExploreGenerator(dialect=config.options.dialect)
-        explore_files = explore_gen.generate_with_paths(
-            explore_configs, model_dict, paths
+        explore_gen = ExploreGenerator(
+            dialect=config.options.dialect, serializer=config.options.serializer
         )
+        # One entity index shared by every explore's join inference
+        entity_graph = EntityGraph(models)
+        for explore_config in explore_configs:
+            explore_path = paths.explore_file_path(explore_config.effective_name)
+            rel_path = str(explore_path.relative_to(paths.project_path))
+
+            explore_files = None
+            if not plan.explore_needs_render(rel_path):
+                previous = plan.previous_outputs[rel_path]
+                explore_files = reuse_outputs(
+                    paths.project_path, [previous], previous_files
+                )
+                if explore_files is not None:
+                    reused.update(explore_files)
+                    explore_dependencies[explore_path] = previous.depends_on
+            if explore_files is None:
+                explore_files = explore_gen.generate_explore_with_paths(
+                    explore_config, model_dict, paths, entity_graph
+                )
+                explore_dependencies[explore_path] = explore_gen.explore_dependencies(
+                    explore_config, model_dict, entity_graph
+                )
 
-        all_files.update(explore_files)
+            output_hashes.update(collect(explore_files))
         stats.explores = len(config.explores)
 
+    if verbose:
+        console.print(
+            f"[dim]SQL parse cache:[/dim] {sql_cache.hits - sql_hits} hits, "
+            f"{sql_cache.misses - sql_misses} misses"
+        )
+        if render_cache is not None:
+            hits = render_cache.hits - render_hits
+            lookups = hits + render_cache.misses - render_misses
+            rate = f" ({hits / lookups:.0%})" if lookups else ""
+            console.print(
+                f"[dim]Render cache:[/dim] {hits} of {lookups} models reused{rate}"
+            )
+
     # Generate model file (rollup with includes)
-    model_content = generate_model_file_content(config, all_files, paths)
+    model_content = generate_model_file_content(config, output_hashes, paths)
     model_file_path = paths.model_file_path()
-    all_files[model_file_path] = model_content
+    previous_model_file = plan.previous_outputs.get(
+        str(model_file_path.relative_to(paths.project_path))
+    )
+    if (
+        not plan.full
+        and previous_model_file is not None
+        and previous_model_file.hash == compute_content_hash(model_content)
+        and reuse_outputs(paths.project_path, [previous_model_file], previous_files)
+    ):
+        reused.add(model_file_path)
+    output_hashes.update(collect({model_file_path: model_content}))
+
+    output_infos = [
+        OutputInfo(
+            path=str(p.relative_to(paths.project_path)),
+            hash=output_hashes[p],
+            type="view"
+            if ".view.lkml" in str(p)
+            else ("explore" if ".explore.lkml" in str(p) else "model"),
+            model=output_models.get(p),
+            depends_on=explore_dependencies.get(p, []),
+        )
+        for p in output_hashes
+    ]
 
-    # Write files
-    written: list[Path] = []
-    stats.files = len(all_files)
+    # Files the previous build generated that this one no longer does
+    # (deleted or renamed models, removed explores)
+    clean_mode = config.output_options.clean or "warn"
+    tracked = config.output_options.manifest or session is not None
+    if tracked and previous_manifest is not None and clean_mode != "ignore":
+        stats.orphaned = previous_manifest.find_orphaned_files(output_infos)
+
+    # Write files (already done file by file when streaming)
+    written = list(output_hashes)
+    stats.files = len(output_hashes)
+    stats.reused = len(reused)
 
     if not dry_run:
-        # Create directory structure
-        paths.ensure_directories()
+        if not streaming:
+            # Create directory structure (the writer creates each domain
+            # folder once, as its first file is written)
+            paths.ensure_directories()
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task("Writing files...", total=len(written))
+
+                for file_path in written:
+                    # Reused files are already on disk with this content
+                    if file_path in reused:
+                        writer.skip(file_path)
+                    else:
+                        writer.submit(file_path, contents[file_path])
+                    progress.advance(task)
+        writer.close()
+
+        if stats.orphaned and clean_mode == "clean":
+            writer.remove_orphans(stats.orphaned)
+
+        stats.written = len(writer.written)
+        stats.unchanged = len(writer.unchanged)
+        stats.deleted = len(writer.deleted)
+
+    if stats.orphaned and (clean_mode == "warn" or dry_run):
+        action = "Would remove" if clean_mode == "clean" else "Orphaned files"
+        console.print(
+            f"[yellow]{action} ({len(stats.orphaned)} no longer generated):[/yellow]"
+        )
+        for rel_path in stats.orphaned[:10]:
+            console.print(f"  [dim]- {rel_path}[/dim]")
+        if len(stats.orphaned) > 10:
+            console.print(f"  [dim]... and {len(stats.orphaned) - 10} more[/dim]")
+        if clean_mode == "warn":
+            console.print("[dim]Set output_options.clean: clean to remove them[/dim]")
+
+    # Generate manifest (written if enabled, kept in memory for a session)
+    if config.output_options.manifest or session is not None:
+        manifest = SPManifest.create(
+            project=config.project,
+            config_hash=config_hash,
+            sources=sources,
+            outputs=output_infos,
+            models=model_summaries,
+            entity_graph_hash=entity_graph_hash,
+        )
+        if config.output_options.manifest and not dry_run:
+            atomic_write(paths.manifest_path, manifest.to_json().encode("utf-8"))
 
-        # Create domain folders for each model
-        for model in models:
-            paths.ensure_view_domain(model.name)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True,
-        ) as progress:
-            task = progress.add_task("Writing files...", total=len(all_files))
-
-            for file_path, content in all_files.items():
-                # Ensure parent directory exists (for any edge cases)
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(content, encoding="utf-8")
-                written.append(file_path)
-                progress.advance(task)
-
-        # Generate and write manifest if enabled
-        if config.output_options.manifest:
-            output_infos = [
-                OutputInfo(
-                    path=str(p.relative_to(paths.project_path)),
-                    hash=compute_content_hash(all_files[p]),
-                    type="view"
-                    if ".view.lkml" in str(p)
-                    else ("explore" if ".explore.lkml" in str(p) else "model"),
-                )
-                for p in all_files.keys()
-            ]
-
-            manifest = SPManifest.create(
-                project=config.project,
-                config_hash=compute_config_hash(config),
-                outputs=output_infos,
-                models=model_summaries,
-            )
-            paths.manifest_path.write_text(manifest.to_json(), encoding="utf-8")
-    else:
-        # Dry run - just return what would be written
-        written = list(all_files.keys())
+        if session is not None:
+            session.manifest = manifest
+            # Empty when streaming - unchanged outputs are reused from disk
+            session.files = contents
 
+    if streaming:
+        all_files: Mapping[Path, str] = FilesOnDisk(output_hashes)
+    else:
+        all_files = {path: contents[path] for path in output_hashes}
     return written, stats, paths.project_path, all_files
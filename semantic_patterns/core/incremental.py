@@ -0,0 +1,208 @@
+"""Incremental build planning.
+
+The manifest records a dependency graph for each build:
+
+    source file -> model       (SPManifest.sources)
+    model       -> view files  (OutputInfo.model)
+    models      -> explore     (OutputInfo.depends_on)
+
+On the next build the current sources are compared against that graph
+to find the models whose inputs changed. Only those models' views, and
+explores depending on them, are rendered again; every other output is
+reused from the previous build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from semantic_patterns import __version__
+from semantic_patterns.manifest import (
+    OutputInfo,
+    SourceInfo,
+    SPManifest,
+    compute_content_hash,
+    compute_file_hash,
+)
+
+if TYPE_CHECKING:
+    from semantic_patterns.adapters.lookml.cache import RenderCache
+    from semantic_patterns.domain import ProcessedModel
+    from semantic_patterns.ingestion.cache import ParseCache
+
+
+@dataclass
+class BuildPlan:
+    """Which parts of the previous build can be reused."""
+
+    full: bool
+    reason: str = ""
+    affected_models: set[str] = field(default_factory=set)
+    # Any model's entities changed, so explore joins may differ everywhere
+    explores_dirty: bool = True
+    previous_outputs: dict[str, OutputInfo] = field(default_factory=dict)
+
+    @classmethod
+    def full_build(cls, reason: str) -> BuildPlan:
+        """Plan that re-renders everything."""
+        return cls(full=True, reason=reason)
+
+    def model_needs_render(self, model_name: str) -> bool:
+        """Whether a model's view files must be rendered again."""
+        return self.full or model_name in self.affected_models
+
+    def explore_needs_render(self, output_path: str) -> bool:
+        """Whether an explore file must be rendered again."""
+        if self.full or self.explores_dirty:
+            return True
+        previous = self.previous_outputs.get(output_path)
+        if previous is None:
+            return True
+        return bool(self.affected_models.intersection(previous.depends_on))
+
+    def model_outputs(self, model_name: str) -> list[OutputInfo]:
+        """Outputs the previous build rendered from a model."""
+        return [o for o in self.previous_outputs.values() if o.model == model_name]
+
+
+def collect_sources(models: list[ProcessedModel]) -> list[SourceInfo]:
+    """Hash every model's source files into manifest SourceInfo entries."""
+    hashes: dict[str, str] = {}
+    sources: list[SourceInfo] = []
+    for model in models:
+        for path in model.source_files:
+            if path not in hashes:
+                hashes[path] = compute_file_hash(Path(path))
+            sources.append(
+                SourceInfo(path=path, hash=hashes[path], model_name=model.name)
+            )
+    return sources
+
+
+def compute_entity_graph_hash(models: list[ProcessedModel]) -> str:
+    """Hash the entities of every model (the input to join inference)."""
+    graph = {
+        model.name: [entity.model_dump() for entity in model.entities]
+        for model in models
+    }
+    graph_str = json.dumps(graph, sort_keys=True)
+    return hashlib.sha256(graph_str.encode()).hexdigest()[:16]
+
+
+def plan_build(
+    previous: SPManifest | None,
+    config_hash: str,
+    sources: list[SourceInfo],
+    models: list[ProcessedModel],
+    entity_graph_hash: str,
+) -> BuildPlan:
+    """
+    Compare the current inputs with the previous manifest.
+
+    A model is affected when the set of (source file, hash) pairs that
+    produced it differs from the previous build - this covers edited,
+    added and removed files as well as metrics moving between models.
+
+    Args:
+        previous: Manifest from the previous build (None forces a full build)
+        config_hash: Hash of the current config
+        sources: Current source -> model entries (see collect_sources)
+        models: Current models
+        entity_graph_hash: Current entity graph hash
+
+    Returns:
+        BuildPlan describing what must be rendered again
+    """
+    if previous is None:
+        return BuildPlan.full_build("no previous manifest")
+    if previous.config_hash != config_hash:
+        return BuildPlan.full_build("config changed")
+    if previous.generator_version != __version__:
+        return BuildPlan.full_build("semantic-patterns version changed")
+
+    def by_model(entries: list[SourceInfo]) -> dict[str, set[tuple[str, str]]]:
+        grouped: dict[str, set[tuple[str, str]]] = {}
+        for entry in entries:
+            grouped.setdefault(entry.model_name, set()).add((entry.path, entry.hash))
+        return grouped
+
+    previous_sources = by_model(previous.sources)
+    current_sources = by_model(sources)
+
+    affected = set()
+    for model in models:
+        current = current_sources.get(model.name)
+        # Models without recorded sources can't be tracked; always render
+        if not current or current != previous_sources.get(model.name):
+            affected.add(model.name)
+
+    current_names = {m.name for m in models}
+    previous_names = {s.name for s in previous.models}
+
+    return BuildPlan(
+        full=False,
+        affected_models=affected,
+        explores_dirty=(
+            previous.entity_graph_hash != entity_graph_hash
+            or current_names != previous_names
+        ),
+        previous_outputs={o.path: o for o in previous.outputs},
+    )
+
+
+def read_previous_output(project_path: Path, output: OutputInfo) -> str | None:
+    """Read a previously generated file if it is unchanged on disk."""
+    try:
+        content = (project_path / output.path).read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if compute_content_hash(content) != output.hash:
+        return None
+    return content
+
+
+def reuse_outputs(
+    project_path: Path,
+    outputs: list[OutputInfo],
+    contents: dict[Path, str] | None = None,
+) -> dict[Path, str] | None:
+    """Load a group of previous outputs, or None if any must be regenerated.
+
+    Args:
+        project_path: Output project folder
+        outputs: Previous outputs to reuse
+        contents: Previously rendered content held in memory (checked
+            before falling back to the files on disk)
+    """
+    if not outputs:
+        return None
+    files: dict[Path, str] = {}
+    for output in outputs:
+        path = project_path / output.path
+        content = contents.get(path) if contents is not None else None
+        if content is None or compute_content_hash(content) != output.hash:
+            content = read_previous_output(project_path, output)
+        if content is None:
+            return None
+        files[path] = content
+    return files
+
+
+@dataclass
+class BuildSession:
+    """
+    State kept in memory between builds of a long-running process.
+
+    Passing the same session to successive run_build calls skips reading
+    the manifest and unchanged outputs back from disk, and keeps parsed
+    YAML and rendered views in memory.
+    """
+
+    parse_cache: ParseCache | None = None
+    render_cache: RenderCache | None = None
+    manifest: SPManifest | None = None
+    files: dict[Path, str] = field(default_factory=dict)
@@ -7,6 +7,7 @@ with Looker's dev environment.
 from __future__ import annotations
 
 import traceback
+from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,7 @@ from rich.console import Console
 
 if TYPE_CHECKING:
     from semantic_patterns.config import SPConfig
+    from semantic_patterns.destinations.looker.http import HttpStats
 
 # Module-level console for output
 console = Console()
@@ -22,11 +24,13 @@ console = Console()
 
 def handle_looker_push(
     config: SPConfig,
-    all_files: dict[Path, str],
+    all_files: Mapping[Path, str],
     *,
     push: bool,
     dry_run: bool,
     debug: bool,
+    deleted: list[Path] | None = None,
+    verbose: bool = False,
 ) -> None:
     """Handle Looker push/sync after build completes.
 
@@ -39,11 +43,14 @@ def handle_looker_push(
         push: If True, skip confirmation prompt
         dry_run: If True, simulate without pushing
         debug: If True, show full stacktraces on error
+        deleted: Paths of orphaned files to remove from the repo
+        verbose: If True, show per-endpoint request latency and retries
 
     Raises:
         click.ClickException: If push fails
     """
     from semantic_patterns.destinations import LookerAPIError, LookerDestination
+    from semantic_patterns.destinations.looker.http import get_http_stats
 
     looker_cfg = config.looker
 
@@ -53,6 +60,8 @@ def handle_looker_push(
     console.print(f"  [dim]Repo:[/dim]   {looker_cfg.repo}")
     console.print(f"  [dim]Branch:[/dim] {looker_cfg.branch}")
     console.print(f"  [dim]Files:[/dim]  {len(all_files)}")
+    if deleted:
+        console.print(f"  [dim]Delete:[/dim] {len(deleted)}")
     if looker_cfg.looker_sync_enabled:
         console.print(
             f"  [dim]Looker:[/dim] {looker_cfg.base_url} ({looker_cfg.project_id})"
@@ -70,9 +79,11 @@ def handle_looker_push(
             return
 
     # Create destination and push
+    http_stats = get_http_stats()
+    http_stats.clear()
     try:
         dest = LookerDestination(looker_cfg, config.project, console=console)
-        result = dest.write(all_files, dry_run=dry_run)
+        result = dest.write(all_files, dry_run=dry_run, deleted=deleted)
 
         if dry_run:
             console.print(f"\n[yellow]{result.message}[/yellow]")
@@ -86,6 +97,7 @@ def handle_looker_push(
                 console.print(
                     f"[dim]Looker:[/dim] {result.looker_url}", overflow="ignore"
                 )
+            _print_http_stats(http_stats, verbose)
 
     except LookerAPIError as e:
         if debug:
@@ -97,3 +109,18 @@ def handle_looker_push(
             console.print(traceback.format_exc())
         console.print(f"\n[red]Looker push failed:[/red] {e}")
         raise click.ClickException(str(e))
+
+
+def _print_http_stats(stats: HttpStats, verbose: bool) -> None:
+    """Show API request stats (all endpoints if verbose, else only retries)."""
+    if verbose:
+        console.print()
+        for endpoint, counts in stats.snapshot().items():
+            retries = f", {counts.retries} retried" if counts.retries else ""
+            console.print(
+                f"[dim]{endpoint}: {counts.requests} requests, "
+                f"{counts.mean_ms:.0f}ms avg{retries}[/dim]",
+                overflow="ignore",
+            )
+    elif stats.retries:
+        console.print(f"[dim]Retried {stats.retries} API requests[/dim]")
@@ -0,0 +1,199 @@
+"""Watch mode - rebuild when semantic model files change.
+
+Uses stat polling rather than OS file events so it works everywhere
+without extra dependencies. A rebuild runs once changes have settled
+for the debounce window, and reuses the in-memory BuildSession so only
+affected views and explores are rendered and rewritten. With push, each
+build that changed output is pushed to Looker over the process-wide
+connection pools with the cached Looker token.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from semantic_patterns.adapters.lookml.cache import RenderCache
+from semantic_patterns.core.builder import (
+    BuildStatistics,
+    console,
+    input_ignore_patterns,
+    run_build,
+)
+from semantic_patterns.core.incremental import BuildSession
+from semantic_patterns.core.looker_push import handle_looker_push
+from semantic_patterns.ingestion.cache import ParseCache
+from semantic_patterns.ingestion.files import find_yaml_files
+
+if TYPE_CHECKING:
+    from semantic_patterns.config import SPConfig
+
+# Seconds between polls of the input directory
+POLL_INTERVAL = 0.5
+
+# Seconds without further changes before a rebuild starts
+DEBOUNCE = 0.3
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+def snapshot(path: Path, ignore: list[str] | None = None) -> Snapshot:
+    """Record (mtime_ns, size) for every YAML file under path.
+
+    A file path (e.g. a dbt semantic_manifest.json) is watched on its own.
+    """
+    files = [path] if path.is_file() else find_yaml_files(path, ignore)
+    state: Snapshot = {}
+    for file_path in files:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Deleted between listing and stat
+            continue
+        state[file_path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def changed_files(before: Snapshot, after: Snapshot) -> set[Path]:
+    """Files added, removed or modified between two snapshots."""
+    changed = set(before.keys() ^ after.keys())
+    changed.update(p for p in before.keys() & after.keys() if before[p] != after[p])
+    return changed
+
+
+class Watcher:
+    """
+    Poll the input directory and rebuild on change.
+
+    Usage:
+        watcher = Watcher(config, push=True)
+        watcher.build()   # initial build
+        watcher.push()    # push it to Looker (when looker.enabled)
+        watcher.run()     # block until interrupted, pushing each rebuild
+    """
+
+    def __init__(
+        self,
+        config: SPConfig,
+        *,
+        dry_run: bool = False,
+        verbose: bool = False,
+        push: bool = False,
+        debug: bool = False,
+        poll_interval: float = POLL_INTERVAL,
+        debounce: float = DEBOUNCE,
+    ) -> None:
+        self.config = config
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.push_enabled = push and config.looker.enabled
+        self.debug = debug
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.session = BuildSession(
+            parse_cache=ParseCache.in_memory(config.input_options.cache_max_mb),
+            render_cache=RenderCache.in_memory(
+                config.input_options.cache_max_mb, config.options.model_dump_json()
+            ),
+        )
+        self._ignore = input_ignore_patterns(config, config.input_path)
+        self._snapshot: Snapshot = {}
+        # Output of the last build, for push()
+        self._output: tuple[BuildStatistics, Path, Mapping[Path, str]] | None = None
+
+    def build(self) -> tuple[BuildStatistics, float]:
+        """Run one build against the session.
+
+        Returns:
+            Tuple of (build statistics, elapsed seconds)
+        """
+        self._snapshot = snapshot(self.config.input_path, self._ignore)
+        start = time.perf_counter()
+        _, stats, project_path, all_files = run_build(
+            self.config,
+            dry_run=self.dry_run,
+            verbose=self.verbose,
+            session=self.session,
+        )
+        self._output = (stats, project_path, all_files)
+        return stats, time.perf_counter() - start
+
+    def push(self) -> bool:
+        """Push the last build to Looker, without confirmation.
+
+        A failed push is reported and watching continues.
+
+        Returns:
+            True if the push ran and succeeded
+        """
+        if not self.push_enabled or self._output is None:
+            return False
+        stats, project_path, all_files = self._output
+        deleted = None
+        if self.config.output_options.clean == "clean":
+            deleted = [project_path / rel_path for rel_path in stats.orphaned]
+        try:
+            handle_looker_push(
+                self.config,
+                all_files,
+                push=True,
+                dry_run=self.dry_run,
+                debug=self.debug,
+                deleted=deleted,
+                verbose=self.verbose,
+            )
+        except click.ClickException:
+            # Already reported; the next rebuild pushes again
+            return False
+        return True
+
+    def poll(self) -> set[Path]:
+        """Return files changed since the last build or poll."""
+        current = snapshot(self.config.input_path, self._ignore)
+        changed = changed_files(self._snapshot, current)
+        self._snapshot = current
+        return changed
+
+    def wait_for_changes(
+        self, sleep: Callable[[float], None] = time.sleep
+    ) -> set[Path]:
+        """Block until files change and then settle for the debounce window."""
+        changed: set[Path] = set()
+        while not changed:
+            sleep(self.poll_interval)
+            changed = self.poll()
+
+        # Keep collecting until a full debounce window passes quietly
+        while True:
+            sleep(self.debounce)
+            more = self.poll()
+            if not more:
+                return changed
+            changed |= more
+
+    def run(self, max_rebuilds: int | None = None) -> None:
+        """Watch and rebuild until interrupted (or max_rebuilds reached)."""
+        rebuilds = 0
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            changed = self.wait_for_changes()
+            names = ", ".join(sorted(p.name for p in changed))
+            console.print(f"\n[dim]Changed:[/dim] {names}")
+            try:
+                stats, elapsed = self.build()
+            except Exception as e:
+                # Keep watching - the next save may fix it
+                console.print(f"[red]Build failed:[/red] {e}")
+            else:
+                console.print(
+                    f"[green]Rebuilt in {elapsed:.2f}s[/green] "
+                    f"[dim]({stats.written} written, "
+                    f"{stats.unchanged} unchanged)[/dim]"
+                )
+                # Nothing to push if the rebuild produced identical output
+                if stats.written or stats.deleted:
+                    self.push()
+            rebuilds += 1
@@ -0,0 +1,298 @@
+"""Write generated files to the output tree.
+
+Only files whose content changed are written, so unchanged files keep
+their mtime (no watcher, git status or network filesystem churn). Each
+write goes to a temp file in the target directory and is renamed into
+place, so Looker, git and file watchers never see a partial file.
+
+On slow (e.g. network-mounted) output directories, writes can run on a
+bounded thread pool so the build isn't serialized on I/O latency.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from semantic_patterns.manifest import SPManifest, compute_content_hash
+
+
+def _default_mode() -> int:
+    """Permissions a plain open() would give a new file under the umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+_DEFAULT_MODE = _default_mode()
+
+
+class OutputWriteError(OSError):
+    """A generated file could not be written or removed."""
+
+    def __init__(self, path: Path, cause: OSError) -> None:
+        super().__init__(f"Could not write {path}: {cause.strerror or cause}")
+        self.path = path
+        self.cause = cause
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Write data to path via a temp file and rename.
+
+    The file keeps its existing permissions, or gets the usual umask-based
+    permissions if it is new. With fsync, the data is flushed to disk
+    before the rename (the directory entry is not; see fsync_directory).
+    """
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = _DEFAULT_MODE
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def fsync_directory(directory: Path) -> None:
+    """Flush a directory's entries (e.g. renames into it) to disk."""
+    if os.name != "posix":
+        return  # Directories can't be opened for fsync on Windows
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class OutputWriter:
+    """
+    Writes generated files, skipping those already on disk.
+
+    A file is compared with the previous manifest's hash first: if that
+    hash differs the file is written straight away. Otherwise (or with no
+    manifest entry) it is compared with the file on disk, so hand edits
+    and deleted files are still overwritten.
+
+    submit() hands writes to a pool of `workers` threads, with at most a
+    few writes per worker in flight so queued content stays bounded;
+    close() waits for them and raises the first OutputWriteError. Each
+    output directory is created once, however many files go into it.
+    With fsync, every file is synced before its rename and each touched
+    directory is synced once when the writer is closed.
+
+    Usage:
+        writer = OutputWriter.from_manifest(paths.project_path, manifest)
+        for path, content in files.items():
+            writer.submit(path, content)
+        writer.close()
+        print(len(writer.written), len(writer.unchanged), len(writer.deleted))
+    """
+
+    # Writes queued per worker thread before submit() blocks
+    QUEUE_PER_WORKER = 4
+
+    def __init__(
+        self,
+        project_path: Path,
+        previous_hashes: dict[str, str] | None = None,
+        workers: int = 1,
+        fsync: bool = False,
+    ) -> None:
+        self.project_path = project_path
+        self.previous_hashes = previous_hashes or {}
+        self.workers = workers
+        self.fsync = fsync
+        self.written: list[Path] = []
+        self.unchanged: list[Path] = []
+        self.deleted: list[Path] = []
+        self._dirs: set[Path] = set()
+        self._dirs_lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: set[Future[bool]] = set()
+
+    @classmethod
+    def from_manifest(
+        cls,
+        project_path: Path,
+        manifest: SPManifest | None,
+        workers: int = 1,
+        fsync: bool = False,
+    ) -> OutputWriter:
+        """Create a writer that compares against a previous manifest."""
+        hashes = {o.path: o.hash for o in manifest.outputs} if manifest else {}
+        return cls(project_path, hashes, workers=workers, fsync=fsync)
+
+    def _previous_hash(self, path: Path) -> str | None:
+        try:
+            rel_path = path.relative_to(self.project_path).as_posix()
+        except ValueError:
+            return None
+        return self.previous_hashes.get(rel_path)
+
+    def write(self, path: Path, content: str) -> bool:
+        """Write content to path unless it is already there.
+
+        Returns:
+            True if the file was written, False if it was unchanged
+        """
+        data = content.encode("utf-8")
+        previous = self._previous_hash(path)
+        if previous is None or previous == compute_content_hash(content):
+            # Probably unchanged - confirm against the file on disk
+            try:
+                unchanged = path.read_bytes() == data
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self.unchanged.append(path)
+                return False
+
+        try:
+            self._ensure_dir(path.parent)
+            atomic_write(path, data, fsync=self.fsync)
+        except OSError as e:
+            raise OutputWriteError(path, e) from e
+        self.written.append(path)
+        return True
+
+    def submit(self, path: Path, content: str) -> None:
+        """Write content to path, on the thread pool when workers > 1.
+
+        Blocks while the pool already has its share of queued writes.
+        Errors are raised from a later submit() or from close().
+        """
+        if self.workers <= 1:
+            self.write(path, content)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="sp-writer"
+            )
+        if len(self._pending) >= self.workers * self.QUEUE_PER_WORKER:
+            done, self._pending = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        self._pending.add(self._pool.submit(self.write, path, content))
+
+    def close(self) -> None:
+        """Wait for submitted writes and sync touched directories if enabled.
+
+        Raises:
+            OutputWriteError: If any submitted write failed
+        """
+        pending, self._pending = self._pending, set()
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
+
+        if self.fsync:
+            for directory in sorted({path.parent for path in self.written}):
+                try:
+                    fsync_directory(directory)
+                except OSError as e:
+                    raise OutputWriteError(directory, e) from e
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory (and parents) unless this writer already has."""
+        if directory in self._dirs:
+            return
+        with self._dirs_lock:
+            if directory not in self._dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._dirs.add(directory)
+
+    def skip(self, path: Path) -> None:
+        """Record a file already known to be on disk with its content."""
+        self.unchanged.append(path)
+
+    def delete(self, path: Path) -> bool:
+        """Delete a previously generated file.
+
+        Returns:
+            True if the file existed and was removed
+        """
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            raise OutputWriteError(path, e) from e
+        self.deleted.append(path)
+        return True
+
+    def remove_orphans(self, rel_paths: list[str]) -> list[Path]:
+        """Delete previously generated files that are no longer produced.
+
+        Paths are relative to the project path (as stored in the manifest).
+        Paths that would resolve outside the project are ignored, and
+        directories left empty by the deletions are removed.
+
+        Returns:
+            The files that were removed
+        """
+        root = self.project_path.resolve()
+        removed: list[Path] = []
+        for rel_path in rel_paths:
+            path = self.project_path / rel_path
+            if not path.resolve().is_relative_to(root):
+                continue
+            if self.delete(path):
+                removed.append(path)
+
+        # Deepest directories first so nested empty folders collapse
+        parents = {p.parent for p in removed}
+        for directory in sorted(parents, key=lambda p: len(p.parts), reverse=True):
+            while directory != self.project_path and directory.is_relative_to(
+                self.project_path
+            ):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    break  # Not empty (or already gone)
+                directory = directory.parent
+        return removed
+
+
+class FilesOnDisk(Mapping[Path, str]):
+    """
+    Read-only mapping of written files that loads content on access.
+
+    Stands in for the in-memory path -> content dict once a streaming
+    build has written its files, so later stages (e.g. the Looker push)
+    read each file only when they need it.
+    """
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self._paths = list(dict.fromkeys(paths))
+        self._known = set(self._paths)
+
+    def __getitem__(self, path: Path) -> str:
+        if path not in self._known:
+            raise KeyError(path)
+        return path.read_text(encoding="utf-8")
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._known
@@ -36,12 +36,16 @@ import httpx
 import keyring
 from rich.console import Console
 
+from semantic_patterns.cache import _atomic_write
+
 # Service name used for all keychain entries
 SERVICE_NAME = "semantic-patterns"
 
 # Local credentials file path
 CREDENTIALS_DIR = Path.home() / ".semantic-patterns"
 CREDENTIALS_FILE = CREDENTIALS_DIR / "credentials.json"
+# Short-lived access tokens, kept apart from the credentials above
+TOKEN_CACHE_FILE = CREDENTIALS_DIR / "tokens.json"
 
 
 class CredentialType(str, Enum):
@@ -454,6 +458,72 @@ class CredentialStore:
         return value
 
 
+class TokenCache:
+    """Short-lived access tokens with their expiry, in their own file.
+
+    Tokens are rewritten often (every login), so they never share a file
+    with stored credentials: a write can't clobber a secret, and each
+    write replaces the file atomically so concurrent readers never see a
+    partial one. The temp file is created owner read/write only.
+
+    Entries are dicts with at least "expires_at" (epoch seconds); expired
+    entries are dropped on write.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path if path is not None else TOKEN_CACHE_FILE
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached entry, or None if missing or unreadable."""
+        entry = self._read().get(key)
+        return entry if isinstance(entry, dict) else None
+
+    def set(self, key: str, entry: dict[str, Any]) -> bool:
+        """Cache an entry, replacing any previous one for key."""
+        now = time.time()
+        # Entries without a numeric expires_at are unreadable; drop them
+        tokens = {
+            k: v
+            for k, v in self._read().items()
+            if isinstance(v, dict)
+            and isinstance(v.get("expires_at"), (int, float))
+            and not isinstance(v["expires_at"], bool)
+            and v["expires_at"] > now
+        }
+        tokens[key] = entry
+        return self._write(tokens)
+
+    def delete(self, prefix: str) -> int:
+        """Delete entries whose key starts with prefix.
+
+        Returns:
+            Number of entries deleted
+        """
+        tokens = self._read()
+        keys = [key for key in tokens if key.startswith(prefix)]
+        for key in keys:
+            del tokens[key]
+        if keys:
+            self._write(tokens)
+        return len(keys)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, tokens: dict[str, Any]) -> bool:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(self.path, json.dumps(tokens, indent=2).encode())
+            return True
+        except (OSError, TypeError, ValueError):
+            # The cache is an optimization; failing to write it isn't fatal
+            return False
+
+
 # Module-level convenience functions
 _default_store: CredentialStore | None = None
 
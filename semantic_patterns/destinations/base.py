@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
@@ -17,6 +18,7 @@ class WriteResult:
         looker_url: Optional URL to view files in Looker IDE
         message: Human-readable summary message
         commit_sha: Git commit SHA if applicable
+        files_deleted: List of file paths that were removed
         metadata: Additional metadata about the write operation
     """
 
@@ -25,6 +27,7 @@ class WriteResult:
     looker_url: str | None = None
     message: str | None = None
     commit_sha: str | None = None
+    files_deleted: list[str] = field(default_factory=list)
     metadata: dict[str, str] = field(default_factory=dict)
 
 
@@ -37,14 +40,17 @@ class Destination(Protocol):
 
     def write(
         self,
-        files: dict[Path, str],
+        files: Mapping[Path, str],
         dry_run: bool = False,
+        deleted: list[Path] | None = None,
     ) -> WriteResult:
         """Write files to the destination.
 
         Args:
             files: Dictionary mapping file paths to their content
             dry_run: If True, simulate the write without making changes
+            deleted: Paths of previously generated files that are no longer
+                generated and should be removed from the destination
 
         Returns:
             WriteResult with information about what was written
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import ssl
+import time
+from collections.abc import Generator
 from typing import Any
 
 import httpx
 from rich.console import Console
 
 from semantic_patterns.config import LookerConfig
-from semantic_patterns.credentials import get_credential_store
+from semantic_patterns.credentials import TokenCache, get_credential_store
 from semantic_patterns.destinations.looker.errors import LookerAPIError
+from semantic_patterns.destinations.looker.http import (
+    RETRY,
+    HttpSessions,
+    get_http_sessions,
+)
 
 # Credential keys for Looker API
 LOOKER_CLIENT_ID_KEY = "looker-client-id"
@@ -21,6 +29,13 @@ LOOKER_CLIENT_SECRET_KEY = "looker-client-secret"
 LOOKER_HTTPS_VERIFY_ENV = "LOOKER_HTTPS_VERIFY"
 LOOKER_TIMEOUT_ENV = "LOOKER_TIMEOUT"
 
+# Cached access tokens are stored under this key prefix
+LOOKER_TOKEN_KEY_PREFIX = "looker-token:"
+# Cached tokens are replaced this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60.0
+# Token lifetime assumed if the login response has no expires_in
+DEFAULT_TOKEN_LIFETIME = 3600.0
+
 
 def _get_ssl_verify() -> bool | ssl.SSLContext:
     """Get SSL verification setting from environment.
@@ -54,40 +69,91 @@ def _get_timeout() -> float:
     return 30.0
 
 
-def _get_http_client(timeout: float | None = None) -> httpx.Client:
+def _get_http_client(
+    timeout: float | None = None, sessions: HttpSessions | None = None
+) -> httpx.Client:
     """Create HTTP client with proper SSL and proxy configuration.
 
     Respects standard proxy environment variables (HTTP_PROXY, HTTPS_PROXY).
+    Transient failures are retried and connections are pooled per host
+    (see http.py).
 
     Args:
         timeout: Request timeout in seconds (default from env or 30s)
+        sessions: Connection pools to use (default: process-wide)
 
     Returns:
         Configured httpx.Client
     """
-    return httpx.Client(
+    return (sessions if sessions is not None else get_http_sessions()).client(
         timeout=timeout or _get_timeout(),
         verify=_get_ssl_verify(),
-        # httpx automatically respects HTTP_PROXY, HTTPS_PROXY, NO_PROXY env vars
+        # Pools use the HTTP_PROXY, HTTPS_PROXY, NO_PROXY env vars per host
     )
 
 
+def _token_cache_key(base_url: str, client_id: str, client_secret: str) -> str:
+    """Token cache key for one instance and API key.
+
+    The secret is hashed in too, so changing it stops the old token from
+    being reused.
+    """
+    raw = f"{base_url}\n{client_id}\n{client_secret}".encode()
+    return f"{LOOKER_TOKEN_KEY_PREFIX}{hashlib.sha256(raw).hexdigest()[:32]}"
+
+
+class LookerAuth(httpx.Auth):
+    """Bearer auth with a (cached) Looker access token.
+
+    A request rejected with 401 gets a fresh token and is sent once more,
+    so a token revoked or expired early is replaced transparently.
+    """
+
+    def __init__(
+        self, looker: LookerClient, client_id: str, client_secret: str
+    ) -> None:
+        self.looker = looker
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token = looker.get_access_token(client_id, client_secret)
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        response = yield request
+        if response.status_code == 401:
+            self.token = self.looker.get_access_token(
+                self.client_id, self.client_secret, refresh=True
+            )
+            request.headers["Authorization"] = f"Bearer {self.token}"
+            yield request
+
+
 class LookerClient:
-    """Handle Looker API operations."""
+    """Handle Looker API operations.
+
+    Access tokens are cached locally (see TokenCache) with their expiry
+    and reused until shortly before it, so repeated pushes don't log in
+    every time.
+    """
 
     def __init__(
         self,
         config: LookerConfig,
         console: Console,
+        sessions: HttpSessions | None = None,
     ) -> None:
         """Initialize Looker client.
 
         Args:
             config: Looker configuration
             console: Rich console for output
+            sessions: Connection pools to use (default: process-wide)
         """
         self.config = config
         self.console = console
+        self.sessions = sessions if sessions is not None else get_http_sessions()
 
     def get_credentials(self) -> tuple[str, str] | None:
         """Get Looker API credentials from env, keychain, or prompt.
@@ -158,12 +224,58 @@ class LookerClient:
 
         return client_id, client_secret
 
-    def get_access_token(self, client_id: str, client_secret: str) -> str:
+    def auth(self, client_id: str, client_secret: str) -> LookerAuth:
+        """httpx auth for Looker API calls, refreshing the token on 401.
+
+        Raises:
+            LookerAPIError: If authentication fails
+        """
+        return LookerAuth(self, client_id, client_secret)
+
+    def cached_access_token(self, client_id: str, client_secret: str) -> str | None:
+        """A cached access token for these credentials that isn't about to expire."""
+        entry = TokenCache().get(
+            _token_cache_key(self.config.base_url, client_id, client_secret)
+        )
+        if entry is None:
+            return None
+        try:
+            token: str = entry["access_token"]
+            expires_at = float(entry["expires_at"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if time.time() >= expires_at - TOKEN_REFRESH_MARGIN:
+            return None
+        return token
+
+    def cache_access_token(
+        self, client_id: str, client_secret: str, login: dict[str, Any]
+    ) -> str:
+        """Cache the token from a /login response with its expiry.
+
+        Returns:
+            The access token
+        """
+        access_token: str = login["access_token"]
+        expires_in = float(login.get("expires_in") or DEFAULT_TOKEN_LIFETIME)
+        TokenCache().set(
+            _token_cache_key(self.config.base_url, client_id, client_secret),
+            {"access_token": access_token, "expires_at": time.time() + expires_in},
+        )
+        return access_token
+
+    def get_access_token(
+        self, client_id: str, client_secret: str, refresh: bool = False
+    ) -> str:
         """Exchange Looker API credentials for an access token.
 
+        A cached token is returned while it is valid; otherwise (or with
+        refresh) this logs in and caches the new token.
+
         Args:
             client_id: Looker API client ID
             client_secret: Looker API client secret
+            refresh: If True, ignore any cached token
 
         Returns:
             Access token for Looker API
@@ -171,22 +283,29 @@ class LookerClient:
         Raises:
             LookerAPIError: If authentication fails
         """
+        if not refresh:
+            cached = self.cached_access_token(client_id, client_secret)
+            if cached:
+                return cached
+
         url = f"{self.config.base_url}/api/4.0/login"
 
         try:
-            with _get_http_client() as client:
+            with _get_http_client(sessions=self.sessions) as client:
+                # Logging in again just issues another token
                 response = client.post(
                     url,
                     data={
                         "client_id": client_id,
                         "client_secret": client_secret,
                     },
+                    extensions={RETRY: True},
                 )
 
                 if response.status_code == 200:
-                    data: dict[str, Any] = response.json()
-                    access_token: str = data["access_token"]
-                    return access_token
+                    return self.cache_access_token(
+                        client_id, client_secret, response.json()
+                    )
                 else:
                     # Print helpful error message for user
                     self.console.print()
@@ -7,6 +7,7 @@ This module provides unified handling for:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 from rich.console import Console
@@ -16,6 +17,7 @@ from semantic_patterns.destinations.base import WriteResult
 from semantic_patterns.destinations.looker.client import LookerClient
 from semantic_patterns.destinations.looker.errors import LookerAPIError
 from semantic_patterns.destinations.looker.github import GitHubClient
+from semantic_patterns.destinations.looker.http import HttpSessions, get_http_sessions
 from semantic_patterns.destinations.looker.sync import DevSync
 
 
@@ -46,6 +48,7 @@ class LookerDestination:
         config: LookerConfig,
         project: str,
         console: Console | None = None,
+        sessions: HttpSessions | None = None,
     ) -> None:
         """Initialize Looker destination.
 
@@ -53,26 +56,31 @@ class LookerDestination:
             config: Looker configuration
             project: Project name (used in commit messages)
             console: Rich console for output (optional)
+            sessions: Connection pools to use (default: process-wide)
         """
         self.config = config
         self.project = project
         self.console = console or Console()
 
-        # Initialize sub-clients
-        self.github = GitHubClient(config, project, self.console)
-        self.looker = LookerClient(config, self.console)
+        # Initialize sub-clients (sharing connections to each host)
+        if sessions is None:
+            sessions = get_http_sessions()
+        self.github = GitHubClient(config, project, self.console, sessions=sessions)
+        self.looker = LookerClient(config, self.console, sessions=sessions)
         self.sync = DevSync(config, self.looker, self.console)
 
     def write(
         self,
-        files: dict[Path, str],
+        files: Mapping[Path, str],
         dry_run: bool = False,
+        deleted: list[Path] | None = None,
     ) -> WriteResult:
         """Push files to Git and sync Looker dev environment.
 
         Args:
             files: Dictionary mapping local file paths to their content
             dry_run: If True, simulate without pushing
+            deleted: Local paths of orphaned files to delete in the same commit
 
         Returns:
             WriteResult with commit URL and metadata
@@ -91,14 +99,18 @@ class LookerDestination:
 
         # Transform local paths to Git blob paths
         blobs = self.github.prepare_blobs(files)
+        deletions = self.github.prepare_deletions(deleted or [])
 
         if dry_run:
             repo_ref = f"{self.config.repo}@{self.config.branch}"
             message = f"Would push {len(blobs)} files to {repo_ref}"
+            if deletions:
+                message += f" (deleting {len(deletions)} orphaned files)"
             if self.config.looker_sync_enabled:
                 message += f" and sync Looker project '{self.config.project_id}'"
             return WriteResult(
                 files_written=[b["path"] for b in blobs],
+                files_deleted=deletions,
                 message=message,
                 metadata={
                     "repo": self.config.repo,
@@ -108,8 +120,21 @@ class LookerDestination:
                 },
             )
 
-        # Step 1: Push to GitHub
-        commit_sha = self.github.create_commit(github_token, blobs)
+        # Step 1: Push to GitHub (only files that differ from the branch)
+        repo_ref = f"{self.config.repo}@{self.config.branch}"
+        commit = self.github.create_commit(github_token, blobs, deletions)
+        if commit.commit_sha is None:
+            return WriteResult(
+                files_written=[],
+                message=f"No changes to push to {repo_ref}",
+                metadata={
+                    "repo": self.config.repo,
+                    "branch": self.config.branch,
+                    "file_count": "0",
+                    "unchanged_count": str(commit.unchanged),
+                },
+            )
+        commit_sha = commit.commit_sha
         commit_url = f"https://github.com/{self.config.repo}/commit/{commit_sha}"
 
         # Step 2: Sync Looker dev environment (if configured)
@@ -128,8 +153,11 @@ class LookerDestination:
                 # Log but don't fail - Git push succeeded
                 self.console.print(f"[yellow]Looker sync failed: {e}[/yellow]")
 
-        repo_ref = f"{self.config.repo}@{self.config.branch}"
-        message = f"Pushed {len(blobs)} files to {repo_ref}"
+        message = f"Pushed {len(commit.changed)} files to {repo_ref}"
+        if commit.unchanged:
+            message += f" ({commit.unchanged} unchanged)"
+        if commit.deleted:
+            message += f" (deleted {len(commit.deleted)} orphaned files)"
         if looker_synced:
             if validation_passed:
                 message += " and synced Looker dev"
@@ -140,7 +168,8 @@ class LookerDestination:
         looker_url = self.looker.build_explore_url(blobs) if validation_passed else None
 
         return WriteResult(
-            files_written=[b["path"] for b in blobs],
+            files_written=commit.changed,
+            files_deleted=commit.deleted,
             destination_url=commit_url,
             looker_url=looker_url,
             message=message,
@@ -148,7 +177,8 @@ class LookerDestination:
             metadata={
                 "repo": self.config.repo,
                 "branch": self.config.branch,
-                "file_count": str(len(blobs)),
+                "file_count": str(len(commit.changed)),
+                "unchanged_count": str(commit.unchanged),
                 "looker_synced": str(looker_synced),
                 "validation_passed": str(validation_passed),
             },
@@ -174,14 +204,14 @@ class LookerDestination:
 
         client_id, client_secret = creds
         try:
-            access_token = self.looker.get_access_token(client_id, client_secret)
+            auth = self.looker.auth(client_id, client_secret)
         except LookerAPIError:
             return True  # Can't validate, assume OK
 
         # Run validation
         self.console.print()
         self.console.print("[dim]Validating LookML...[/dim]")
-        errors = self.sync.validate_lookml(access_token)
+        errors = self.sync.validate_lookml(auth)
 
         if not errors:
             self.console.print("[green]✓[/green] LookML validation passed")
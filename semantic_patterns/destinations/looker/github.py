@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -15,19 +19,67 @@ from semantic_patterns.credentials import (
     github_device_flow,
 )
 from semantic_patterns.destinations.looker.errors import LookerAPIError
+from semantic_patterns.destinations.looker.http import (
+    HTTP2_AVAILABLE,
+    RETRY,
+    AsyncRetryClient,
+    HttpSessions,
+    RetryClient,
+    RetryPolicy,
+    get_http_sessions,
+)
+
+
+def git_blob_sha(content: str) -> str:
+    """The SHA git (and GitHub) gives a blob with this content."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+@dataclass
+class CommitResult:
+    """Outcome of pushing files to the branch.
+
+    Attributes:
+        commit_sha: The new commit, or None when nothing changed
+        changed: Repo paths added or updated by the commit
+        deleted: Repo paths removed by the commit
+        unchanged: Number of files already on the branch with this content
+    """
+
+    commit_sha: str | None
+    changed: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
 
 
 class GitHubClient:
-    """Handle GitHub API operations for pushing LookML."""
+    """Handle GitHub API operations for pushing LookML.
+
+    Small pushes send file contents inline in the git/trees request. Once
+    a push has more than config.large_push_threshold changed files (or
+    LARGE_PUSH_BYTES of content), each file is first uploaded through
+    git/blobs on a bounded async connection pool, with failed blobs
+    retried individually, and the tree is built from the blob SHAs.
+
+    All requests go through the shared retrying HTTP layer (see http.py).
+    """
 
     GITHUB_API_BASE = "https://api.github.com"
     GITHUB_API_VERSION = "2022-11-28"
 
+    # Inline content above this size switches to blob uploads
+    LARGE_PUSH_BYTES = 5 * 1024 * 1024
+
     def __init__(
         self,
         config: LookerConfig,
         project: str,
         console: Console,
+        transport: httpx.BaseTransport | None = None,
+        api_base: str | None = None,
+        retry: RetryPolicy | None = None,
+        sessions: HttpSessions | None = None,
     ) -> None:
         """Initialize GitHub client.
 
@@ -35,10 +87,19 @@ class GitHubClient:
             config: Looker configuration
             project: Project name (for blob path resolution)
             console: Rich console for output
+            transport: httpx transport override (e.g. for tests)
+            api_base: GitHub API URL (defaults to GITHUB_API_BASE)
+            retry: Retry policy for API calls (defaults to RetryPolicy())
+            sessions: Connection pools to use (default: process-wide);
+                unused when a transport is given
         """
         self.config = config
         self.project = project
         self.console = console
+        self.transport = transport
+        self.api_base = (api_base or self.GITHUB_API_BASE).rstrip("/")
+        self.retry = retry or RetryPolicy()
+        self.sessions = sessions if sessions is not None else get_http_sessions()
         self._token: str | None = None
 
     def get_token(self) -> str | None:
@@ -124,7 +185,29 @@ class GitHubClient:
             self.console.print("[red]Invalid choice[/red]")
             return None
 
-    def prepare_blobs(self, files: dict[Path, str]) -> list[dict[str, str]]:
+    def github_path(self, local_path: Path) -> str:
+        """Map a local output path to its path in the GitHub repo.
+
+        Args:
+            local_path: Local path of a generated file
+
+        Returns:
+            Repo path: config.path + relative path from the project
+        """
+        parts = local_path.parts
+        try:
+            project_idx = parts.index(self.project)
+            relative_parts = parts[project_idx:]
+        except ValueError:
+            relative_parts = parts[-3:] if len(parts) >= 3 else parts
+
+        relative_path = "/".join(relative_parts)
+
+        if self.config.path:
+            return f"{self.config.path.rstrip('/')}/{relative_path}"
+        return relative_path
+
+    def prepare_blobs(self, files: Mapping[Path, str]) -> list[dict[str, str]]:
         """Transform local file paths to GitHub blob format.
 
         Args:
@@ -133,80 +216,115 @@ class GitHubClient:
         Returns:
             List of blob dictionaries with 'path' and 'content' keys
         """
-        blobs: list[dict[str, str]] = []
-
-        for local_path, content in files.items():
-            # Build GitHub path: config.path + relative path from project
-            parts = local_path.parts
-            try:
-                project_idx = parts.index(self.project)
-                relative_parts = parts[project_idx:]
-            except ValueError:
-                relative_parts = parts[-3:] if len(parts) >= 3 else parts
+        return [
+            {"path": self.github_path(local_path), "content": content}
+            for local_path, content in files.items()
+        ]
 
-            relative_path = "/".join(relative_parts)
+    def prepare_deletions(self, paths: list[Path]) -> list[str]:
+        """Transform local paths of removed files to GitHub paths.
 
-            if self.config.path:
-                github_path = f"{self.config.path.rstrip('/')}/{relative_path}"
-            else:
-                github_path = relative_path
+        Args:
+            paths: Local paths of files that are no longer generated
 
-            blobs.append(
-                {
-                    "path": github_path,
-                    "content": content,
-                }
-            )
+        Returns:
+            Sorted list of repo paths to delete
+        """
+        return sorted({self.github_path(local_path) for local_path in paths})
 
-        return blobs
+    def create_commit(
+        self,
+        token: str,
+        blobs: list[dict[str, str]],
+        deletions: list[str] | None = None,
+    ) -> CommitResult:
+        """Commit the files that differ from the branch via GitHub API.
 
-    def create_commit(self, token: str, blobs: list[dict[str, str]]) -> str:
-        """Create an atomic commit with all files via GitHub API.
+        The branch's tree under config.path is fetched once and compared
+        with locally computed git blob SHAs, so the new tree only carries
+        added, changed and deleted entries. No commit is made when
+        nothing differs.
 
         Args:
             token: GitHub Personal Access Token
             blobs: List of blob dictionaries with 'path' and 'content'
+            deletions: Repo paths to remove in the same commit
 
         Returns:
-            The commit SHA
+            CommitResult with the commit SHA (None if nothing changed)
 
         Raises:
             LookerAPIError: If the API request fails
         """
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": self.GITHUB_API_VERSION,
-        }
-        base_url = f"{self.GITHUB_API_BASE}/repos/{self.config.repo}"
+        base_url = f"{self.api_base}/repos/{self.config.repo}"
 
-        with httpx.Client(headers=headers, timeout=30.0) as client:
+        with self._http_client(token) as client:
             current_sha = self._get_or_create_branch(client, base_url)
 
             commit_response = client.get(f"{base_url}/git/commits/{current_sha}")
             self._check_response(commit_response, "get current commit")
             base_tree = commit_response.json()["tree"]["sha"]
 
-            tree_items = [
-                {
-                    "path": blob["path"],
-                    "mode": "100644",
-                    "type": "blob",
-                    "content": blob["content"],
-                }
+            remote = self._get_remote_blobs(client, base_url, base_tree, deletions)
+            changed = [
+                blob
                 for blob in blobs
+                if remote.get(blob["path"]) != git_blob_sha(blob["content"])
             ]
+            # GitHub rejects deleting paths the branch doesn't have
+            # (e.g. orphans that were never pushed)
+            deleted = [path for path in deletions or [] if path in remote]
+            result = CommitResult(
+                commit_sha=None,
+                changed=[blob["path"] for blob in changed],
+                deleted=deleted,
+                unchanged=len(blobs) - len(changed),
+            )
+            if not changed and not deleted:
+                return result
+
+            tree_items: list[dict[str, str | None]]
+            if self._is_large_push(changed):
+                shas = asyncio.run(self._create_blobs(token, base_url, changed))
+                tree_items = [
+                    {
+                        "path": blob["path"],
+                        "mode": "100644",
+                        "type": "blob",
+                        "sha": shas[blob["path"]],
+                    }
+                    for blob in changed
+                ]
+            else:
+                tree_items = [
+                    {
+                        "path": blob["path"],
+                        "mode": "100644",
+                        "type": "blob",
+                        "content": blob["content"],
+                    }
+                    for blob in changed
+                ]
+            # A null sha removes the path from the base tree
+            tree_items.extend(
+                {"path": path, "mode": "100644", "type": "blob", "sha": None}
+                for path in deleted
+            )
 
+            # Trees are content-addressed, so a repeated POST is harmless
             tree_response = client.post(
                 f"{base_url}/git/trees",
                 json={"base_tree": base_tree, "tree": tree_items},
+                extensions={RETRY: True},
             )
             self._check_response(tree_response, "create tree")
             new_tree_sha = tree_response.json()["sha"]
 
             commit_message = self.config.commit_message
             if not commit_message.endswith(")"):
-                commit_message = f"{commit_message}\n\n{len(blobs)} files updated"
+                commit_message = f"{commit_message}\n\n{len(changed)} files updated"
+                if deleted:
+                    commit_message += f", {len(deleted)} files deleted"
 
             new_commit_response = client.post(
                 f"{base_url}/git/commits",
@@ -217,15 +335,220 @@ class GitHubClient:
                 },
             )
             self._check_response(new_commit_response, "create commit")
-            new_commit_sha: str = new_commit_response.json()["sha"]
+            result.commit_sha = new_commit_response.json()["sha"]
 
+            # Setting the ref to the same SHA twice is a no-op
             update_ref_response = client.patch(
                 f"{base_url}/git/refs/heads/{self.config.branch}",
-                json={"sha": new_commit_sha},
+                json={"sha": result.commit_sha},
+                extensions={RETRY: True},
             )
             self._check_response(update_ref_response, "update branch ref")
 
-            return new_commit_sha
+            return result
+
+    def _headers(self, token: str) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": self.GITHUB_API_VERSION,
+        }
+
+    def _http_client(self, token: str) -> httpx.Client:
+        """Create an authenticated client for the GitHub API."""
+        if self.transport is not None:
+            return RetryClient(
+                headers=self._headers(token),
+                timeout=30.0,
+                transport=self.transport,
+                policy=self.retry,
+            )
+        return self.sessions.client(
+            headers=self._headers(token), timeout=30.0, policy=self.retry
+        )
+
+    def _is_large_push(self, blobs: list[dict[str, str]]) -> bool:
+        """Whether blobs are too many or too big to send inline in one tree."""
+        if len(blobs) > self.config.large_push_threshold:
+            return True
+        size = sum(len(blob["content"].encode("utf-8")) for blob in blobs)
+        return size > self.LARGE_PUSH_BYTES
+
+    async def _create_blobs(
+        self, token: str, base_url: str, blobs: list[dict[str, str]]
+    ) -> dict[str, str]:
+        """Upload blobs concurrently through git/blobs.
+
+        At most config.blob_workers uploads are in flight at once, over a
+        connection pool of the same size.
+
+        Args:
+            token: GitHub Personal Access Token
+            base_url: Base API URL for the repo
+            blobs: List of blob dictionaries with 'path' and 'content'
+
+        Returns:
+            Mapping of repo path to blob SHA
+
+        Raises:
+            LookerAPIError: If a blob still fails after the retry policy's
+                attempts
+        """
+        workers = self.config.blob_workers
+        limits = httpx.Limits(
+            max_connections=workers, max_keepalive_connections=workers
+        )
+        self.console.print(
+            f"[dim]Uploading {len(blobs)} files to GitHub "
+            f"({workers} concurrent requests)...[/dim]"
+        )
+        # Async pools belong to one event loop, so this one lasts one upload
+        async with AsyncRetryClient(
+            headers=self._headers(token),
+            timeout=30.0,
+            limits=limits,
+            http2=HTTP2_AVAILABLE,
+            policy=self.retry,
+        ) as client:
+            slots = asyncio.Semaphore(workers)
+
+            async def upload(blob: dict[str, str]) -> tuple[str, str]:
+                async with slots:
+                    sha = await self._create_blob(client, base_url, blob)
+                return blob["path"], sha
+
+            results = await asyncio.gather(*(upload(blob) for blob in blobs))
+        return dict(results)
+
+    async def _create_blob(
+        self, client: httpx.AsyncClient, base_url: str, blob: dict[str, str]
+    ) -> str:
+        """Upload one blob (retried by the client on transient failures)."""
+        try:
+            # Blobs are content-addressed, so a repeated POST is harmless
+            response = await client.post(
+                f"{base_url}/git/blobs",
+                json={"content": blob["content"], "encoding": "utf-8"},
+                extensions={RETRY: True},
+            )
+        except httpx.TransportError as e:
+            raise LookerAPIError(
+                f"Failed to upload {blob['path']}: {e}", status_code=None
+            ) from e
+        self._check_response(response, f"create blob {blob['path']}")
+        sha: str = response.json()["sha"]
+        return sha
+
+    def _get_remote_blobs(
+        self,
+        client: httpx.Client,
+        base_url: str,
+        tree_sha: str,
+        deletions: list[str] | None = None,
+    ) -> dict[str, str]:
+        """Blob SHAs of every file under config.path on the branch.
+
+        If GitHub truncates the recursive listing, deletion paths missing
+        from it are looked up folder by folder, so orphans are still
+        removed.
+
+        Args:
+            client: Configured httpx client
+            base_url: Base API URL for the repo
+            tree_sha: SHA of the branch's root tree
+            deletions: Repo paths that must be found even in a truncated
+                listing
+
+        Returns:
+            Mapping of repo path to blob SHA (empty if config.path doesn't
+            exist on the branch yet)
+        """
+        prefix = self.config.path.rstrip("/")
+
+        # Walk down to config.path one level at a time, so only that
+        # subtree is listed recursively
+        for part in filter(None, prefix.split("/")):
+            level_response = client.get(f"{base_url}/git/trees/{tree_sha}")
+            self._check_response(level_response, "get current tree")
+            subtree = next(
+                (
+                    item["sha"]
+                    for item in level_response.json().get("tree", [])
+                    if item["path"] == part and item["type"] == "tree"
+                ),
+                None,
+            )
+            if subtree is None:
+                return {}
+            tree_sha = subtree
+
+        tree_response = client.get(
+            f"{base_url}/git/trees/{tree_sha}", params={"recursive": "1"}
+        )
+        self._check_response(tree_response, "get current tree")
+        data = tree_response.json()
+
+        base = f"{prefix}/" if prefix else ""
+        remote = {
+            f"{base}{item['path']}": item["sha"]
+            for item in data.get("tree", [])
+            if item.get("type") == "blob"
+        }
+        if data.get("truncated"):
+            # Files missing from a truncated listing are just re-uploaded
+            self.console.print(
+                "[yellow]GitHub truncated the repo tree listing; "
+                "some unchanged files may be re-uploaded[/yellow]"
+            )
+            missing = [
+                path.removeprefix(base)
+                for path in deletions or []
+                if path not in remote and path.startswith(base)
+            ]
+            for path, sha in self._find_blobs(
+                client, base_url, tree_sha, missing
+            ).items():
+                remote[f"{base}{path}"] = sha
+        return remote
+
+    def _find_blobs(
+        self, client: httpx.Client, base_url: str, tree_sha: str, paths: list[str]
+    ) -> dict[str, str]:
+        """Blob SHAs of paths in a tree, listing each folder non-recursively.
+
+        Args:
+            client: Configured httpx client
+            base_url: Base API URL for the repo
+            tree_sha: SHA of the tree the paths are relative to
+            paths: File paths relative to that tree
+
+        Returns:
+            Mapping of path to blob SHA for the paths that exist
+        """
+        listings: dict[str, dict[str, Any]] = {}
+
+        def listing(folder: str) -> dict[str, Any]:
+            if folder not in listings:
+                sha: str | None = tree_sha
+                if folder:
+                    parent, _, name = folder.rpartition("/")
+                    item = listing(parent).get(name)
+                    sha = item["sha"] if item and item["type"] == "tree" else None
+                items: dict[str, Any] = {}
+                if sha is not None:
+                    response = client.get(f"{base_url}/git/trees/{sha}")
+                    self._check_response(response, "get current tree")
+                    items = {i["path"]: i for i in response.json().get("tree", [])}
+                listings[folder] = items
+            return listings[folder]
+
+        found: dict[str, str] = {}
+        for path in paths:
+            folder, _, name = path.rpartition("/")
+            item = listing(folder).get(name)
+            if item and item["type"] == "blob":
+                found[path] = item["sha"]
+        return found
 
     def _get_or_create_branch(self, client: httpx.Client, base_url: str) -> str:
         """Get branch SHA, creating the branch if it doesn't exist.
@@ -305,15 +628,10 @@ class GitHubClient:
         Returns:
             The revert commit SHA if successful, None if failed
         """
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": self.GITHUB_API_VERSION,
-        }
-        base_url = f"{self.GITHUB_API_BASE}/repos/{self.config.repo}"
+        base_url = f"{self.api_base}/repos/{self.config.repo}"
 
         try:
-            with httpx.Client(headers=headers, timeout=30.0) as client:
+            with self._http_client(token) as client:
                 # Get the commit we want to revert
                 commit_response = client.get(f"{base_url}/git/commits/{commit_sha}")
                 if commit_response.status_code != 200:
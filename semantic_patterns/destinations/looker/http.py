@@ -0,0 +1,408 @@
+"""Shared HTTP layer for GitHub and Looker API calls.
+
+GitHub and Looker clients are RetryClient / AsyncRetryClient instances,
+which retry transient failures (connection errors, timeouts, 429,
+5xx and GitHub's rate-limit 403s) with exponential backoff and jitter.
+Server-requested waits (Retry-After, X-RateLimit-Reset) are honored when
+short enough. Only idempotent requests are retried after they may have
+been processed (timeouts, 5xx); a POST opts in with extensions={RETRY: True} when
+repeating it is harmless (e.g. content-addressed git blobs).
+
+Each attempt's latency, and any retry, is counted per endpoint in the
+process-wide stats from get_http_stats().
+
+Connections are pooled by HttpSessions: one keep-alive connection pool
+per host (HTTP/2 when the h2 package is installed) that every client in
+the process shares, so a push, its Looker sync and later pushes in the
+same process reuse connections instead of repeating TLS handshakes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import random
+import re
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+# Request extension marking a non-idempotent request as safe to repeat
+RETRY = "sp_retry"
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Errors raised before the request could have reached the server
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Idle pooled connections are kept this long (seconds) for reuse
+KEEPALIVE_EXPIRY = 60.0
+
+# Path segments that vary per call (SHAs, numeric IDs) in endpoint names
+_VARIABLE_SEGMENT = re.compile(r"^(?:[0-9a-f]{40}|\d+)$")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to retry a request.
+
+    Attributes:
+        attempts: Total tries per request, including the first
+        backoff: Base delay in seconds, doubled for each retry
+        max_backoff: Cap on the computed backoff delay
+        max_wait: Longest server-requested wait to honor; a response
+            asking for more is returned as is
+    """
+
+    attempts: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    max_wait: float = 60.0
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (full jitter)."""
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def response_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Delay before retrying response, or None if it shouldn't be retried."""
+        if attempt >= self.attempts:
+            return None
+        headers = response.headers
+        rate_limited = headers.get("x-ratelimit-remaining") == "0"
+        if response.status_code not in RETRY_STATUSES and not (
+            response.status_code == 403 and (rate_limited or "retry-after" in headers)
+        ):
+            return None
+        # A rate-limited request was rejected unprocessed; a 5xx may not
+        # have been, so only repeat it when that is safe
+        if response.status_code >= 500 and not is_retryable(response.request):
+            return None
+
+        wait = _retry_after(headers.get("retry-after"))
+        if wait is None and rate_limited:
+            wait = _rate_limit_reset(headers.get("x-ratelimit-reset"))
+        if wait is None:
+            return self.backoff_delay(attempt)
+        if wait > self.max_wait:
+            return None
+        # Spread out clients that were all told to come back at once
+        return wait + random.uniform(0, self.backoff)
+
+    def error_delay(
+        self, request: httpx.Request, error: httpx.TransportError, attempt: int
+    ) -> float | None:
+        """Delay before retrying after error, or None to raise it."""
+        if attempt >= self.attempts:
+            return None
+        if not isinstance(error, _NOT_SENT) and not is_retryable(request):
+            return None
+        return self.backoff_delay(attempt)
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _rate_limit_reset(value: str | None) -> float | None:
+    """Seconds until an X-RateLimit-Reset epoch timestamp."""
+    try:
+        return max(0.0, float(value) - time.time()) if value else None
+    except ValueError:
+        return None
+
+
+def is_retryable(request: httpx.Request) -> bool:
+    """Whether request can be repeated after it may have been received."""
+    return request.method in IDEMPOTENT_METHODS or bool(request.extensions.get(RETRY))
+
+
+def endpoint_name(request: httpx.Request) -> str:
+    """Stats key for request: method, host and path with IDs/SHAs collapsed."""
+    segments = [
+        ":id" if _VARIABLE_SEGMENT.match(segment) else segment
+        for segment in request.url.path.split("/")
+    ]
+    return f"{request.method} {request.url.host}{'/'.join(segments)}"
+
+
+@dataclass
+class EndpointStats:
+    """Counters for one endpoint."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean latency per attempt in milliseconds."""
+        return self.seconds * 1000 / self.requests if self.requests else 0.0
+
+
+class HttpStats:
+    """Thread-safe per-endpoint request, retry and latency counters."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        request: httpx.Request,
+        seconds: float,
+        retried: bool = False,
+        error: bool = False,
+    ) -> None:
+        """Count one attempt at request."""
+        name = endpoint_name(request)
+        with self._lock:
+            stats = self._endpoints.setdefault(name, EndpointStats())
+            stats.requests += 1
+            stats.seconds += seconds
+            stats.retries += retried
+            stats.errors += error
+
+    def snapshot(self) -> dict[str, EndpointStats]:
+        """Copy of the counters, by endpoint name."""
+        with self._lock:
+            return {
+                name: EndpointStats(s.requests, s.retries, s.errors, s.seconds)
+                for name, s in sorted(self._endpoints.items())
+            }
+
+    @property
+    def retries(self) -> int:
+        """Total retries across endpoints."""
+        with self._lock:
+            return sum(s.retries for s in self._endpoints.values())
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+_stats = HttpStats()
+
+
+def get_http_stats() -> HttpStats:
+    """The process-wide stats recorded by retrying clients."""
+    return _stats
+
+
+class RetryClient(httpx.Client):
+    """httpx.Client that retries transient failures per a RetryPolicy.
+
+    Retries wrap send(), so proxies from the environment, redirects and
+    custom transports all work as with a plain httpx.Client.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: RetryPolicy | None = None,
+        stats: HttpStats | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.policy = policy or RetryPolicy()
+        self.stats = stats or _stats
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        attempt = 1
+        while True:
+            start = time.perf_counter()
+            try:
+                response = super().send(request, **kwargs)
+            except httpx.TransportError as e:
+                delay = self.policy.error_delay(request, e, attempt)
+                self.stats.record(
+                    request,
+                    time.perf_counter() - start,
+                    retried=delay is not None,
+                    error=delay is None,
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.response_delay(response, attempt)
+                self.stats.record(
+                    request, time.perf_counter() - start, retried=delay is not None
+                )
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+
+class AsyncRetryClient(httpx.AsyncClient):
+    """Async counterpart of RetryClient."""
+
+    def __init__(
+        self,
+        *,
+        policy: RetryPolicy | None = None,
+        stats: HttpStats | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.policy = policy or RetryPolicy()
+        self.stats = stats or _stats
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        attempt = 1
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await super().send(request, **kwargs)
+            except httpx.TransportError as e:
+                delay = self.policy.error_delay(request, e, attempt)
+                self.stats.record(
+                    request,
+                    time.perf_counter() - start,
+                    retried=delay is not None,
+                    error=delay is None,
+                )
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.response_delay(response, attempt)
+                self.stats.record(
+                    request, time.perf_counter() - start, retried=delay is not None
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def proxy_for(url: httpx.URL) -> str | None:
+    """Proxy the environment (HTTPS_PROXY, NO_PROXY, ...) sets for url."""
+    if urllib.request.proxy_bypass(url.host):
+        return None
+    proxies = urllib.request.getproxies()
+    return proxies.get(url.scheme) or proxies.get("all")
+
+
+# (host, port, scheme, verify on/off)
+_PoolKey = tuple[str, int | None, str, bool]
+
+
+class _HostTransport(httpx.BaseTransport):
+    """Routes each request to its host's pooled transport in HttpSessions.
+
+    Closing it (e.g. when a client's `with` block ends) leaves the pools
+    open; they belong to the HttpSessions.
+    """
+
+    def __init__(self, sessions: HttpSessions, verify: Any) -> None:
+        self.sessions = sessions
+        self.verify = verify
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self.sessions.transport_for(request.url, self.verify)
+        return transport.handle_request(request)
+
+
+class HttpSessions:
+    """
+    Pooled connections shared by API clients, one pool per host.
+
+    Clients from client() are cheap to create and close: their requests
+    are routed to a long-lived transport for the request's host, so
+    connections (and TLS sessions) stay open between calls, between the
+    steps of a push and across pushes in one process (e.g. watch mode).
+    Each host's pool uses the proxy the environment configures for it.
+
+    Usage:
+        sessions = get_http_sessions()
+        with sessions.client(headers=headers, timeout=30.0) as client:
+            client.get("https://api.github.com/...")
+    """
+
+    def __init__(self, http2: bool | None = None) -> None:
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._transports: dict[_PoolKey, httpx.BaseTransport] = {}
+        self._lock = threading.Lock()
+
+    def client(
+        self,
+        *,
+        verify: Any = True,
+        policy: RetryPolicy | None = None,
+        **kwargs: Any,
+    ) -> RetryClient:
+        """A retrying client that sends requests over the shared pools.
+
+        Args:
+            verify: SSL verification setting for the pools it uses
+            policy: Retry policy (default: RetryPolicy())
+            **kwargs: Passed to httpx.Client (base_url, headers, timeout, ...)
+        """
+        return RetryClient(
+            transport=_HostTransport(self, verify), policy=policy, **kwargs
+        )
+
+    def transport_for(self, url: httpx.URL, verify: Any = True) -> httpx.BaseTransport:
+        """The pooled transport for url's host, created on first use."""
+        # SSL contexts aren't hashable; pools differ only by verify on/off
+        key = (url.host, url.port, url.scheme, verify is not False)
+        transport = self._transports.get(key)
+        if transport is None:
+            with self._lock:
+                transport = self._transports.get(key)
+                if transport is None:
+                    transport = self._create_transport(url, verify)
+                    self._transports[key] = transport
+        return transport
+
+    def _create_transport(self, url: httpx.URL, verify: Any) -> httpx.BaseTransport:
+        return httpx.HTTPTransport(
+            verify=verify,
+            http2=self.http2,
+            proxy=proxy_for(url),
+            limits=httpx.Limits(keepalive_expiry=KEEPALIVE_EXPIRY),
+        )
+
+    def __len__(self) -> int:
+        return len(self._transports)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            transports, self._transports = self._transports, {}
+        for transport in transports.values():
+            transport.close()
+
+
+_sessions = HttpSessions()
+atexit.register(_sessions.close)
+
+
+def get_http_sessions() -> HttpSessions:
+    """The process-wide connection pools used by GitHub and Looker clients."""
+    return _sessions
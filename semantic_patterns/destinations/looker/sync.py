@@ -49,23 +49,21 @@ class DevSync:
 
         client_id, client_secret = creds
 
-        # Get access token
-        access_token = self.looker_client.get_access_token(client_id, client_secret)
+        # Get access token (cached, and refreshed if Looker rejects it)
+        auth = self.looker_client.auth(client_id, client_secret)
 
         self.console.print()
         self.console.print(
             f"[dim]Syncing Looker dev environment to branch '{self.config.branch}'...[/dim]"
         )
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = {"Content-Type": "application/json"}
 
         try:
-            with httpx.Client(
+            with self.looker_client.sessions.client(
                 base_url=f"{self.config.base_url}/api/4.0",
                 headers=headers,
+                auth=auth,
                 timeout=30.0,
             ) as client:
                 # Step 1: Switch to dev workspace
@@ -331,24 +329,22 @@ class DevSync:
                 f"[green]✓[/green] Looker dev synced to branch '{self.config.branch}'"
             )
 
-    def validate_lookml(self, access_token: str) -> list[dict[str, Any]]:
+    def validate_lookml(self, auth: httpx.Auth) -> list[dict[str, Any]]:
         """Validate LookML in the current Looker dev workspace.
 
         Args:
-            access_token: Looker API access token
+            auth: Looker API auth (see LookerClient.auth)
 
         Returns:
             List of validation errors (empty if valid)
         """
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = {"Content-Type": "application/json"}
 
         try:
-            with httpx.Client(
+            with self.looker_client.sessions.client(
                 base_url=f"{self.config.base_url}/api/4.0",
                 headers=headers,
+                auth=auth,
                 timeout=60.0,  # Validation can take a while
             ) as client:
                 validation_response = client.get(
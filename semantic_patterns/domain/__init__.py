@@ -15,6 +15,7 @@ from semantic_patterns.domain.dimension import (
     TimeGranularity,
     TimezoneVariant,
 )
+from semantic_patterns.domain.entity_graph import EntityGraph
 from semantic_patterns.domain.filter import Filter, FilterCondition, FilterOperator
 from semantic_patterns.domain.measure import AggregationType, Measure
 from semantic_patterns.domain.metric import (
@@ -34,6 +35,8 @@ __all__ = [
     # Data Model
     "ConnectionType",
     "DataModel",
+    # Entity graph
+    "EntityGraph",
     # Dimension
     "Dimension",
     "DimensionType",
@@ -0,0 +1,175 @@
+"""Entity graph - index of how models link through their entities."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from semantic_patterns.domain.model import Entity, ProcessedModel
+
+# (model, entity) pairs, in model order then entity order
+EntityRefs = list[tuple[ProcessedModel, Entity]]
+
+
+class EntityHop(NamedTuple):
+    """One many-to-one step: source's foreign entity -> target's primary entity."""
+
+    source: ProcessedModel
+    foreign_entity: Entity
+    target: ProcessedModel
+    target_entity: Entity
+
+
+class EntityGraph:
+    """
+    Models indexed by the entities they declare.
+
+    Built once per set of models, so join inference for each explore is a
+    few dict lookups instead of scans over every model. Lookups keep the
+    order of the models passed in; where several models share a primary
+    entity, the last one wins.
+
+    Usage:
+        graph = EntityGraph(models)
+        for foreign, target, target_entity in graph.parents(fact):
+            ...
+        for child, child_entity in graph.children(fact):
+            ...
+        for path in graph.paths(fact, max_depth=3):
+            ...  # path[-1].target is reached in len(path) hops
+    """
+
+    def __init__(self, models: Iterable[ProcessedModel]) -> None:
+        self.models: dict[str, ProcessedModel] = {}
+        self.primary: dict[str, EntityRefs] = {}
+        self.foreign: dict[str, EntityRefs] = {}  # Reverse index: who points here
+
+        for model in models:
+            self.models[model.name] = model
+        for model in self.models.values():
+            for entity in model.entities:
+                if entity.type == "primary":
+                    self.primary.setdefault(entity.name, []).append((model, entity))
+                elif entity.type == "foreign":
+                    self.foreign.setdefault(entity.name, []).append((model, entity))
+        self._paths: dict[
+            tuple[str, int, frozenset[str]], list[tuple[EntityHop, ...]]
+        ] = {}
+
+    @classmethod
+    def ensure(
+        cls,
+        graph: EntityGraph | None,
+        models: dict[str, ProcessedModel],
+    ) -> EntityGraph:
+        """Return graph, or build one for models when none was passed."""
+        return graph if graph is not None else cls(models.values())
+
+    def primary_model(
+        self,
+        entity_name: str,
+        skip: Callable[[ProcessedModel], bool] | None = None,
+    ) -> tuple[ProcessedModel, Entity] | None:
+        """The model whose primary entity is entity_name.
+
+        Args:
+            entity_name: Entity to look up
+            skip: Models for which this returns True are passed over
+        """
+        for model, entity in reversed(self.primary.get(entity_name, [])):
+            if skip is None or not skip(model):
+                return model, entity
+        return None
+
+    def parents(
+        self,
+        model: ProcessedModel,
+        skip: Callable[[ProcessedModel], bool] | None = None,
+    ) -> list[tuple[Entity, ProcessedModel, Entity]]:
+        """Models that model's foreign entities point at.
+
+        Returns:
+            (foreign entity on model, target model, target primary entity)
+            for each foreign entity with a target, in entity order
+        """
+
+        def skip_target(target: ProcessedModel) -> bool:
+            return target.name == model.name or (skip is not None and skip(target))
+
+        parents: list[tuple[Entity, ProcessedModel, Entity]] = []
+        for foreign in model.foreign_entities:
+            found = self.primary_model(foreign.name, skip_target)
+            if found is not None:
+                parents.append((foreign, *found))
+        return parents
+
+    def children(
+        self,
+        model: ProcessedModel,
+        skip: Callable[[ProcessedModel], bool] | None = None,
+    ) -> EntityRefs:
+        """Models with a foreign entity pointing at model's primary entity.
+
+        Returns:
+            (child model, its foreign entity) pairs, in model order
+        """
+        primary = model.primary_entity
+        if primary is None:
+            return []
+        return [
+            (child, entity)
+            for child, entity in self.foreign.get(primary.name, [])
+            if child.name != model.name and (skip is None or not skip(child))
+        ]
+
+    def paths(
+        self,
+        model: ProcessedModel,
+        max_depth: int,
+        exclude: frozenset[str] = frozenset(),
+    ) -> list[tuple[EntityHop, ...]]:
+        """Shortest many-to-one paths from model to every model it reaches.
+
+        A breadth-first walk along foreign -> primary entity links (the
+        same links as parents()), up to max_depth hops. Each model is
+        reached once, by its shortest path, so cycles end the walk. Results
+        are cached per (model, max_depth, exclude).
+
+        Args:
+            model: Model to start from (e.g. an explore's fact)
+            max_depth: Maximum number of hops
+            exclude: Names of models that are neither reached nor walked
+                through
+
+        Returns:
+            One path per reached model, in breadth-first order; path[-1]
+            is the hop into the reached model
+        """
+        key = (model.name, max_depth, exclude)
+        cached = self._paths.get(key)
+        if cached is not None:
+            return cached
+
+        def skip(target: ProcessedModel) -> bool:
+            return target.name in exclude
+
+        paths: list[tuple[EntityHop, ...]] = []
+        visited = {model.name}
+        queue: deque[tuple[ProcessedModel, tuple[EntityHop, ...]]] = deque(
+            [(model, ())]
+        )
+        while queue:
+            source, path = queue.popleft()
+            if len(path) >= max_depth:
+                continue
+            for foreign, target, target_entity in self.parents(source, skip):
+                if target.name in visited:
+                    continue
+                visited.add(target.name)
+                target_path = (*path, EntityHop(source, foreign, target, target_entity))
+                paths.append(target_path)
+                queue.append((target, target_path))
+
+        self._paths[key] = paths
+        return paths
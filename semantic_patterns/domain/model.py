@@ -65,6 +65,9 @@ class ProcessedModel(BaseModel):
     # Metadata
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    # Source files this model was built from (for incremental builds)
+    source_files: list[str] = Field(default_factory=list)
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def primary_entity(self) -> Entity | None:
@@ -1,7 +1,17 @@
 """Ingestion layer - YAML loading and domain building."""
 
 from semantic_patterns.ingestion.builder import DomainBuilder
-from semantic_patterns.ingestion.dbt import DbtLoader, DbtMapper
+from semantic_patterns.ingestion.dbt import (
+    DbtLoader,
+    DbtMapper,
+    SemanticManifestLoader,
+)
 from semantic_patterns.ingestion.loader import YamlLoader
 
-__all__ = ["YamlLoader", "DomainBuilder", "DbtLoader", "DbtMapper"]
+__all__ = [
+    "YamlLoader",
+    "DomainBuilder",
+    "DbtLoader",
+    "DbtMapper",
+    "SemanticManifestLoader",
+]
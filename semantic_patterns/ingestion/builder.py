@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from semantic_patterns.domain import (
     AggregationType,
@@ -25,6 +25,16 @@ from semantic_patterns.domain import (
 )
 from semantic_patterns.ingestion.loader import YamlLoader
 
+if TYPE_CHECKING:
+    from semantic_patterns.ingestion.cache import ParseCache
+
+
+def _item_source(item: Any, doc_source: str | None) -> str | None:
+    """Source file of a collected item, falling back to its document's."""
+    if isinstance(item, dict):
+        return item.get("_source_file", doc_source)
+    return doc_source
+
 
 class DomainBuilder:
     """
@@ -37,22 +47,37 @@ class DomainBuilder:
         self._data_models: dict[str, DataModel] = {}
         self._semantic_models: list[dict[str, Any]] = []
         self._metrics: list[dict[str, Any]] = []
+        # Primary entity name -> (collection position, metric), built once
+        # collection finishes so each model's lookup is O(its metrics)
+        self._metrics_by_entity: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        # Source file of each collected item (parallel to the lists above)
+        self._data_model_sources: dict[str, str] = {}
+        self._semantic_model_sources: list[str | None] = []
+        self._metric_sources: list[str | None] = []
 
     @classmethod
-    def from_directory(cls, path: str | Path) -> list[ProcessedModel]:
+    def from_directory(
+        cls,
+        path: str | Path,
+        workers: int = 1,
+        cache: ParseCache | None = None,
+        ignore: list[str] | None = None,
+    ) -> list[ProcessedModel]:
         """
         Load YAML files from directory and build domain models.
 
         Returns list of ProcessedModel (semantic layer domain objects).
         Explore configuration is LookML-specific and handled by the adapter.
         """
-        builder = cls()
-        loader = YamlLoader(path)
-        documents = loader.load_all()
+        loader = YamlLoader(path, workers=workers, cache=cache, ignore=ignore)
+        return cls.from_documents(loader.load_all())
 
+    @classmethod
+    def from_documents(cls, documents: list[dict[str, Any]]) -> list[ProcessedModel]:
+        """Build domain models from already-parsed YAML documents."""
+        builder = cls()
         for doc in documents:
             builder._collect_from_document(doc)
-
         return builder.build()
 
     @classmethod
@@ -76,26 +101,52 @@ class DomainBuilder:
 
     def _collect_from_document(self, doc: dict[str, Any]) -> None:
         """Collect data models, semantic models, and metrics from YAML."""
+        # Items may carry their own _source_file (dbt); otherwise the
+        # document's applies
+        doc_source = doc.get("_source_file")
+
         # Collect data models
         for dm in doc.get("data_models", []):
             data_model = self._build_data_model(dm)
             self._data_models[data_model.name] = data_model
+            source = _item_source(dm, doc_source)
+            if source:
+                self._data_model_sources[data_model.name] = source
 
         # Collect semantic models
-        self._semantic_models.extend(doc.get("semantic_models", []))
+        for sm in doc.get("semantic_models", []):
+            self._semantic_models.append(sm)
+            self._semantic_model_sources.append(_item_source(sm, doc_source))
 
         # Collect metrics
-        self._metrics.extend(doc.get("metrics", []))
+        for metric in doc.get("metrics", []):
+            self._metrics.append(metric)
+            self._metric_sources.append(_item_source(metric, doc_source))
         # Note: 'explores' in YAML is LookML-specific config, parsed by adapter
 
     def build(self) -> list[ProcessedModel]:
         """Build all ProcessedModel objects."""
+        self._index_metrics()
         models = []
-        for sm in self._semantic_models:
+        for sm, source in zip(self._semantic_models, self._semantic_model_sources):
             model = self._build_processed_model(sm)
+            model.source_files = self._model_sources(model, source)
             models.append(model)
         return models
 
+    def _model_sources(self, model: ProcessedModel, source: str | None) -> list[str]:
+        """Collect the source files that contributed to a built model."""
+        sources: set[str] = set()
+        if source:
+            sources.add(source)
+        if model.data_model and model.data_model.name in self._data_model_sources:
+            sources.add(self._data_model_sources[model.data_model.name])
+        for position, _ in self._matching_metrics(model.entities):
+            metric_source = self._metric_sources[position]
+            if metric_source:
+                sources.add(metric_source)
+        return sorted(sources)
+
     def _build_data_model(self, data: dict[str, Any]) -> DataModel:
         """Build DataModel from dict."""
         connection_str = data.get("connection", "redshift")
@@ -162,21 +213,38 @@ class DomainBuilder:
             meta=data.get("meta", {}),
         )
 
+    def _index_metrics(self) -> None:
+        """Index collected metrics by the entity they belong to."""
+        self._metrics_by_entity = {}
+        for position, metric in enumerate(self._metrics):
+            metric_entity = metric.get("entity")
+            if metric_entity:
+                self._metrics_by_entity.setdefault(metric_entity, []).append(
+                    (position, metric)
+                )
+
     def _get_metrics_for_model(
         self, model_name: str, entities: list[Entity]
     ) -> list[dict[str, Any]]:
         """Get metrics that belong to a model (by primary entity reference)."""
+        return [metric for _, metric in self._matching_metrics(entities)]
+
+    def _matching_metrics(
+        self, entities: list[Entity]
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Get (position, metric) pairs for metrics on the primary entities."""
         # Get PRIMARY entity names only - metrics belong to their primary model
         primary_entity_names = {e.name for e in entities if e.type == "primary"}
 
-        # Filter metrics by entity field matching the model's primary entity
-        matching_metrics = []
-        for metric in self._metrics:
-            metric_entity = metric.get("entity")
-            if metric_entity and metric_entity in primary_entity_names:
-                matching_metrics.append(metric)
+        # Look up metrics whose entity matches the model's primary entity,
+        # keeping the order they were collected in
+        matching: list[tuple[int, dict[str, Any]]] = []
+        for entity_name in primary_entity_names:
+            matching.extend(self._metrics_by_entity.get(entity_name, []))
+        if len(primary_entity_names) > 1:
+            matching.sort(key=lambda item: item[0])
 
-        return matching_metrics
+        return matching
 
     def _build_entity(self, data: dict[str, Any]) -> Entity:
         """Build Entity from dict."""
@@ -206,9 +274,7 @@ class DomainBuilder:
             Updated list of measures with resolved expressions
         """
         # Find primary entity
-        primary_entity = next(
-            (e for e in entities if e.type == "primary"), None
-        )
+        primary_entity = next((e for e in entities if e.type == "primary"), None)
 
         if not primary_entity:
             return measures
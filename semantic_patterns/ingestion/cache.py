@@ -0,0 +1,98 @@
+"""Persistent parse cache for semantic model YAML files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from semantic_patterns.cache import DiskCache, MemoryCache, cache_key
+
+
+class ParseCache:
+    """
+    Cache of parsed YAML documents, keyed by source file path.
+
+    An entry is reused when the file's mtime and size are unchanged. If
+    they differ (e.g. after a checkout that touched the file) the content
+    hash is compared before falling back to a re-parse, so only files
+    whose bytes actually changed are parsed again.
+    """
+
+    NAMESPACE = "parse"
+
+    def __init__(self, cache: DiskCache) -> None:
+        self._cache = cache
+        # Stat taken at lookup time for each miss, so a file edited while
+        # it is being parsed is never stored with its newer stat
+        self._pending: dict[str, os.stat_result] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, cache_dir: Path, max_size_mb: int) -> ParseCache:
+        """Open (or create) the parse cache under cache_dir."""
+        return cls(DiskCache(cache_dir, cls.NAMESPACE, max_size_mb * 1024 * 1024))
+
+    @classmethod
+    def in_memory(cls, max_size_mb: int) -> ParseCache:
+        """Create a parse cache held in memory (e.g. for watch mode)."""
+        return cls(MemoryCache(cls.NAMESPACE, max_size_mb * 1024 * 1024))
+
+    def _key(self, file_path: Path) -> str:
+        return cache_key(self.NAMESPACE, str(file_path.resolve()))
+
+    def get(self, file_path: Path) -> dict[str, Any] | None:
+        """Return the cached document for an unchanged file, else None."""
+        key = self._key(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            doc: dict[str, Any] = entry["doc"]
+            if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                self.hits += 1
+                return doc
+
+            # Stat changed - reuse the entry only if the content is identical
+            digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            if digest == entry["digest"]:
+                self._store(key, stat, digest, doc)
+                self.hits += 1
+                return doc
+
+        self.misses += 1
+        self._pending[key] = stat
+        return None
+
+    def put(self, file_path: Path, digest: str, doc: dict[str, Any]) -> None:
+        """Store a freshly parsed document for file_path."""
+        key = self._key(file_path)
+        stat = self._pending.pop(key, None)
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                return
+        self._store(key, stat, digest, doc)
+
+    def _store(
+        self, key: str, stat: os.stat_result, digest: str, doc: dict[str, Any]
+    ) -> None:
+        self._cache.put(
+            key,
+            {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "digest": digest,
+                "doc": doc,
+            },
+        )
+
+    def save(self) -> None:
+        """Persist the cache index, evicting entries over the size cap."""
+        self._cache.save()
@@ -10,6 +10,7 @@ from semantic_patterns.ingestion.dbt.mapper import (
     map_semantic_model,
     parse_jinja_filter,
 )
+from semantic_patterns.ingestion.dbt.semantic_manifest import SemanticManifestLoader
 
 __all__ = [
     "DbtLoader",
@@ -20,4 +21,5 @@ __all__ = [
     "map_metric",
     "map_semantic_model",
     "parse_jinja_filter",
+    "SemanticManifestLoader",
 ]
@@ -409,11 +409,12 @@ def map_metric(dbt_metric: dict[str, Any]) -> dict[str, Any]:
     metric_type = dbt_metric.get("type", "simple")
 
     if metric_type == "simple":
-        if "measure" in type_params:
-            result["measure"] = type_params["measure"]
-        # Handle measure as dict with name key
-        elif isinstance(type_params.get("measure"), dict):
-            result["measure"] = type_params["measure"].get("name")
+        measure = type_params.get("measure")
+        # Handle measure as dict with name key (semantic_manifest.json)
+        if isinstance(measure, dict):
+            result["measure"] = measure.get("name")
+        elif measure is not None:
+            result["measure"] = measure
 
     elif metric_type == "derived":
         if "expr" in type_params:
@@ -582,12 +583,16 @@ class DbtMapper:
         """Add dbt semantic models to be mapped."""
         for model in dbt_models:
             mapped = map_semantic_model(model)
+            if "_source_file" in model:
+                mapped["_source_file"] = model["_source_file"]
             self._semantic_models.append(mapped)
 
     def add_metrics(self, dbt_metrics: list[dict[str, Any]]) -> None:
         """Add dbt metrics to be mapped."""
         for metric in dbt_metrics:
             mapped = map_metric(metric)
+            if "_source_file" in metric:
+                mapped["_source_file"] = metric["_source_file"]
             self._metrics.append(mapped)
 
     def get_documents(self) -> list[dict[str, Any]]:
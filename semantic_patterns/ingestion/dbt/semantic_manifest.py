@@ -0,0 +1,123 @@
+"""SemanticManifestLoader - loads dbt's compiled semantic_manifest.json."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+# Default location of the artifact written by `dbt parse`
+SEMANTIC_MANIFEST_PATH = Path("target") / "semantic_manifest.json"
+
+
+class SemanticManifestLoader:
+    """
+    Load semantic models and metrics from dbt's semantic_manifest.json.
+
+    dbt writes this artifact on every `dbt parse` / `dbt compile`. Reading
+    it avoids walking and parsing the project's YAML, and picks up the
+    models exactly as dbt resolved them.
+
+    The manifest is normalized to the shape DbtLoader returns for YAML
+    files, so the result can go straight into DbtMapper:
+    - explicit ``null`` values are dropped
+    - ``node_relation.alias`` becomes ``model`` (the table name)
+    - ``where_filters`` become the list of Jinja filter strings
+    - entity and dimension ``expr`` default to the name, as in dbt
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load_all(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Load all semantic models and metrics.
+
+        Returns:
+            Tuple of (semantic_models, metrics)
+
+        Raises:
+            FileNotFoundError: If the manifest does not exist
+            ValueError: If the file is not a semantic manifest
+        """
+        manifest = self._load_file()
+        source = str(self.path)
+
+        semantic_models: list[dict[str, Any]] = []
+        for sm in manifest.get("semantic_models") or []:
+            model = _normalize_semantic_model(_drop_nulls(sm))
+            model["_source_file"] = source
+            semantic_models.append(model)
+
+        metrics: list[dict[str, Any]] = []
+        for m in manifest.get("metrics") or []:
+            metric = _normalize_metric(_drop_nulls(m))
+            metric["_source_file"] = source
+            metrics.append(metric)
+
+        return semantic_models, metrics
+
+    def _load_file(self) -> dict[str, Any]:
+        """Read and decode the manifest JSON."""
+        if not self.path.exists():
+            raise FileNotFoundError(f"File not found: {self.path}")
+
+        with open(self.path, "rb") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in {self.path}: {e}") from e
+
+        if not isinstance(data, dict) or "semantic_models" not in data:
+            raise ValueError(f"Not a dbt semantic manifest: {self.path}")
+        return data
+
+    @classmethod
+    def from_project(cls, project_dir: str | Path) -> SemanticManifestLoader:
+        """Create loader for <project_dir>/target/semantic_manifest.json."""
+        return cls(Path(project_dir) / SEMANTIC_MANIFEST_PATH)
+
+
+def _drop_nulls(value: Any) -> Any:
+    """Recursively remove None values from dicts."""
+    if isinstance(value, dict):
+        return {k: _drop_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_nulls(v) for v in value]
+    return value
+
+
+def _normalize_filter(dbt_filter: Any) -> list[str]:
+    """Convert {"where_filters": [{"where_sql_template": ...}]} to a list."""
+    if not isinstance(dbt_filter, dict):
+        return dbt_filter if isinstance(dbt_filter, list) else []
+    return [
+        f["where_sql_template"]
+        for f in dbt_filter.get("where_filters", [])
+        if isinstance(f, dict) and "where_sql_template" in f
+    ]
+
+
+def _normalize_semantic_model(sm: dict[str, Any]) -> dict[str, Any]:
+    """Reshape a manifest semantic model to the YAML layout."""
+    relation = sm.pop("node_relation", {})
+    if "model" not in sm and relation.get("alias"):
+        sm["model"] = relation["alias"]
+
+    for item in sm.get("entities", []) + sm.get("dimensions", []):
+        item.setdefault("expr", item["name"])
+
+    return sm
+
+
+def _normalize_metric(metric: dict[str, Any]) -> dict[str, Any]:
+    """Reshape a manifest metric to the YAML layout."""
+    if "filter" in metric:
+        metric["filter"] = _normalize_filter(metric["filter"])
+
+    # Empty defaults like metrics: [] and input_measures: [] only add noise
+    type_params = metric.get("type_params", {})
+    for key in [k for k, v in type_params.items() if v == []]:
+        del type_params[key]
+
+    return metric
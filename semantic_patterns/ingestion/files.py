@@ -0,0 +1,222 @@
+"""YAML file discovery and parsing shared by YamlLoader and DbtLoader."""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+if TYPE_CHECKING:
+    from semantic_patterns.ingestion.cache import ParseCache
+
+YAML_SUFFIXES = (".yml", ".yaml")
+
+# Never searched for semantic models: hidden and tool directories at any
+# depth, plus dbt build artifacts, installed packages and semantic-patterns'
+# own config file at the top of the input directory only
+DEFAULT_IGNORE = [
+    ".*",
+    "__pycache__/",
+    "node_modules/",
+    "/venv/",
+    "/target/",
+    "/dbt_packages/",
+    "/logs/",
+    "/sp.yml",
+    "/sp.yaml",
+]
+
+# Per-project ignore file, read from the input directory
+IGNORE_FILE = ".spignore"
+
+# Top-level keys the loaders read; files without any of them are skipped
+SECTION_KEYS = frozenset({b"semantic_models", b"data_models", b"metrics"})
+
+_TOP_LEVEL_KEY = re.compile(rb"""^["']?([\w.-]+)["']?\s*:(?:\s|$)""")
+
+
+def read_ignore_file(base_path: Path) -> list[str]:
+    """Read patterns from <base_path>/.spignore (one per line, # comments)."""
+    try:
+        lines = (base_path / IGNORE_FILE).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    patterns = [line.strip() for line in lines]
+    return [p for p in patterns if p and not p.startswith("#")]
+
+
+def _is_ignored(rel_path: str, name: str, is_dir: bool, patterns: list[str]) -> bool:
+    """Match gitignore-style patterns against a path relative to the base.
+
+    Patterns containing a slash match the relative path, others match the
+    name at any depth; a trailing slash only matches directories.
+    """
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if not is_dir:
+                continue
+            pattern = pattern.rstrip("/")
+        if "/" in pattern:
+            if fnmatch.fnmatch(rel_path, pattern.lstrip("/")):
+                return True
+        elif fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+def find_yaml_files(base_path: Path, ignore: list[str] | None = None) -> list[Path]:
+    """
+    Find all .yml and .yaml files recursively, sorted for determinism.
+
+    Walks the tree once with os.scandir, pruning ignored directories
+    instead of descending into them.
+
+    Args:
+        base_path: Directory to search
+        ignore: Extra patterns on top of DEFAULT_IGNORE and .spignore
+
+    Returns:
+        Sorted list of YAML file paths
+    """
+    patterns = [*DEFAULT_IGNORE, *read_ignore_file(base_path), *(ignore or [])]
+    files: list[Path] = []
+    seen: set[tuple[int, int]] = set()
+    stack: list[tuple[str, str]] = [(str(base_path), "")]
+
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            stat = os.stat(directory)
+            if (stat.st_dev, stat.st_ino) in seen:
+                # Symlink loop
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if _is_ignored(rel_path, entry.name, is_dir, patterns):
+                continue
+            if is_dir:
+                stack.append((entry.path, f"{rel_path}/"))
+            elif entry.name.endswith(YAML_SUFFIXES):
+                files.append(Path(entry.path))
+
+    return sorted(files)
+
+
+def may_contain_models(raw: bytes) -> bool:
+    """
+    Cheap pre-check for whether a YAML file needs a full parse.
+
+    Returns False only for block mappings whose top-level keys include
+    none of SECTION_KEYS (dbt_project.yml, schema.yml, ...). Anything
+    else, such as flow style or a list root, is left to the YAML parser.
+    """
+    for line in raw.splitlines():
+        if not line.strip() or line[:1] in (b" ", b"\t", b"#"):
+            continue
+        if line.startswith((b"---", b"...", b"%")):
+            continue
+        match = _TOP_LEVEL_KEY.match(line)
+        if match is None or match.group(1) in SECTION_KEYS:
+            return True
+    return False
+
+
+def parse_yaml_file(file_path: Path) -> dict[str, Any]:
+    """
+    Load and parse a single YAML file.
+
+    Module-level (rather than a loader method) so it can be shipped to
+    worker processes by parse_yaml_files.
+    """
+    return _parse_with_digest(file_path)[0]
+
+
+def _parse_with_digest(file_path: Path) -> tuple[dict[str, Any], str]:
+    """Parse a YAML file, also returning the sha256 of its raw bytes."""
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    raw = file_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if not may_contain_models(raw):
+        return {}, digest
+
+    content = yaml.safe_load(raw.decode("utf-8"))
+
+    if content is None:
+        return {}, digest
+
+    if not isinstance(content, dict):
+        raise ValueError(f"Expected dict at root of {file_path}, got {type(content)}")
+
+    return content, digest
+
+
+def parse_yaml_files(
+    files: list[Path],
+    workers: int = 1,
+    cache: ParseCache | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Parse YAML files, optionally spreading the work across a process pool.
+
+    Results are returned in the same order as ``files`` regardless of
+    ``workers``, so callers see identical output to a serial run. With a
+    cache, only files that changed since the last run are parsed.
+
+    Args:
+        files: Files to parse
+        workers: Number of worker processes (1 parses in-process)
+        cache: Optional persistent parse cache
+
+    Returns:
+        Parsed documents, one per input file
+    """
+    if cache is None:
+        return [doc for doc, _ in _parse_all(files, workers)]
+
+    results: list[dict[str, Any] | None] = []
+    misses: list[int] = []
+    for i, file_path in enumerate(files):
+        doc = cache.get(file_path)
+        results.append(doc)
+        if doc is None:
+            misses.append(i)
+
+    parsed = _parse_all([files[i] for i in misses], workers)
+    for i, (doc, digest) in zip(misses, parsed):
+        # Stored pickled, so callers tagging the document later is safe
+        cache.put(files[i], digest, doc)
+        results[i] = doc
+
+    cache.save()
+    return [doc if doc is not None else {} for doc in results]
+
+
+def _parse_all(files: list[Path], workers: int) -> list[tuple[dict[str, Any], str]]:
+    """Parse files serially or in a process pool, preserving order."""
+    if workers <= 1 or len(files) < 2:
+        return [_parse_with_digest(f) for f in files]
+
+    workers = min(workers, len(files))
+    # A few chunks per worker keeps pickling overhead low while still
+    # balancing uneven file sizes
+    chunksize = max(1, len(files) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_with_digest, files, chunksize=chunksize))
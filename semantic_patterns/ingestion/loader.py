@@ -1,9 +1,18 @@
 """YAML loader - loads semantic model files from directory."""
 
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from semantic_patterns.ingestion.files import (
+    find_yaml_files,
+    parse_yaml_file,
+    parse_yaml_files,
+)
 
-import yaml
+if TYPE_CHECKING:
+    from semantic_patterns.ingestion.cache import ParseCache
 
 
 class YamlLoader:
@@ -24,19 +33,32 @@ class YamlLoader:
             └── rental_metrics.yml
     """
 
-    def __init__(self, base_path: str | Path) -> None:
+    def __init__(
+        self,
+        base_path: str | Path,
+        workers: int = 1,
+        cache: ParseCache | None = None,
+        ignore: list[str] | None = None,
+    ) -> None:
         self.base_path = Path(base_path)
+        self.workers = workers
+        self.cache = cache
+        self.ignore = ignore
 
     def load_all(self) -> list[dict[str, Any]]:
         """
         Load all YAML files from the directory.
 
+        Files are parsed in a process pool when ``workers`` > 1; ordering
+        is the same as a serial load. With a cache, unchanged files are
+        not re-parsed.
+
         Returns list of parsed YAML documents.
         """
         files = self._find_yaml_files()
         documents = []
-        for file_path in files:
-            doc = self._load_file(file_path)
+        parsed = parse_yaml_files(files, self.workers, self.cache)
+        for file_path, doc in zip(files, parsed):
             if doc:
                 # Add source file for debugging
                 doc["_source_file"] = str(file_path)
@@ -48,32 +70,22 @@ class YamlLoader:
         return self._load_file(Path(file_path))
 
     def _find_yaml_files(self) -> list[Path]:
-        """Find all .yml and .yaml files recursively."""
-        files: list[Path] = []
-        for pattern in ["**/*.yml", "**/*.yaml"]:
-            files.extend(self.base_path.glob(pattern))
-        # Sort for deterministic ordering
-        return sorted(set(files))
+        """Find all .yml and .yaml files recursively, skipping ignored paths."""
+        return find_yaml_files(self.base_path, self.ignore)
 
     def _load_file(self, file_path: Path) -> dict[str, Any]:
-        """Load and parse a single YAML file."""
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, encoding="utf-8") as f:
-            content = yaml.safe_load(f)
-
-        if content is None:
-            return {}
-
-        if not isinstance(content, dict):
-            raise ValueError(
-                f"Expected dict at root of {file_path}, got {type(content)}"
-            )
-
-        return content
+        """Load and parse a single YAML file (from the cache if unchanged)."""
+        if self.cache is not None:
+            return parse_yaml_files([file_path], cache=self.cache)[0]
+        return parse_yaml_file(file_path)
 
     @classmethod
-    def from_directory(cls, path: str | Path) -> "YamlLoader":
+    def from_directory(
+        cls,
+        path: str | Path,
+        workers: int = 1,
+        cache: ParseCache | None = None,
+        ignore: list[str] | None = None,
+    ) -> YamlLoader:
         """Create loader from directory path."""
-        return cls(path)
+        return cls(path, workers=workers, cache=cache, ignore=ignore)
@@ -10,9 +10,15 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from semantic_patterns import __version__
+
 
 class SourceInfo(BaseModel):
-    """Information about a source file."""
+    """Information about a source file and a model it contributes to.
+
+    A file that feeds several models (or a metrics file whose metrics
+    attach to a model) appears once per model.
+    """
 
     path: str
     hash: str
@@ -27,6 +33,8 @@ class OutputInfo(BaseModel):
     path: str
     hash: str
     type: str  # "view", "explore", "model", "calendar"
+    model: str | None = None  # Model a view file was rendered from
+    depends_on: list[str] = Field(default_factory=list)  # Models an explore uses
 
     model_config = {"frozen": True}
 
@@ -87,6 +95,8 @@ class SPManifest(BaseModel):
     project: str
     generated_at: str
     config_hash: str
+    generator_version: str = ""  # semantic-patterns version that wrote the outputs
+    entity_graph_hash: str = ""  # Changes when any model's entities change
     sources: list[SourceInfo] = Field(default_factory=list)
     outputs: list[OutputInfo] = Field(default_factory=list)
     models: list[ModelSummary] = Field(default_factory=list)
@@ -103,12 +113,15 @@ class SPManifest(BaseModel):
         outputs: list[OutputInfo] | None = None,
         models: list[ModelSummary] | None = None,
         looker_push: LookerPushInfo | None = None,
+        entity_graph_hash: str = "",
     ) -> SPManifest:
         """Create a new manifest with current timestamp."""
         return cls(
             project=project,
             generated_at=datetime.now(timezone.utc).isoformat(),
             config_hash=config_hash,
+            generator_version=__version__,
+            entity_graph_hash=entity_graph_hash,
             sources=sources or [],
             outputs=outputs or [],
             models=models or [],
@@ -163,9 +176,16 @@ def compute_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
-def compute_config_hash(config: Any) -> str:
-    """Compute hash of config for change detection."""
-    config_str = json.dumps(config.model_dump(by_alias=True), sort_keys=True)
+def compute_config_hash(config: Any, exclude: set[str] | None = None) -> str:
+    """Compute hash of config for change detection.
+
+    Args:
+        config: Pydantic config model
+        exclude: Top-level fields to leave out (e.g. settings that don't
+            affect generated content)
+    """
+    data = config.model_dump(by_alias=True, exclude=exclude)
+    config_str = json.dumps(data, sort_keys=True)
     return hashlib.sha256(config_str.encode()).hexdigest()[:16]
 
 
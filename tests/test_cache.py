@@ -0,0 +1,195 @@
+"""Tests for the persistent on-disk caches."""
+
+import os
+from pathlib import Path
+
+from semantic_patterns.adapters.lookml import LookMLGenerator
+from semantic_patterns.adapters.lookml.cache import RenderCache
+from semantic_patterns.adapters.lookml.paths import OutputPaths
+from semantic_patterns.cache import DiskCache, cache_key
+from semantic_patterns.ingestion import DomainBuilder, YamlLoader
+from semantic_patterns.ingestion.cache import ParseCache
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "integration"
+
+MODEL_YAML = """
+semantic_models:
+  - name: orders
+    entities:
+      - name: order
+        type: primary
+        expr: order_id
+"""
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_roundtrip_persists(self, tmp_path: Path) -> None:
+        """Test values survive reopening the cache."""
+        cache = DiskCache(tmp_path, "test", max_bytes=1024 * 1024)
+        cache.put("a", {"x": [1, 2]})
+        cache.save()
+
+        reopened = DiskCache(tmp_path, "test", max_bytes=1024 * 1024)
+        assert reopened.get("a") == {"x": [1, 2]}
+        assert reopened.get("b") is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used entries are evicted over the cap."""
+        cache = DiskCache(tmp_path, "test", max_bytes=1024 * 1024)
+        for key in ["a", "b", "c"]:
+            cache.put(key, "x" * 1000)
+        cache.get("a")  # a is now more recent than b
+        cache.max_bytes = cache.size - 1
+
+        assert cache.evict() == 1
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert not (tmp_path / "test" / "b.pkl").exists()
+
+    def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        """Test an unreadable entry is dropped rather than raising."""
+        cache = DiskCache(tmp_path, "test", max_bytes=1024 * 1024)
+        cache.put("a", 1)
+        (tmp_path / "test" / "a.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_cache_key_stable(self) -> None:
+        """Test keys depend on all parts."""
+        assert cache_key("a", "b") == cache_key("a", "b")
+        assert cache_key("a", "b") != cache_key("ab")
+
+
+class TestParseCache:
+    """Tests for the YAML parse cache."""
+
+    def test_warm_load_parses_nothing(self, tmp_path: Path) -> None:
+        """Test a second load is served entirely from the cache."""
+        cold = ParseCache.open(tmp_path / "cache", 16)
+        cold_docs = YamlLoader(FIXTURES_DIR, cache=cold).load_all()
+        assert cold.hits == 0
+
+        warm = ParseCache.open(tmp_path / "cache", 16)
+        warm_docs = YamlLoader(FIXTURES_DIR, cache=warm).load_all()
+        assert warm.misses == 0
+        assert warm.hits == cold.misses
+        assert warm_docs == cold_docs == YamlLoader(FIXTURES_DIR).load_all()
+
+    def test_only_changed_files_reparsed(self, tmp_path: Path) -> None:
+        """Test editing one file re-parses only that file."""
+        models = tmp_path / "models"
+        models.mkdir()
+        (models / "orders.yml").write_text(MODEL_YAML)
+        (models / "users.yml").write_text(MODEL_YAML.replace("orders", "users"))
+        DomainBuilder.from_directory(models, cache=ParseCache.open(tmp_path / "c", 16))
+
+        (models / "users.yml").write_text(MODEL_YAML.replace("orders", "customers"))
+        cache = ParseCache.open(tmp_path / "c", 16)
+        result = DomainBuilder.from_directory(models, cache=cache)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert {m.name for m in result} == {"orders", "customers"}
+
+    def test_touched_file_with_same_content_is_hit(self, tmp_path: Path) -> None:
+        """Test an mtime change alone falls back to the content hash."""
+        model = tmp_path / "orders.yml"
+        model.write_text(MODEL_YAML)
+        YamlLoader(tmp_path, cache=ParseCache.open(tmp_path / "c", 16)).load_all()
+
+        stat = model.stat()
+        os.utime(model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache = ParseCache.open(tmp_path / "c", 16)
+        loader = YamlLoader(tmp_path, cache=cache)
+        assert loader.load_file(model)["semantic_models"][0]["name"] == "orders"
+        assert cache.hits == 1
+
+    def test_cached_documents_not_shared(self, tmp_path: Path) -> None:
+        """Test tagging a loaded document does not leak into the cache."""
+        (tmp_path / "orders.yml").write_text(MODEL_YAML)
+        cache = ParseCache.open(tmp_path / "c", 16)
+        loader = YamlLoader(tmp_path / "orders.yml", cache=cache)
+        first = loader.load_file(tmp_path / "orders.yml")
+        first["mutated"] = True
+
+        assert "mutated" not in loader.load_file(tmp_path / "orders.yml")
+
+    def test_parallel_with_cache(self, tmp_path: Path) -> None:
+        """Test cache misses can still be parsed in a process pool."""
+        cache = ParseCache.open(tmp_path / "c", 16)
+        docs = YamlLoader(FIXTURES_DIR, workers=2, cache=cache).load_all()
+        assert docs == YamlLoader(FIXTURES_DIR).load_all()
+
+
+class TestRenderCache:
+    """Tests for RenderCache."""
+
+    def _render(
+        self, generator: LookMLGenerator, cache: RenderCache, paths: OutputPaths
+    ) -> dict[str, dict[Path, str]]:
+        models = DomainBuilder.from_directory(FIXTURES_DIR)
+        return dict(generator.render_models(models, paths, cache=cache))
+
+    def test_warm_render_reuses_everything(self, tmp_path: Path) -> None:
+        """Test a second run across processes reuses every model's files."""
+        generator = LookMLGenerator()
+        paths = OutputPaths(project="proj", base_path=tmp_path / "out")
+
+        cold = RenderCache.open(tmp_path / "cache", 16)
+        first = self._render(generator, cold, paths)
+        assert (cold.hits, cold.misses) == (0, 3)
+
+        warm = RenderCache.open(tmp_path / "cache", 16)
+        second = self._render(generator, warm, paths)
+        assert (warm.hits, warm.misses) == (3, 0)
+        assert warm.hit_rate == 1.0
+        assert second == first
+
+    def test_hit_placed_under_new_paths(self, tmp_path: Path) -> None:
+        """Test cached files are re-rooted at the current output location."""
+        generator = LookMLGenerator()
+        cache = RenderCache.in_memory(16)
+        self._render(generator, cache, OutputPaths("a", tmp_path))
+
+        moved = OutputPaths("b", tmp_path)
+        files = self._render(generator, cache, moved)
+
+        assert cache.hits == 3
+        expected = dict(
+            generator.render_models(DomainBuilder.from_directory(FIXTURES_DIR), moved)
+        )
+        assert files == expected
+
+    def test_model_change_misses(self, tmp_path: Path) -> None:
+        """Test editing a model re-renders only that model."""
+        generator = LookMLGenerator()
+        paths = OutputPaths("proj", tmp_path)
+        cache = RenderCache.in_memory(16)
+        self._render(generator, cache, paths)
+
+        models = DomainBuilder.from_directory(FIXTURES_DIR)
+        models[0].label = "Changed"
+        list(generator.render_models(models, paths, cache=cache))
+
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_settings_change_misses(self, tmp_path: Path) -> None:
+        """Test generator settings and build options are part of the key."""
+        paths = OutputPaths("proj", tmp_path)
+        cache = RenderCache.in_memory(16)
+        self._render(LookMLGenerator(), cache, paths)
+        self._render(LookMLGenerator(pop_strategy_type="native"), cache, paths)
+        assert cache.hits == 0
+
+        other_options = RenderCache(cache._cache, settings='{"labels": 1}')
+        self._render(LookMLGenerator(), other_options, paths)
+        assert other_options.hits == 0
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test the size cap evicts rendered entries on save."""
+        cache = RenderCache(DiskCache(tmp_path, RenderCache.NAMESPACE, max_bytes=1))
+        self._render(LookMLGenerator(), cache, OutputPaths("proj", tmp_path))
+        assert len(DiskCache(tmp_path, RenderCache.NAMESPACE, max_bytes=1)) == 0
@@ -146,6 +146,132 @@ metrics:
             assert result.exit_code == 0
             # Verbose output should show model details
             assert "orders" in result.output
+            assert "SQL parse cache:" in result.output
+
+    def test_build_with_workers(
+        self, runner: CliRunner, valid_config_content: str, valid_semantic_model_content: str
+    ) -> None:
+        """Test build --workers parses input files in a process pool."""
+        with runner.isolated_filesystem():
+            Path("sp.yml").write_text(valid_config_content, encoding="utf-8")
+            Path("semantic_models").mkdir()
+            Path("semantic_models/orders.yml").write_text(
+                valid_semantic_model_content, encoding="utf-8"
+            )
+            Path("semantic_models/empty.yml").write_text("", encoding="utf-8")
+
+            result = runner.invoke(cli, ["build", "--workers", "2"])
+
+            assert result.exit_code == 0
+            assert "Generated" in result.output
+
+    def test_build_with_render_workers(
+        self, runner: CliRunner, valid_config_content: str, valid_semantic_model_content: str
+    ) -> None:
+        """Test build --render-workers renders views in a process pool."""
+        with runner.isolated_filesystem():
+            Path("sp.yml").write_text(valid_config_content, encoding="utf-8")
+            Path("semantic_models").mkdir()
+            Path("semantic_models/orders.yml").write_text(
+                valid_semantic_model_content, encoding="utf-8"
+            )
+            Path("semantic_models/returns.yml").write_text(
+                valid_semantic_model_content.replace("orders", "returns"),
+                encoding="utf-8",
+            )
+
+            result = runner.invoke(cli, ["build", "--render-workers", "2"])
+
+            assert result.exit_code == 0
+            assert "Generated" in result.output
+            views = sorted(p.name for p in Path("lookml").rglob("*.view.lkml"))
+            assert "orders.view.lkml" in views
+            assert "returns.view.lkml" in views
+
+    def test_build_no_cache(
+        self, runner: CliRunner, valid_config_content: str, valid_semantic_model_content: str
+    ) -> None:
+        """Test build writes a parse cache unless --no-cache is given."""
+        with runner.isolated_filesystem():
+            Path("sp.yml").write_text(valid_config_content, encoding="utf-8")
+            Path("semantic_models").mkdir()
+            Path("semantic_models/orders.yml").write_text(
+                valid_semantic_model_content, encoding="utf-8"
+            )
+
+            result = runner.invoke(cli, ["build", "--no-cache"])
+            assert result.exit_code == 0
+            assert not Path(".sp-cache").exists()
+
+            result = runner.invoke(cli, ["build", "--verbose"])
+            assert result.exit_code == 0
+            assert "0 cached, 1 parsed" in result.output
+
+    def test_build_render_cache(
+        self, runner: CliRunner, valid_config_content: str, valid_semantic_model_content: str
+    ) -> None:
+        """Test a repeated build reuses rendered views from the cache."""
+        with runner.isolated_filesystem():
+            Path("sp.yml").write_text(valid_config_content, encoding="utf-8")
+            Path("semantic_models").mkdir()
+            Path("semantic_models/orders.yml").write_text(
+                valid_semantic_model_content, encoding="utf-8"
+            )
+
+            result = runner.invoke(cli, ["build", "--verbose"])
+            assert result.exit_code == 0
+            assert "Render cache: 0 of 1 models reused (0%)" in result.output
+            first = next(Path("lookml").rglob("orders.view.lkml")).read_text()
+
+            result = runner.invoke(cli, ["build", "--verbose"])
+            assert result.exit_code == 0
+            assert "Render cache: 1 of 1 models reused (100%)" in result.output
+            assert "0 written, 3 unchanged, 0 deleted" in result.output
+            assert Path(".sp-cache/render").is_dir()
+            second = next(Path("lookml").rglob("orders.view.lkml")).read_text()
+            assert second == first
+            assert Path(".sp-cache/parse").is_dir()
+
+            result = runner.invoke(cli, ["build", "--verbose"])
+            assert "1 cached, 0 parsed" in result.output
+
+    @pytest.mark.parametrize("clean", ["clean", "warn"])
+    def test_build_orphaned_files(
+        self,
+        runner: CliRunner,
+        valid_config_content: str,
+        valid_semantic_model_content: str,
+        clean: str,
+    ) -> None:
+        """Test files of removed models are deleted or reported per the clean setting."""
+        with runner.isolated_filesystem():
+            config = valid_config_content + f"\noutput_options:\n  clean: {clean}\n"
+            Path("sp.yml").write_text(config, encoding="utf-8")
+            Path("semantic_models").mkdir()
+            Path("semantic_models/orders.yml").write_text(
+                valid_semantic_model_content, encoding="utf-8"
+            )
+            Path("semantic_models/returns.yml").write_text(
+                valid_semantic_model_content.replace("order", "return"),
+                encoding="utf-8",
+            )
+
+            result = runner.invoke(cli, ["build"])
+            assert result.exit_code == 0
+            returns_view = next(Path("lookml").rglob("returns.view.lkml"))
+
+            Path("semantic_models/returns.yml").unlink()
+            result = runner.invoke(cli, ["build"])
+            assert result.exit_code == 0
+            if clean == "clean":
+                assert "2 deleted" in result.output
+                assert not returns_view.exists()
+                assert not returns_view.parent.exists()
+            else:
+                assert "Orphaned files (2 no longer generated)" in result.output
+                assert "returns.view.lkml" in result.output
+                assert "0 deleted" in result.output
+                assert returns_view.exists()
 
     def test_build_no_config_found(self, runner: CliRunner) -> None:
         """Test build fails gracefully when no config found."""
@@ -9,8 +9,10 @@ import yaml
 from semantic_patterns.adapters.dialect import Dialect
 from semantic_patterns.adapters.lookml.types import ExploreConfig, ExploreJoinConfig
 from semantic_patterns.config import (
+    InputOptionsConfig,
     ModelConfig,
     OptionsConfig,
+    OutputOptionsConfig,
     SPConfig,
     find_config,
     load_config,
@@ -364,6 +366,100 @@ class TestOptionsConfig:
         assert options.effective_explore_prefix == ""
 
 
+class TestInputOptionsConfig:
+    """Tests for InputOptionsConfig model."""
+
+    def test_default_workers(self) -> None:
+        """Test parsing is serial by default."""
+        config = SPConfig.from_yaml("input: ./m\noutput: ./o\nschema: gold\n")
+        assert config.input_options.workers == 1
+
+    def test_workers_from_yaml(self) -> None:
+        """Test worker count is read from input_options."""
+        content = """\
+input: ./models
+output: ./lookml
+schema: gold
+input_options:
+  workers: 4
+"""
+        config = SPConfig.from_yaml(content)
+        assert config.input_options.workers == 4
+
+    def test_workers_must_be_positive(self) -> None:
+        """Test zero workers is rejected."""
+        with pytest.raises(ValueError):
+            InputOptionsConfig(workers=0)
+
+    def test_cache_defaults(self) -> None:
+        """Test the parse cache is on by default under .sp-cache."""
+        options = InputOptionsConfig()
+        assert options.cache is True
+        assert options.cache_dir == ".sp-cache"
+        assert options.cache_max_mb == 256
+
+    def test_ignore_from_yaml(self) -> None:
+        """Test extra ignore patterns are read from input_options."""
+        content = """\
+input: ./models
+output: ./lookml
+schema: gold
+input_options:
+  ignore: [archive/, "*_wip.yml"]
+"""
+        config = SPConfig.from_yaml(content)
+        assert config.input_options.ignore == ["archive/", "*_wip.yml"]
+        assert InputOptionsConfig().ignore == []
+
+
+class TestOutputOptionsConfig:
+    """Tests for OutputOptionsConfig model."""
+
+    def test_render_defaults(self) -> None:
+        """Test view rendering is serial with automatic chunking by default."""
+        options = OutputOptionsConfig()
+        assert options.render_workers == 1
+        assert options.render_chunksize is None
+
+    def test_render_workers_from_yaml(self) -> None:
+        """Test render workers and chunk size are read from output_options."""
+        content = """\
+input: ./models
+output: ./lookml
+schema: gold
+output_options:
+  render_workers: 4
+  render_chunksize: 8
+"""
+        config = SPConfig.from_yaml(content)
+        assert config.output_options.render_workers == 4
+        assert config.output_options.render_chunksize == 8
+
+    def test_render_workers_must_be_positive(self) -> None:
+        """Test zero render workers is rejected."""
+        with pytest.raises(ValueError):
+            OutputOptionsConfig(render_workers=0)
+
+    def test_clean_modes(self) -> None:
+        """Test clean accepts the three modes and defaults to unset (warn)."""
+        assert OutputOptionsConfig().clean is None
+        for mode in ("clean", "warn", "ignore"):
+            assert OutputOptionsConfig(clean=mode).clean == mode
+
+    @pytest.mark.parametrize("value", ["Clean", "delete", ""])
+    def test_clean_rejects_unknown_modes(self, value: str) -> None:
+        """Test a mistyped clean mode fails at config load."""
+        content = f"""\
+input: ./models
+output: ./lookml
+schema: gold
+output_options:
+  clean: "{value}"
+"""
+        with pytest.raises(ValueError, match="clean"):
+            SPConfig.from_yaml(content)
+
+
 class TestFindConfig:
     """Tests for find_config function."""
 
@@ -1,11 +1,19 @@
 """Tests for dbt semantic model ingestion."""
 
+import json
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from semantic_patterns.config import SPConfig
+from semantic_patterns.core.builder import load_models
+from semantic_patterns.domain import ProcessedModel
 from semantic_patterns.ingestion import DomainBuilder
 from semantic_patterns.ingestion.dbt import (
     DbtLoader,
     DbtMapper,
+    SemanticManifestLoader,
     map_dimension,
     map_entity,
     map_measure,
@@ -15,6 +23,9 @@ from semantic_patterns.ingestion.dbt import (
 )
 
 DBT_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "dbt"
+DBT_MANIFEST = (
+    Path(__file__).parent / "fixtures" / "dbt_manifest" / "semantic_manifest.json"
+)
 
 
 class TestJinjaFilterParsing:
@@ -407,6 +418,15 @@ class TestMapMetric:
         assert result["entity"] == "facility"
         assert result["format"] == "decimal_0"
 
+    def test_map_metric_measure_dict(self) -> None:
+        """Test measure given as a dict (semantic_manifest.json) maps to its name."""
+        dbt_metric = {
+            "name": "gov",
+            "type": "simple",
+            "type_params": {"measure": {"name": "checkout_amount", "alias": None}},
+        }
+        assert map_metric(dbt_metric)["measure"] == "checkout_amount"
+
 
 class TestMapSemanticModel:
     """Tests for map_semantic_model function."""
@@ -486,6 +506,16 @@ class TestDbtLoader:
         semantic_models, _ = loader.load_all()
         assert len(semantic_models) == 1
 
+    def test_parallel_load_matches_serial(self) -> None:
+        """Test process-pool loading returns the same dicts in the same order."""
+        serial = DbtLoader(DBT_FIXTURES_DIR).load_all()
+        parallel = DbtLoader(DBT_FIXTURES_DIR, workers=2).load_all()
+
+        assert parallel == serial
+        assert [sm["_source_file"] for sm in parallel[0]] == [
+            sm["_source_file"] for sm in serial[0]
+        ]
+
 
 class TestDbtMapper:
     """Tests for DbtMapper class."""
@@ -617,3 +647,96 @@ class TestEndToEnd:
         assert aov.expr is not None
         assert "NULLIF" in aov.expr
         assert aov.metrics == ["gov", "rental_count"]
+
+
+def _build_models(
+    semantic_models: list[dict[str, Any]], metrics: list[dict[str, Any]]
+) -> list[ProcessedModel]:
+    mapper = DbtMapper()
+    mapper.add_semantic_models(semantic_models)
+    mapper.add_metrics(metrics)
+    return DomainBuilder.from_documents(mapper.get_documents())
+
+
+class TestSemanticManifestLoader:
+    """Tests for loading dbt's compiled semantic_manifest.json."""
+
+    def test_load_all(self) -> None:
+        """Test models and metrics are normalized to the YAML layout."""
+        semantic_models, metrics = SemanticManifestLoader(DBT_MANIFEST).load_all()
+
+        assert len(semantic_models) == 1
+        rentals = semantic_models[0]
+        assert rentals["model"] == "rentals"
+        assert "node_relation" not in rentals
+        assert rentals["_source_file"] == str(DBT_MANIFEST)
+        assert "label" not in rentals  # null values dropped
+
+        gov = next(m for m in metrics if m["name"] == "gov")
+        assert gov["filter"] == [
+            "{{ Dimension('rental__transaction_type') }} = 'completed'"
+        ]
+        assert gov["type_params"]["measure"]["name"] == "checkout_amount"
+
+    def test_matches_yaml_project(self) -> None:
+        """Test the manifest builds the same domain models as the dbt YAML."""
+        from_yaml = _build_models(*DbtLoader(DBT_FIXTURES_DIR).load_all())
+        from_manifest = _build_models(*SemanticManifestLoader(DBT_MANIFEST).load_all())
+
+        def dump(models: list[ProcessedModel]) -> list[dict[str, Any]]:
+            return [m.model_dump(exclude={"source_files"}) for m in models]
+
+        assert dump(from_manifest) == dump(from_yaml)
+
+    def test_defaults_expr_to_name(self, tmp_path: Path) -> None:
+        """Test entities and dimensions without expr use their name, as in dbt."""
+        manifest = {
+            "semantic_models": [
+                {
+                    "name": "orders",
+                    "node_relation": {"alias": "fct_orders", "schema_name": "gold"},
+                    "entities": [{"name": "order_id", "type": "primary", "expr": None}],
+                    "dimensions": [
+                        {"name": "status", "type": "categorical", "expr": None}
+                    ],
+                    "measures": [],
+                }
+            ],
+            "metrics": [],
+        }
+        path = tmp_path / "semantic_manifest.json"
+        path.write_text(json.dumps(manifest))
+
+        models = _build_models(*SemanticManifestLoader(path).load_all())
+
+        assert models[0].entities[0].expr == "order_id"
+        assert models[0].dimensions[0].expr == "status"
+        assert models[0].meta["dbt_table"] == "fct_orders"
+
+    def test_load_models_from_manifest(self) -> None:
+        """Test load_models reads a .json input with format: dbt."""
+        config = SPConfig(
+            input=str(DBT_MANIFEST), output="./lookml", schema="gold", format="dbt"
+        )
+        models = load_models(config)
+
+        assert [m.name for m in models] == ["rentals"]
+        assert models[0].source_files == [str(DBT_MANIFEST)]
+
+    def test_from_project(self, tmp_path: Path) -> None:
+        """Test the loader defaults to target/semantic_manifest.json."""
+        loader = SemanticManifestLoader.from_project(tmp_path)
+        assert loader.path == tmp_path / "target" / "semantic_manifest.json"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing manifest raises FileNotFoundError."""
+        loader = SemanticManifestLoader(tmp_path / "semantic_manifest.json")
+        with pytest.raises(FileNotFoundError):
+            loader.load_all()
+
+    def test_not_a_manifest(self, tmp_path: Path) -> None:
+        """Test other JSON files are rejected with ValueError."""
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps({"nodes": {}}))
+        with pytest.raises(ValueError, match="Not a dbt semantic manifest"):
+            SemanticManifestLoader(path).load_all()
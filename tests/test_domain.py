@@ -18,6 +18,8 @@ from semantic_patterns.domain import (
     Dimension,
     DimensionType,
     Entity,
+    # Entity graph
+    EntityGraph,
     # Filter
     Filter,
     FilterOperator,
@@ -485,3 +487,58 @@ class TestProcessedModel:
         # 10 metrics, each with 7 variants (1 base + 6 PoP)
         assert len(model.metrics) == 10
         assert model.total_variant_count == 70
+
+
+def _model(name: str, *entities: tuple[str, str]) -> ProcessedModel:
+    return ProcessedModel(
+        name=name,
+        entities=[Entity(name=e, type=t, expr=f"{e}_id") for e, t in entities],
+    )
+
+
+class TestEntityGraph:
+    """Tests for EntityGraph."""
+
+    @pytest.fixture
+    def graph(self) -> EntityGraph:
+        return EntityGraph(
+            [
+                _model("rentals", ("rental", "primary"), ("facility", "foreign")),
+                _model("facilities", ("facility", "primary")),
+                _model("facilities_v2", ("facility", "primary")),
+                _model("reviews", ("review", "primary"), ("rental", "foreign")),
+                _model("refunds", ("rental", "foreign")),
+            ]
+        )
+
+    def test_parents_last_primary_wins(self, graph: EntityGraph) -> None:
+        """Test a shared primary entity resolves to the last model, minus skips."""
+        rentals = graph.models["rentals"]
+
+        [(foreign, target, _)] = graph.parents(rentals)
+        assert (foreign.name, target.name) == ("facility", "facilities_v2")
+
+        [(_, target, _)] = graph.parents(
+            rentals, skip=lambda m: m.name == "facilities_v2"
+        )
+        assert target.name == "facilities"
+
+    def test_children_in_model_order(self, graph: EntityGraph) -> None:
+        """Test the reverse index returns child facts in model order."""
+        children = graph.children(graph.models["rentals"])
+
+        assert [(m.name, e.name) for m, e in children] == [
+            ("reviews", "rental"),
+            ("refunds", "rental"),
+        ]
+        assert graph.children(graph.models["refunds"]) == []
+
+    def test_no_self_join(self) -> None:
+        """Test a model never joins to itself."""
+        graph = EntityGraph(
+            [_model("employees", ("employee", "primary"), ("employee", "foreign"))]
+        )
+        employees = graph.models["employees"]
+
+        assert graph.parents(employees) == []
+        assert graph.children(employees) == []
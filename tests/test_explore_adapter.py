@@ -469,6 +469,67 @@ class TestExploreRenderer:
         assert joins[0].entity == "facility"
 
 
+class TestMultiHopJoins:
+    """Tests for chained joins with join_depth > 1."""
+
+    def models(self) -> dict[str, ProcessedModel]:
+        """rentals -> facilities -> cities -> regions, with a cycle back."""
+
+        def model(name: str, primary: str, *foreign: str) -> ProcessedModel:
+            entities = [Entity(name=primary, type="primary", expr=f"{primary}_sk")]
+            entities += [
+                Entity(name=f, type="foreign", expr=f"{f}_sk") for f in foreign
+            ]
+            return ProcessedModel(name=name, entities=entities)
+
+        return {
+            "rentals": model("rentals", "rental", "facility"),
+            "facilities": model("facilities", "facility", "city"),
+            "cities": model("cities", "city", "region"),
+            # regions points back at facilities (cycle)
+            "regions": model("regions", "region", "facility"),
+        }
+
+    def joins(self, **options: object) -> list[InferredJoin]:
+        models = self.models()
+        config = ExploreConfig.model_validate(
+            {"name": "rentals", "fact": "rentals", **options}
+        )
+        return ExploreRenderer().infer_joins(models["rentals"], models, config)
+
+    def test_default_is_one_hop(self):
+        assert [j.model for j in self.joins()] == ["facilities"]
+
+    def test_depth_limits_chain(self):
+        joins = self.joins(join_depth=2)
+
+        assert [(j.model, j.from_model) for j in joins] == [
+            ("facilities", None),
+            ("cities", "facilities"),
+        ]
+        assert joins[1].relationship == JoinRelationship.MANY_TO_ONE
+
+    def test_cycle_stops_walk(self):
+        joins = self.joins(join_depth=10)
+
+        assert [j.model for j in joins] == ["facilities", "cities", "regions"]
+
+    def test_excluded_model_breaks_chain(self):
+        joins = self.joins(join_depth=3, join_exclusions=["cities"])
+
+        assert [j.model for j in joins] == ["facilities"]
+
+    def test_chained_sql_on(self):
+        models = self.models()
+        config = ExploreConfig(name="rentals", fact="rentals", join_depth=3)
+        explore, includes = ExploreRenderer().render(config, models["rentals"], models)
+
+        joins = {j["name"]: j for j in explore["joins"]}
+        assert joins["cities"]["sql_on"] == "${facilities.city} = ${cities.city}"
+        assert joins["regions"]["sql_on"] == "${cities.region} = ${regions.region}"
+        assert "../views/regions/*.view.lkml" in includes
+
+
 class TestExploreGenerator:
     """Tests for explore generator orchestrator."""
 
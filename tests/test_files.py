@@ -0,0 +1,163 @@
+"""Tests for input file discovery and the parse pre-check."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from semantic_patterns.config import SPConfig
+from semantic_patterns.core.builder import input_ignore_patterns, load_models
+from semantic_patterns.ingestion.files import (
+    find_yaml_files,
+    may_contain_models,
+    parse_yaml_file,
+    read_ignore_file,
+)
+
+MODEL_YAML = """semantic_models:
+  - name: orders
+    entities:
+      - name: order
+        type: primary
+        expr: order_id
+"""
+
+
+def _touch(path: Path, content: str = MODEL_YAML) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _names(files: list[Path], base: Path) -> list[str]:
+    return [f.relative_to(base).as_posix() for f in files]
+
+
+class TestFindYamlFiles:
+    """Tests for find_yaml_files."""
+
+    def test_finds_yml_and_yaml_sorted(self, tmp_path: Path) -> None:
+        """Test both suffixes are found recursively in sorted order."""
+        _touch(tmp_path / "b.yaml")
+        _touch(tmp_path / "a.yml")
+        _touch(tmp_path / "nested" / "deep" / "c.yml")
+        _touch(tmp_path / "notes.txt")
+
+        assert _names(find_yaml_files(tmp_path), tmp_path) == [
+            "a.yml",
+            "b.yaml",
+            "nested/deep/c.yml",
+        ]
+
+    def test_default_ignores(self, tmp_path: Path) -> None:
+        """Test dbt artifacts, hidden dirs and sp.yml are skipped."""
+        _touch(tmp_path / "models" / "orders.yml")
+        _touch(tmp_path / "sp.yml", "input: .\n")
+        for ignored in ["target", "dbt_packages", "node_modules", ".git", ".sp-cache"]:
+            _touch(tmp_path / ignored / "x.yml")
+
+        assert _names(find_yaml_files(tmp_path), tmp_path) == ["models/orders.yml"]
+
+    def test_nested_artifact_names_searched(self, tmp_path: Path) -> None:
+        """Test dbt artifact names are only ignored at the input root."""
+        for kept in ["models/logs", "models/marketing/target"]:
+            _touch(tmp_path / kept / "x.yml")
+        _touch(tmp_path / "models" / "sp.yml")
+        _touch(tmp_path / "logs" / "x.yml")
+
+        assert _names(find_yaml_files(tmp_path), tmp_path) == [
+            "models/logs/x.yml",
+            "models/marketing/target/x.yml",
+            "models/sp.yml",
+        ]
+
+    def test_spignore(self, tmp_path: Path) -> None:
+        """Test .spignore patterns by name, by path and directory-only."""
+        _touch(tmp_path / "keep.yml")
+        _touch(tmp_path / "scratch.yml")
+        _touch(tmp_path / "archive" / "old.yml")
+        _touch(tmp_path / "models" / "staging" / "stg.yml")
+        _touch(tmp_path / "staging" / "top.yml")
+        (tmp_path / ".spignore").write_text(
+            "# comments and blank lines are skipped\n\n"
+            "scratch.yml\narchive/\nmodels/staging\n"
+        )
+
+        assert _names(find_yaml_files(tmp_path), tmp_path) == [
+            "keep.yml",
+            "staging/top.yml",
+        ]
+
+    def test_extra_ignore_patterns(self, tmp_path: Path) -> None:
+        """Test patterns passed in are applied on top of the defaults."""
+        _touch(tmp_path / "a.yml")
+        _touch(tmp_path / "wip_b.yml")
+
+        files = find_yaml_files(tmp_path, ignore=["wip_*"])
+
+        assert _names(files, tmp_path) == ["a.yml"]
+
+    def test_symlink_loop(self, tmp_path: Path) -> None:
+        """Test a directory symlink back to an ancestor is walked once."""
+        _touch(tmp_path / "models" / "a.yml")
+        (tmp_path / "models" / "loop").symlink_to(tmp_path / "models")
+
+        assert _names(find_yaml_files(tmp_path), tmp_path) == ["models/a.yml"]
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test a missing directory yields no files."""
+        assert find_yaml_files(tmp_path / "missing") == []
+
+    def test_read_ignore_file_missing(self, tmp_path: Path) -> None:
+        """Test no .spignore means no extra patterns."""
+        assert read_ignore_file(tmp_path) == []
+
+
+class TestMayContainModels:
+    """Tests for the pre-check that skips YAML without model sections."""
+
+    def test_section_keys(self) -> None:
+        """Test each model section key triggers a parse."""
+        for key in ["semantic_models", "data_models", "metrics"]:
+            assert may_contain_models(f"version: 2\n{key}:\n  - name: x\n".encode())
+
+    def test_other_mappings_skipped(self) -> None:
+        """Test dbt_project.yml / schema.yml style files are skipped."""
+        raw = b"# dbt project\nname: shop\nversion: 2\nmodels:\n  - name: metrics\n"
+        assert not may_contain_models(raw)
+
+    def test_undecidable_content_parsed(self) -> None:
+        """Test list roots and flow style fall through to the YAML parser."""
+        assert may_contain_models(b"- item1\n- item2\n")
+        assert may_contain_models(b"{metrics: []}\n")
+
+    def test_skipped_file_parses_empty(self, tmp_path: Path) -> None:
+        """Test a file without model sections is returned as empty."""
+        path = _touch(tmp_path / "dbt_project.yml", "name: shop\nvars: {a: 1}\n")
+        assert parse_yaml_file(path) == {}
+
+
+class TestInputIgnorePatterns:
+    """Tests for config-driven ignore patterns."""
+
+    def test_output_inside_input_ignored(self, tmp_path: Path) -> None:
+        """Test generated output under the input directory is never read."""
+        _touch(tmp_path / "orders.yml")
+        _touch(tmp_path / "lookml" / "broken.yml", "semantic_models: [\n")
+        config = SPConfig(
+            input=str(tmp_path),
+            output=str(tmp_path / "lookml"),
+            schema="gold",
+            input_options={"cache": False, "ignore": ["*.bak.yml"]},
+        )
+
+        assert input_ignore_patterns(config, tmp_path) == ["*.bak.yml", "/lookml/"]
+        assert [m.name for m in load_models(config)] == ["orders"]
+
+    def test_output_outside_input(self, tmp_path: Path) -> None:
+        """Test an unrelated output directory adds no pattern."""
+        config = SPConfig(
+            input=str(tmp_path / "models"),
+            output=str(tmp_path / "lookml"),
+            schema="gold",
+        )
+        assert input_ignore_patterns(config, tmp_path / "models") == []
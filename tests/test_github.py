@@ -0,0 +1,469 @@
+"""Tests for the GitHub client used by the Looker destination."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from rich.console import Console
+
+from semantic_patterns.config import LookerConfig
+from semantic_patterns.destinations.looker.errors import LookerAPIError
+from semantic_patterns.destinations.looker.github import GitHubClient, git_blob_sha
+from semantic_patterns.destinations.looker.http import HttpSessions, RetryPolicy
+
+
+@contextmanager
+def serve(
+    handler: Callable[[httpx.Request], httpx.Response],
+    connections: set[tuple[str, int]],
+) -> Iterator[str]:
+    """Serve handler over HTTP/1.1 keep-alive on a localhost port.
+
+    Yields the base URL; each client connection is added to connections.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep connections alive
+
+        def _handle(self) -> None:
+            connections.add(self.client_address)
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://localhost{self.path}",
+                headers=dict(self.headers),
+                content=self.rfile.read(length),
+            )
+            response = handler(request)
+            self.send_response(response.status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response.content)))
+            self.end_headers()
+            self.wfile.write(response.content)
+
+        do_GET = do_POST = do_PATCH = do_PUT = _handle  # noqa: N815
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FakeGitHub:
+    """In-memory GitHub git data API for one repo.
+
+    Served in-process via MockTransport, or over HTTP on localhost with
+    serve(). Blob uploads can be made to fail (fail_blobs: content ->
+    number of 502s before success) or slow (blob_delay), and recursive
+    tree listings cut short (truncate_at entries).
+    """
+
+    def __init__(self, files: dict[str, str], branch: str = "sp-generated") -> None:
+        self.objects: dict[str, Any] = {}
+        self.requests: list[httpx.Request] = []
+        self.refs = {branch: self._commit(self._tree_from_files(files), [])}
+        self.fail_blobs: dict[str, int] = {}
+        self.blob_delay = 0.0
+        self.truncate_at: int | None = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections: set[tuple[str, int]] = set()
+        self._lock = threading.Lock()
+
+    def _store(self, obj: Any) -> str:
+        sha = hashlib.sha1(json.dumps(obj, sort_keys=True).encode()).hexdigest()
+        self.objects[sha] = obj
+        return sha
+
+    def _commit(self, tree: str, parents: list[str]) -> str:
+        return self._store({"type": "commit", "tree": tree, "parents": parents})
+
+    def _tree_from_files(self, files: dict[str, str]) -> str:
+        entries: dict[str, Any] = {}
+        for path, content in files.items():
+            sha = git_blob_sha(content)
+            self.objects[sha] = {"type": "blob", "content": content}
+            *dirs, name = path.split("/")
+            level = entries
+            for part in dirs:
+                level = level.setdefault(part, {})
+            level[name] = sha
+        return self._store_tree(entries)
+
+    def _store_tree(self, entries: dict[str, Any]) -> str:
+        items = {
+            name: self._store_tree(value) if isinstance(value, dict) else value
+            for name, value in entries.items()
+        }
+        return self._store({"type": "tree", "items": items})
+
+    def files(self, sha: str, prefix: str = "") -> dict[str, str]:
+        """path -> content of every blob in a tree."""
+        found: dict[str, str] = {}
+        for name, item_sha in self.objects[sha]["items"].items():
+            obj = self.objects[item_sha]
+            if obj["type"] == "tree":
+                found.update(self.files(item_sha, f"{prefix}{name}/"))
+            else:
+                found[f"{prefix}{name}"] = obj["content"]
+        return found
+
+    def branch_files(self, branch: str = "sp-generated") -> dict[str, str]:
+        return self.files(self.objects[self.refs[branch]]["tree"])
+
+    def _list_tree(self, sha: str, recursive: bool, prefix: str = "") -> list[Any]:
+        listing = []
+        for name, item_sha in self.objects[sha]["items"].items():
+            kind = self.objects[item_sha]["type"]
+            listing.append({"path": f"{prefix}{name}", "type": kind, "sha": item_sha})
+            if kind == "tree" and recursive:
+                listing.extend(self._list_tree(item_sha, True, f"{prefix}{name}/"))
+        return listing
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        _, _, _, *route = request.url.path.strip("/").split("/")
+        path = "/".join(route)
+        body = json.loads(request.content) if request.content else {}
+
+        if request.method == "GET" and path.startswith("git/ref/heads/"):
+            branch = path.removeprefix("git/ref/heads/")
+            if branch not in self.refs:
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json={"object": {"sha": self.refs[branch]}})
+        if request.method == "GET" and path.startswith("git/commits/"):
+            commit = self.objects[path.removeprefix("git/commits/")]
+            return httpx.Response(
+                200,
+                json={
+                    "tree": {"sha": commit["tree"]},
+                    "parents": [{"sha": p} for p in commit["parents"]],
+                },
+            )
+        if request.method == "GET" and path.startswith("git/trees/"):
+            recursive = request.url.params.get("recursive") == "1"
+            listing = self._list_tree(path.removeprefix("git/trees/"), recursive)
+            truncated = recursive and self.truncate_at is not None
+            if truncated:
+                listing = listing[: self.truncate_at]
+            return httpx.Response(200, json={"tree": listing, "truncated": truncated})
+        if request.method == "POST" and path == "git/blobs":
+            return self._create_blob(body["content"])
+        if request.method == "POST" and path == "git/trees":
+            files = self.files(body["base_tree"])
+            for item in body["tree"]:
+                if "content" in item:
+                    files[item["path"]] = item["content"]
+                elif item["sha"] is None:
+                    del files[item["path"]]
+                else:
+                    files[item["path"]] = self.objects[item["sha"]]["content"]
+            return httpx.Response(201, json={"sha": self._tree_from_files(files)})
+        if request.method == "POST" and path == "git/commits":
+            sha = self._commit(body["tree"], body["parents"])
+            return httpx.Response(201, json={"sha": sha})
+        if request.method == "PATCH" and path.startswith("git/refs/heads/"):
+            self.refs[path.removeprefix("git/refs/heads/")] = body["sha"]
+            return httpx.Response(200, json={"object": {"sha": body["sha"]}})
+        return httpx.Response(404, json={"message": f"No route for {path}"})
+
+    def _create_blob(self, content: str) -> httpx.Response:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failures = self.fail_blobs.get(content, 0)
+            if failures:
+                self.fail_blobs[content] = failures - 1
+        try:
+            time.sleep(self.blob_delay)
+            if failures:
+                return httpx.Response(502, json={"message": "Server Error"})
+            sha = git_blob_sha(content)
+            self.objects[sha] = {"type": "blob", "content": content}
+            return httpx.Response(201, json={"sha": sha})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def serve(self) -> AbstractContextManager[str]:
+        """Serve the API on a localhost port, yielding its base URL."""
+        return serve(self.handler, self.connections)
+
+    def client(self, path: str = "lookml") -> GitHubClient:
+        config = LookerConfig(repo="org/looker", branch="sp-generated", path=path)
+        return GitHubClient(
+            config,
+            "analytics",
+            Console(quiet=True),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+    def tree_post(self) -> dict[str, Any]:
+        posts = [
+            r
+            for r in self.requests
+            if r.method == "POST" and r.url.path.endswith("/git/trees")
+        ]
+        assert len(posts) == 1
+        result: dict[str, Any] = json.loads(posts[0].content)
+        return result
+
+
+class TestGitBlobSha:
+    """Tests for git_blob_sha."""
+
+    def test_matches_git(self, tmp_path: Path) -> None:
+        """Test blob SHAs match `git hash-object`."""
+        content = "view: orders {\n  sql_table_name: é ;;\n}\n"
+        target = tmp_path / "orders.view.lkml"
+        target.write_text(content, encoding="utf-8")
+        try:
+            result = subprocess.run(
+                ["git", "hash-object", str(target)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git not available")
+
+        assert git_blob_sha(content) == result.stdout.strip()
+
+
+class TestDeltaCommit:
+    """Tests for GitHubClient.create_commit only sending what changed."""
+
+    remote = {
+        "README.md": "readme",
+        "lookml/analytics/views/orders.view.lkml": "view: orders {}",
+        "lookml/analytics/views/users.view.lkml": "view: users {}",
+        "lookml/analytics/views/old.view.lkml": "view: old {}",
+    }
+
+    def test_only_changes_sent(self) -> None:
+        """Test the tree holds only added, changed and deleted entries."""
+        github = FakeGitHub(self.remote)
+        views = "lookml/analytics/views"
+        blobs = [
+            {"path": f"{views}/orders.view.lkml", "content": "view: orders {}"},
+            {"path": f"{views}/users.view.lkml", "content": "view: users { }"},
+            {"path": f"{views}/items.view.lkml", "content": "view: items {}"},
+        ]
+
+        result = github.client().create_commit(
+            "token",
+            blobs,
+            ["lookml/analytics/views/old.view.lkml", "lookml/analytics/gone.lkml"],
+        )
+
+        assert result.commit_sha == github.refs["sp-generated"]
+        assert result.changed == [
+            "lookml/analytics/views/users.view.lkml",
+            "lookml/analytics/views/items.view.lkml",
+        ]
+        assert result.deleted == ["lookml/analytics/views/old.view.lkml"]
+        assert result.unchanged == 1
+        assert sorted(item["path"] for item in github.tree_post()["tree"]) == [
+            "lookml/analytics/views/items.view.lkml",
+            "lookml/analytics/views/old.view.lkml",
+            "lookml/analytics/views/users.view.lkml",
+        ]
+        assert github.branch_files() == {
+            "README.md": "readme",
+            "lookml/analytics/views/orders.view.lkml": "view: orders {}",
+            "lookml/analytics/views/users.view.lkml": "view: users { }",
+            "lookml/analytics/views/items.view.lkml": "view: items {}",
+        }
+
+    def test_no_changes_skips_commit(self) -> None:
+        """Test nothing is committed when the branch already has every file."""
+        github = FakeGitHub(self.remote)
+        head = github.refs["sp-generated"]
+        blobs = [
+            {"path": path, "content": content}
+            for path, content in self.remote.items()
+            if path.startswith("lookml/")
+        ]
+
+        result = github.client().create_commit("token", blobs, ["lookml/never.lkml"])
+
+        assert result.commit_sha is None
+        assert result.unchanged == 3
+        assert github.refs["sp-generated"] == head
+        assert all(r.method == "GET" for r in github.requests)
+
+    def test_only_config_path_listed_recursively(self) -> None:
+        """Test the recursive tree listing is limited to config.path."""
+        github = FakeGitHub(self.remote)
+        root = github.objects[github.refs["sp-generated"]]["tree"]
+        lookml = github.objects[root]["items"]["lookml"]
+        blobs = [{"path": "lookml/analytics/a.lkml", "content": "a"}]
+
+        github.client().create_commit("token", blobs)
+
+        recursive = [r for r in github.requests if r.url.params.get("recursive") == "1"]
+        assert len(recursive) == 1
+        assert recursive[0].url.path.endswith(f"/git/trees/{lookml}")
+
+    def test_truncated_listing_still_deletes(self) -> None:
+        """Test orphans missing from a truncated listing are still removed."""
+        github = FakeGitHub(self.remote)
+        github.truncate_at = 1
+        views = "lookml/analytics/views"
+        blobs = [
+            {"path": f"{views}/orders.view.lkml", "content": "view: orders {}"},
+            {"path": f"{views}/users.view.lkml", "content": "view: users {}"},
+        ]
+
+        result = github.client().create_commit(
+            "token", blobs, [f"{views}/old.view.lkml", f"{views}/never.view.lkml"]
+        )
+
+        assert result.deleted == [f"{views}/old.view.lkml"]
+        assert f"{views}/old.view.lkml" not in github.branch_files()
+        assert f"{views}/users.view.lkml" in github.branch_files()
+
+    def test_missing_config_path_pushes_everything(self) -> None:
+        """Test a config.path not yet on the branch sends every file."""
+        github = FakeGitHub({"README.md": "readme"})
+        blobs = [
+            {"path": "lookml/analytics/a.lkml", "content": "a"},
+            {"path": "lookml/analytics/b.lkml", "content": "b"},
+        ]
+
+        result = github.client().create_commit("token", blobs)
+
+        assert result.changed == ["lookml/analytics/a.lkml", "lookml/analytics/b.lkml"]
+        assert github.branch_files()["lookml/analytics/b.lkml"] == "b"
+
+
+class TestLargePush:
+    """Tests for uploading blobs separately on large pushes."""
+
+    def blobs(self, count: int) -> list[dict[str, str]]:
+        return [
+            {
+                "path": f"lookml/analytics/views/v{i}.view.lkml",
+                "content": f"view: v{i} {{}}",
+            }
+            for i in range(count)
+        ]
+
+    def client(self, github: FakeGitHub, url: str, **looker: Any) -> GitHubClient:
+        config = LookerConfig(
+            repo="org/looker", branch="sp-generated", path="lookml", **looker
+        )
+        return GitHubClient(
+            config,
+            "analytics",
+            Console(quiet=True),
+            api_base=url,
+            retry=RetryPolicy(backoff=0),
+        )
+
+    def test_tree_built_from_blob_shas(self) -> None:
+        """Test a push over the threshold uploads blobs and sends only SHAs."""
+        github = FakeGitHub({"README.md": "readme"})
+        github.blob_delay = 0.02
+        blobs = self.blobs(20)
+
+        with github.serve() as url:
+            client = self.client(github, url, large_push_threshold=5, blob_workers=4)
+            result = client.create_commit("token", blobs)
+
+        assert len(result.changed) == 20
+        items = github.tree_post()["tree"]
+        assert all("content" not in item for item in items)
+        assert {item["sha"] for item in items} == {
+            git_blob_sha(blob["content"]) for blob in blobs
+        }
+        assert 1 < github.max_in_flight <= 4
+        files = github.branch_files()
+        assert files["lookml/analytics/views/v19.view.lkml"] == "view: v19 {}"
+
+    def test_small_push_stays_inline(self) -> None:
+        """Test pushes under the threshold don't call git/blobs."""
+        github = FakeGitHub({"README.md": "readme"})
+
+        with github.serve() as url:
+            self.client(github, url, large_push_threshold=5).create_commit(
+                "token", self.blobs(5)
+            )
+
+        assert not any(r.url.path.endswith("/git/blobs") for r in github.requests)
+        assert all("content" in item for item in github.tree_post()["tree"])
+
+    def test_failed_blobs_retried(self) -> None:
+        """Test a blob that fails transiently is retried on its own."""
+        github = FakeGitHub({"README.md": "readme"})
+        blobs = self.blobs(3)
+        github.fail_blobs = {blobs[1]["content"]: 2}
+
+        with github.serve() as url:
+            client = self.client(github, url, large_push_threshold=0)
+            result = client.create_commit("token", blobs)
+
+        assert result.commit_sha is not None
+        posts = [r for r in github.requests if r.url.path.endswith("/git/blobs")]
+        assert len(posts) == 3 + 2
+        files = github.branch_files()
+        assert files["lookml/analytics/views/v1.view.lkml"] == "view: v1 {}"
+
+    def test_exhausted_retries_raise(self) -> None:
+        """Test a blob failing every attempt aborts the push untouched."""
+        github = FakeGitHub({"README.md": "readme"})
+        head = github.refs["sp-generated"]
+        blobs = self.blobs(2)
+        github.fail_blobs = {blobs[0]["content"]: RetryPolicy().attempts}
+
+        with github.serve() as url:
+            client = self.client(github, url, large_push_threshold=0)
+            with pytest.raises(LookerAPIError, match="v0.view.lkml"):
+                client.create_commit("token", blobs)
+
+        assert github.refs["sp-generated"] == head
+
+
+class TestPooledConnections:
+    """Tests for GitHubClient reusing pooled connections."""
+
+    def test_pushes_reuse_connection(self) -> None:
+        """Test consecutive pushes share one keep-alive connection."""
+        github = FakeGitHub({"README.md": "readme"})
+        sessions = HttpSessions(http2=False)
+        config = LookerConfig(repo="org/looker", branch="sp-generated", path="lookml")
+
+        with github.serve() as url:
+            for i in range(2):
+                client = GitHubClient(
+                    config,
+                    "analytics",
+                    Console(quiet=True),
+                    api_base=url,
+                    sessions=sessions,
+                )
+                blobs = [{"path": "lookml/analytics/a.lkml", "content": f"v{i}"}]
+                client.create_commit("token", blobs)
+            sessions.close()
+
+        assert github.branch_files()["lookml/analytics/a.lkml"] == "v1"
+        assert len(github.requests) > 2
+        assert len(github.connections) == 1
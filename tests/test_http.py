@@ -0,0 +1,240 @@
+"""Tests for the shared retrying HTTP layer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from semantic_patterns.destinations.looker.http import (
+    RETRY,
+    AsyncRetryClient,
+    HttpSessions,
+    HttpStats,
+    RetryClient,
+    RetryPolicy,
+    endpoint_name,
+    proxy_for,
+)
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def scripted(*responses: httpx.Response | Exception) -> tuple[Handler, list[int]]:
+    """Handler replaying responses (or raising errors) in order."""
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return handler, calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record retry delays instead of sleeping."""
+    delays: list[float] = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    return delays
+
+
+def client(handler: Handler, stats: HttpStats | None = None) -> RetryClient:
+    return RetryClient(
+        transport=httpx.MockTransport(handler),
+        policy=RetryPolicy(attempts=3, backoff=0.5),
+        stats=stats or HttpStats(),
+    )
+
+
+class TestRetryClient:
+    """Tests for RetryClient."""
+
+    def test_transient_errors_retried(self, sleeps: list[float]) -> None:
+        """Test 5xx and 429 responses are retried with bounded backoff."""
+        handler, calls = scripted(
+            httpx.Response(502), httpx.Response(429), httpx.Response(200)
+        )
+        stats = HttpStats()
+
+        response = client(handler, stats).get("https://api.github.com/repos/a/b")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+        counts = stats.snapshot()["GET api.github.com/repos/a/b"]
+        assert (counts.requests, counts.retries, counts.errors) == (3, 2, 0)
+
+    def test_gives_up_after_attempts(self, sleeps: list[float]) -> None:
+        """Test the last failure is returned once attempts run out."""
+        handler, calls = scripted(httpx.Response(503))
+
+        response = client(handler).get("https://example.com/x")
+
+        assert response.status_code == 503
+        assert len(calls) == 3
+
+    def test_client_errors_not_retried(self, sleeps: list[float]) -> None:
+        """Test 4xx responses (other than rate limits) come straight back."""
+        handler, calls = scripted(httpx.Response(404), httpx.Response(200))
+
+        assert client(handler).get("https://example.com/x").status_code == 404
+        assert len(calls) == 1
+
+    def test_post_retried_only_when_marked(self, sleeps: list[float]) -> None:
+        """Test non-idempotent requests need the RETRY extension."""
+        handler, calls = scripted(httpx.Response(502), httpx.Response(201))
+        assert client(handler).post("https://x.io/a").status_code == 502
+        assert len(calls) == 1
+
+        handler, calls = scripted(httpx.Response(502), httpx.Response(201))
+        response = client(handler).post("https://x.io/a", extensions={RETRY: True})
+        assert response.status_code == 201
+        assert len(calls) == 2
+
+    def test_unsent_post_retried(self, sleeps: list[float]) -> None:
+        """Test a POST that never connected is retried, one that timed out isn't."""
+        handler, calls = scripted(httpx.ConnectError("refused"), httpx.Response(201))
+        assert client(handler).post("https://x.io/a").status_code == 201
+        assert len(calls) == 2
+
+        handler, calls = scripted(httpx.ReadTimeout("slow"), httpx.Response(201))
+        stats = HttpStats()
+        with pytest.raises(httpx.ReadTimeout):
+            client(handler, stats).post("https://x.io/a")
+        assert len(calls) == 1
+        assert stats.snapshot()["POST x.io/a"].errors == 1
+
+    def test_retry_after_honored(self, sleeps: list[float]) -> None:
+        """Test Retry-After sets the delay, and long waits aren't retried."""
+        handler, _ = scripted(
+            httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)
+        )
+        assert client(handler).get("https://x.io/a").status_code == 200
+        assert 3 <= sleeps[0] <= 3.5
+
+        handler, calls = scripted(httpx.Response(503, headers={"Retry-After": "600"}))
+        assert client(handler).get("https://x.io/a").status_code == 503
+        assert len(calls) == 1
+
+    def test_rate_limit_reset_honored(self, sleeps: list[float]) -> None:
+        """Test GitHub rate-limit 403s wait for X-RateLimit-Reset."""
+        reset = str(int(time.time()) + 10)
+        handler, _ = scripted(
+            httpx.Response(
+                403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+            ),
+            httpx.Response(200),
+        )
+
+        assert client(handler).get("https://api.github.com/x").status_code == 200
+        assert 8 <= sleeps[0] <= 11
+
+    def test_plain_403_not_retried(self, sleeps: list[float]) -> None:
+        """Test permission errors aren't mistaken for rate limits."""
+        handler, calls = scripted(httpx.Response(403), httpx.Response(200))
+
+        assert client(handler).get("https://x.io/a").status_code == 403
+        assert len(calls) == 1
+
+
+class TestAsyncRetryClient:
+    """Tests for AsyncRetryClient."""
+
+    def test_transient_errors_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the async client retries like the sync one."""
+        handler, calls = scripted(httpx.ConnectError("refused"), httpx.Response(201))
+
+        async def no_sleep(delay: float) -> None:
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+        async def post() -> httpx.Response:
+            async with AsyncRetryClient(
+                transport=httpx.MockTransport(handler), stats=HttpStats()
+            ) as async_client:
+                return await async_client.post("https://x.io/a")
+
+        assert asyncio.run(post()).status_code == 201
+        assert len(calls) == 2
+
+
+class TestEndpointName:
+    """Tests for endpoint_name."""
+
+    def test_collapses_ids(self) -> None:
+        """Test SHAs and numeric IDs share one endpoint name."""
+        sha = "a" * 40
+        request = httpx.Request(
+            "GET", f"https://api.github.com/repos/o/r/git/commits/{sha}"
+        )
+        assert endpoint_name(request) == "GET api.github.com/repos/o/r/git/commits/:id"
+        request = httpx.Request("GET", "https://co.looker.com/api/4.0/users/42")
+        assert endpoint_name(request) == "GET co.looker.com/api/4.0/users/:id"
+
+
+class TestHttpSessions:
+    """Tests for HttpSessions."""
+
+    class Sessions(HttpSessions):
+        """HttpSessions whose pools are mock transports."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.created: list[str] = []
+            self.closed: list[str] = []
+
+        def _create_transport(
+            self, url: httpx.URL, verify: object
+        ) -> httpx.BaseTransport:
+            host = url.host
+            self.created.append(host)
+            sessions = self
+
+            class Pool(httpx.MockTransport):
+                def close(self) -> None:
+                    sessions.closed.append(host)
+
+            return Pool(lambda request: httpx.Response(200, text=host))
+
+    def test_one_pool_per_host(self) -> None:
+        """Test clients share one pool per host that outlives each client."""
+        sessions = self.Sessions()
+
+        for _ in range(3):
+            with sessions.client(headers={"Authorization": "x"}) as client:
+                assert client.get("https://api.github.com/a").text == "api.github.com"
+                client.get("https://api.github.com/b")
+                client.get("https://co.looker.com/api/4.0/login")
+
+        assert sessions.created == ["api.github.com", "co.looker.com"]
+        assert sessions.closed == []
+        sessions.close()
+        assert sorted(sessions.closed) == ["api.github.com", "co.looker.com"]
+        assert len(sessions) == 0
+
+    def test_verify_settings_pooled_apart(self) -> None:
+        """Test unverified connections never share a pool with verified ones."""
+        sessions = self.Sessions()
+
+        sessions.client().get("https://co.looker.com/a")
+        sessions.client(verify=False).get("https://co.looker.com/a")
+
+        assert sessions.created == ["co.looker.com", "co.looker.com"]
+
+    def test_proxy_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test each host gets the proxy the environment sets for it."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+        monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+        assert proxy_for(httpx.URL("https://api.github.com/x")) == "http://proxy:3128"
+        assert proxy_for(httpx.URL("https://internal.example.com/x")) is None
@@ -0,0 +1,299 @@
+"""Tests for incremental builds driven by the manifest dependency graph."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from semantic_patterns.__main__ import cli
+from semantic_patterns.core.incremental import (
+    BuildPlan,
+    collect_sources,
+    compute_entity_graph_hash,
+    plan_build,
+)
+from semantic_patterns.ingestion import DomainBuilder
+from semantic_patterns.manifest import SPManifest, create_model_summary
+
+ORDERS = """
+semantic_models:
+  - name: orders
+    entities:
+      - name: order
+        type: primary
+        expr: order_id
+      - name: customer
+        type: foreign
+        expr: customer_id
+    dimensions:
+      - name: status
+        type: categorical
+        expr: status
+    measures:
+      - name: order_count
+        agg: count
+        expr: order_id
+"""
+
+CUSTOMERS = """
+semantic_models:
+  - name: customers
+    entities:
+      - name: customer
+        type: primary
+        expr: customer_id
+    dimensions:
+      - name: region
+        type: categorical
+        expr: region
+    measures:
+      - name: customer_count
+        agg: count
+        expr: customer_id
+"""
+
+ORDER_METRICS = """
+metrics:
+  - name: total_orders
+    type: simple
+    entity: order
+    measure: order_count
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a two-model project with a separate metrics file."""
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "orders.yml").write_text(ORDERS)
+    (models / "customers.yml").write_text(CUSTOMERS)
+    (models / "order_metrics.yml").write_text(ORDER_METRICS)
+    (tmp_path / "sp.yml").write_text(
+        f"""
+project: shop
+input: {models}
+output: {tmp_path / "output"}
+schema: test
+input_options:
+  cache: false
+output_options:
+  clean: clean
+  incremental: true
+looker:
+  explores:
+    - fact: orders
+"""
+    )
+    return tmp_path
+
+
+def build(project: Path, *args: str) -> str:
+    """Run sp build against the project, returning its output."""
+    result = CliRunner().invoke(
+        cli, ["build", "--config", str(project / "sp.yml"), *args]
+    )
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+class TestSourceTracking:
+    """Tests for recording which sources produce each model."""
+
+    def test_model_sources_include_metric_files(self, project: Path) -> None:
+        """Test metrics files are attributed to the model owning the metrics."""
+        models = {m.name: m for m in DomainBuilder.from_directory(project / "models")}
+
+        assert [Path(p).name for p in models["orders"].source_files] == [
+            "order_metrics.yml",
+            "orders.yml",
+        ]
+        assert [Path(p).name for p in models["customers"].source_files] == [
+            "customers.yml"
+        ]
+
+    def test_collect_sources(self, project: Path) -> None:
+        """Test one SourceInfo is recorded per (file, model) pair."""
+        models = DomainBuilder.from_directory(project / "models")
+        sources = collect_sources(models)
+
+        assert {(Path(s.path).name, s.model_name) for s in sources} == {
+            ("orders.yml", "orders"),
+            ("order_metrics.yml", "orders"),
+            ("customers.yml", "customers"),
+        }
+        assert all(len(s.hash) == 16 for s in sources)
+
+
+class TestPlanBuild:
+    """Tests for plan_build."""
+
+    def manifest_for(self, project: Path, config_hash: str = "cfg") -> SPManifest:
+        models = DomainBuilder.from_directory(project / "models")
+        return SPManifest.create(
+            project="shop",
+            config_hash=config_hash,
+            sources=collect_sources(models),
+            models=[create_model_summary(m) for m in models],
+            entity_graph_hash=compute_entity_graph_hash(models),
+        )
+
+    def plan(self, project: Path, previous: SPManifest | None) -> BuildPlan:
+        models = DomainBuilder.from_directory(project / "models")
+        return plan_build(
+            previous,
+            "cfg",
+            collect_sources(models),
+            models,
+            compute_entity_graph_hash(models),
+        )
+
+    def test_no_manifest_is_full(self, project: Path) -> None:
+        """Test the first build renders everything."""
+        assert self.plan(project, None).full
+
+    def test_config_change_is_full(self, project: Path) -> None:
+        """Test a changed config hash forces a full build."""
+        plan = self.plan(project, self.manifest_for(project, config_hash="old"))
+        assert plan.full
+        assert plan.reason == "config changed"
+
+    def test_nothing_changed(self, project: Path) -> None:
+        """Test an unchanged project affects no models."""
+        plan = self.plan(project, self.manifest_for(project))
+        assert not plan.full
+        assert plan.affected_models == set()
+        assert not plan.explores_dirty
+
+    def test_metrics_file_change_affects_owner(self, project: Path) -> None:
+        """Test editing a metrics file affects only the model it feeds."""
+        previous = self.manifest_for(project)
+        metrics = project / "models" / "order_metrics.yml"
+        metrics.write_text(ORDER_METRICS.replace("total_orders", "order_total"))
+
+        plan = self.plan(project, previous)
+        assert plan.affected_models == {"orders"}
+        assert not plan.explores_dirty
+
+    def test_entity_change_dirties_explores(self, project: Path) -> None:
+        """Test changing entities re-renders explores."""
+        previous = self.manifest_for(project)
+        orders = project / "models" / "orders.yml"
+        orders.write_text(ORDERS.replace("customer_id\n    dim", "cust_id\n    dim"))
+
+        plan = self.plan(project, previous)
+        assert plan.affected_models == {"orders"}
+        assert plan.explores_dirty
+
+
+class TestIncrementalBuild:
+    """End-to-end tests for sp build --incremental."""
+
+    def outputs(self, project: Path) -> dict[str, str]:
+        root = project / "output" / "shop"
+        return {
+            str(p.relative_to(root)): p.read_text()
+            for p in sorted(root.rglob("*.lkml"))
+        }
+
+    def test_records_dependency_graph(self, project: Path) -> None:
+        """Test the manifest records sources, view owners and explore deps."""
+        build(project)
+        manifest = json.loads((project / "output/shop/.sp-manifest.json").read_text())
+
+        assert {s["model_name"] for s in manifest["sources"]} == {
+            "orders",
+            "customers",
+        }
+        outputs = {o["path"]: o for o in manifest["outputs"]}
+        assert outputs["views/orders/orders.view.lkml"]["model"] == "orders"
+        assert outputs["explores/orders.explore.lkml"]["depends_on"] == [
+            "customers",
+            "orders",
+        ]
+
+    def test_rebuild_reuses_unchanged_models(self, project: Path) -> None:
+        """Test only the changed model's views are rewritten."""
+        build(project)
+        customers_view = project / "output/shop/views/customers/customers.view.lkml"
+        customers_view.touch()
+        mtime = customers_view.stat().st_mtime_ns
+
+        (project / "models" / "orders.yml").write_text(
+            ORDERS.replace("status", "order_status")
+        )
+        output = build(project, "--verbose")
+
+        assert "1 of 2 models changed" in output
+        assert customers_view.stat().st_mtime_ns == mtime
+        assert (
+            "order_status"
+            in (project / "output/shop/views/orders/orders.view.lkml").read_text()
+        )
+
+    def test_incremental_matches_full_build(self, project: Path) -> None:
+        """Test an incremental rebuild produces the same files as a full one."""
+        build(project)
+        (project / "models" / "customers.yml").write_text(
+            CUSTOMERS.replace("region", "country")
+        )
+        build(project)
+        incremental = self.outputs(project)
+
+        build(project, "--full")
+        assert self.outputs(project) == incremental
+
+    def test_edited_output_is_regenerated(self, project: Path) -> None:
+        """Test a hand-edited output file is not reused."""
+        build(project)
+        view = project / "output/shop/views/customers/customers.view.lkml"
+        original = view.read_text()
+        view.write_text("edited")
+
+        build(project)
+        assert view.read_text() == original
+
+
+class TestStreamingBuild:
+    """Tests for output_options.streaming."""
+
+    def enable_streaming(self, project: Path, extra: str = "") -> None:
+        config = project / "sp.yml"
+        config.write_text(
+            config.read_text().replace(
+                "incremental: true", f"incremental: true\n  streaming: true{extra}"
+            )
+        )
+
+    def snapshot(self, project: Path) -> tuple[dict[str, str], list[dict]]:
+        root = project / "output" / "shop"
+        files = {
+            str(p.relative_to(root)): p.read_text()
+            for p in sorted(root.rglob("*.lkml"))
+        }
+        manifest = json.loads((root / ".sp-manifest.json").read_text())
+        return files, manifest["outputs"]
+
+    def test_streaming_matches_buffered(self, project: Path) -> None:
+        """Test streaming writes the same files and manifest as a buffered build."""
+        build(project, "--full")
+        buffered = self.snapshot(project)
+
+        self.enable_streaming(project, "\n  write_workers: 4\n  fsync: true")
+        output = build(project, "--full")
+        assert self.snapshot(project) == buffered
+        assert "0 written, 5 unchanged" in output
+
+    def test_streaming_incremental_rebuild(self, project: Path) -> None:
+        """Test an incremental streaming rebuild rewrites only changed outputs."""
+        self.enable_streaming(project)
+        build(project)
+        (project / "models" / "customers.yml").write_text(
+            CUSTOMERS.replace("region", "country")
+        )
+        output = build(project)
+
+        view = project / "output/shop/views/customers/customers.view.lkml"
+        assert "country" in view.read_text()
+        assert "1 written, 4 unchanged" in output
@@ -6,7 +6,7 @@ import lkml
 import pytest
 
 from semantic_patterns.adapters.lookml import ExploreGenerator, LookMLGenerator
-from semantic_patterns.ingestion import DomainBuilder
+from semantic_patterns.ingestion import DomainBuilder, YamlLoader
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "integration"
 
@@ -23,6 +23,52 @@ class TestIntegrationWithFixtures:
         model_names = {m.name for m in models}
         assert model_names == {"rentals", "facilities", "reviews"}
 
+    def test_parallel_load_matches_serial(self):
+        """Test process-pool parsing yields byte-identical LookML."""
+        serial_docs = YamlLoader(FIXTURES_DIR).load_all()
+        parallel_docs = YamlLoader(FIXTURES_DIR, workers=3).load_all()
+        assert parallel_docs == serial_docs
+
+        generator = LookMLGenerator()
+        serial = generator.generate(DomainBuilder.from_directory(FIXTURES_DIR))
+        parallel = generator.generate(
+            DomainBuilder.from_directory(FIXTURES_DIR, workers=3)
+        )
+        assert parallel == serial
+
+    def test_parallel_render_matches_serial(self, tmp_path: Path):
+        """Test process-pool view rendering yields identical, ordered output."""
+        from semantic_patterns.adapters.lookml.paths import OutputPaths
+
+        models = DomainBuilder.from_directory(FIXTURES_DIR)
+        paths = OutputPaths(project="proj", base_path=tmp_path)
+        generator = LookMLGenerator()
+
+        serial = list(generator.render_models(models, paths))
+        parallel = list(generator.render_models(models, paths, workers=2, chunksize=1))
+
+        assert [name for name, _ in parallel] == [m.name for m in models]
+        assert parallel == serial
+
+    def test_parallel_render_counts_worker_sql_parses(self, tmp_path: Path):
+        """Test SQL cache stats include parses made in render workers."""
+        from semantic_patterns.adapters.lookml.paths import OutputPaths
+        from semantic_patterns.adapters.sql_cache import get_sql_parse_cache
+
+        models = DomainBuilder.from_directory(FIXTURES_DIR)
+        paths = OutputPaths(project="proj", base_path=tmp_path)
+        generator = LookMLGenerator()
+        sql_cache = get_sql_parse_cache()
+
+        def lookups(workers: int) -> int:
+            before = sql_cache.hits + sql_cache.misses
+            list(generator.render_models(models, paths, workers=workers, chunksize=1))
+            return sql_cache.hits + sql_cache.misses - before
+
+        serial = lookups(1)
+        assert serial > 0
+        assert lookups(2) == serial
+
     def test_explore_configs_from_fact_models(self):
         """Test creating explore configs from fact model names."""
         # Explore configuration is now owned by the adapter, not ingestion
@@ -0,0 +1,193 @@
+"""Tests for Looker access token caching."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from rich.console import Console
+
+from semantic_patterns import credentials
+from semantic_patterns.config import LookerConfig
+from semantic_patterns.destinations.looker.client import (
+    LOOKER_TOKEN_KEY_PREFIX,
+    LookerClient,
+)
+from semantic_patterns.destinations.looker.http import HttpSessions
+
+BASE_URL = "https://co.looker.com"
+
+
+class FakeLooker(HttpSessions):
+    """HttpSessions answering Looker's /login and /user from memory."""
+
+    def __init__(self, expires_in: int = 3600) -> None:
+        super().__init__()
+        self.expires_in = expires_in
+        self.logins = 0
+        self.revoked: set[str] = set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/4.0/login":
+            self.logins += 1
+            return httpx.Response(
+                200,
+                json={
+                    "access_token": f"token-{self.logins}",
+                    "expires_in": self.expires_in,
+                },
+            )
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not token.startswith("token-") or token in self.revoked:
+            return httpx.Response(401)
+        return httpx.Response(200, json={"email": "me@example.com"})
+
+    def _create_transport(self, url: httpx.URL, verify: object) -> httpx.BaseTransport:
+        return httpx.MockTransport(self.handler)
+
+
+@pytest.fixture(autouse=True)
+def token_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the credential store and token cache in tmp_path."""
+    monkeypatch.setattr(credentials, "CREDENTIALS_DIR", tmp_path)
+    monkeypatch.setattr(credentials, "CREDENTIALS_FILE", tmp_path / "creds.json")
+    monkeypatch.setattr(credentials, "TOKEN_CACHE_FILE", tmp_path / "tokens.json")
+    monkeypatch.setattr(credentials, "_default_store", None)
+    return tmp_path / "tokens.json"
+
+
+def looker_client(fake: FakeLooker) -> LookerClient:
+    return LookerClient(
+        LookerConfig(base_url=BASE_URL), Console(quiet=True), sessions=fake
+    )
+
+
+class TestLookerTokenCache:
+    """Tests for LookerClient token reuse and refresh."""
+
+    def test_token_reused_until_expiry(self, token_file: Path) -> None:
+        """Test repeated calls (and new clients) share one login."""
+        fake = FakeLooker()
+
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+
+        assert fake.logins == 1
+        assert "token-1" in token_file.read_text()
+        assert "secret" not in token_file.read_text()
+
+    def test_credentials_file_untouched(self, tmp_path: Path) -> None:
+        """Test logins never rewrite the file holding stored secrets."""
+        creds = tmp_path / "creds.json"
+        creds.write_text('{"looker-client-secret": "secret"}')
+        mtime = creds.stat().st_mtime_ns
+
+        looker_client(FakeLooker()).get_access_token("id", "secret")
+
+        assert creds.stat().st_mtime_ns == mtime
+        assert creds.read_text() == '{"looker-client-secret": "secret"}'
+
+    def test_unreadable_cache_is_a_miss(self, token_file: Path) -> None:
+        """Test a corrupt token file just means logging in again."""
+        token_file.write_text("{not json")
+        fake = FakeLooker()
+
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+        assert "token-1" in token_file.read_text()
+
+    def test_malformed_entries_dropped(self, token_file: Path) -> None:
+        """Test entries without a numeric expires_at don't break logins."""
+        token_file.write_text(
+            '{"a": {"expires_at": "soon"}, "b": {"expires_at": null},'
+            ' "c": {"expires_at": true}, "d": "token", "e": {}}'
+        )
+        fake = FakeLooker()
+
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+        assert fake.logins == 1
+        cached = json.loads(token_file.read_text())
+        assert len(cached) == 1
+        assert next(iter(cached)).startswith(LOOKER_TOKEN_KEY_PREFIX)
+
+    def test_unwritable_cache_not_fatal(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test logins still work when the token file can't be written."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")  # A file where the cache folder should be
+        monkeypatch.setattr(credentials, "TOKEN_CACHE_FILE", blocker / "t.json")
+        fake = FakeLooker()
+
+        assert looker_client(fake).get_access_token("id", "secret") == "token-1"
+        assert looker_client(fake).get_access_token("id", "secret") == "token-2"
+
+    def test_changed_secret_not_reused(self) -> None:
+        """Test a token is only reused with the secret that obtained it."""
+        fake = FakeLooker()
+
+        looker_client(fake).get_access_token("id", "secret")
+        looker_client(fake).get_access_token("id", "new-secret")
+
+        assert fake.logins == 2
+
+    def test_refreshed_shortly_before_expiry(self) -> None:
+        """Test a token inside the refresh margin isn't handed out."""
+        fake = FakeLooker(expires_in=30)
+
+        looker_client(fake).get_access_token("id", "secret")
+        assert looker_client(fake).get_access_token("id", "secret") == "token-2"
+
+        assert fake.logins == 2
+
+    def test_expired_token_not_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a cached token past its expiry triggers a new login."""
+        fake = FakeLooker()
+        looker_client(fake).get_access_token("id", "secret")
+
+        later = time.time() + 3600
+        monkeypatch.setattr(time, "time", lambda: later)
+
+        assert looker_client(fake).get_access_token("id", "secret") == "token-2"
+
+    def test_cache_keyed_by_instance_and_client_id(self) -> None:
+        """Test tokens aren't shared across API keys or instances."""
+        fake = FakeLooker()
+        client = looker_client(fake)
+
+        client.get_access_token("id", "secret")
+        client.get_access_token("other", "secret")
+        LookerClient(
+            LookerConfig(base_url="https://other.looker.com"),
+            Console(quiet=True),
+            sessions=fake,
+        ).get_access_token("id", "secret")
+
+        assert fake.logins == 3
+
+    def test_auth_refreshes_on_401(self) -> None:
+        """Test a revoked token is replaced and the request resent once."""
+        fake = FakeLooker()
+        client = looker_client(fake)
+        auth = client.auth("id", "secret")
+        fake.revoked.add("token-1")
+
+        with fake.client(auth=auth) as http:
+            response = http.get(f"{BASE_URL}/api/4.0/user")
+
+        assert response.status_code == 200
+        assert auth.token == "token-2"
+        assert client.get_access_token("id", "secret") == "token-2"
+        assert fake.logins == 2
+
+    def test_clear_drops_cached_tokens(self) -> None:
+        """Test deleting by prefix forces a new login."""
+        fake = FakeLooker()
+        looker_client(fake).get_access_token("id", "secret")
+
+        assert credentials.TokenCache().delete(LOOKER_TOKEN_KEY_PREFIX) == 1
+        looker_client(fake).get_access_token("id", "secret")
+        assert fake.logins == 2
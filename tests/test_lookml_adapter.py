@@ -1,9 +1,12 @@
 """Tests for LookML adapter."""
 
+import pytest
+from sqlglot.errors import ParseError
 
-from semantic_patterns.adapters import Dialect, SqlRenderer
+from semantic_patterns.adapters import Dialect, SqlRenderer, sql_cache
 from semantic_patterns.adapters.lookml import (
     DimensionRenderer,
+    FieldIndex,
     LookMLGenerator,
     MeasureRenderer,
     PopRenderer,
@@ -15,6 +18,11 @@ from semantic_patterns.adapters.lookml.renderers.calendar import (
     PopCalendarConfig,
 )
 from semantic_patterns.adapters.lookml.renderers.pop import DynamicFilteredPopStrategy
+from semantic_patterns.adapters.lookml.sql_qualifier import (
+    LookMLSqlQualifier,
+    qualify_table_columns,
+)
+from semantic_patterns.adapters.sql_cache import SqlParseCache, get_sql_parse_cache
 from semantic_patterns.domain import (
     AggregationType,
     ConnectionType,
@@ -63,6 +71,65 @@ class TestDialect:
         assert set(cols) == {"a", "b", "c"}
 
 
+class TestSqlParseCache:
+    """Tests for the shared sqlglot parse cache."""
+
+    def test_hit_returns_independent_copy(self):
+        """Test repeated parses hit the cache and can be mutated safely."""
+        cache = SqlParseCache()
+        first = cache.parse("a + b", "redshift")
+        first.set("this", None)
+        second = cache.parse("a + b", "redshift")
+
+        assert second.sql() == "a + b"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keyed_by_dialect(self):
+        """Test the same expression in another dialect is parsed separately."""
+        cache = SqlParseCache()
+        cache.parse("a", "redshift")
+        cache.parse("a", "bigquery")
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+    def test_lru_bound(self):
+        """Test the least recently used entry is evicted at maxsize."""
+        cache = SqlParseCache(maxsize=2)
+        cache.parse("a")
+        cache.parse("b")
+        cache.parse("a")
+        cache.parse("c")
+
+        cache.parse("a")
+        assert cache.hits == 2
+        cache.parse("b")
+        assert cache.misses == 4
+        assert len(cache) == 2
+
+    def test_parse_errors_cached(self):
+        """Test invalid SQL raises on every call but is parsed once."""
+        cache = SqlParseCache()
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                cache.parse("SELECT (", "redshift")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_shared_across_qualifiers(self):
+        """Test every qualification path goes through the shared cache."""
+        cache = get_sql_parse_cache()
+        expr = "shared_cache_probe_column * 2"
+        hits = cache.hits
+
+        qualify_table_columns(expr, Dialect.REDSHIFT)
+        LookMLSqlQualifier(Dialect.REDSHIFT).qualify(expr)
+        SqlRenderer(Dialect.REDSHIFT).qualify_expression(expr)
+
+        assert cache.hits - hits == 2
+        assert qualify_table_columns(expr, Dialect.REDSHIFT) == (
+            "${TABLE}.shared_cache_probe_column * 2"
+        )
+
+
 class TestDimensionRenderer:
     """Tests for dimension rendering."""
 
@@ -221,6 +288,92 @@ class TestPopRenderer:
         assert "gmv_pm_pct_change" in names
 
 
+class TestFieldIndex:
+    """Tests for the per-model field lookup."""
+
+    def _model(self) -> ProcessedModel:
+        return ProcessedModel(
+            name="rentals",
+            dimensions=[
+                Dimension(
+                    name="transaction_type",
+                    type=DimensionType.CATEGORICAL,
+                    expr="rental_event_type",
+                ),
+                Dimension(
+                    name="created_at",
+                    type=DimensionType.TIME,
+                    granularity=TimeGranularity.DAY,
+                    expr="rental_created_at_utc",
+                ),
+                Dimension(
+                    name="starts_at",
+                    type=DimensionType.TIME,
+                    granularity=TimeGranularity.DAY,
+                    primary_variant="utc",
+                    variants={"utc": "starts_utc", "local": "starts_local"},
+                ),
+                Dimension(
+                    name="segment",
+                    type=DimensionType.CATEGORICAL,
+                    expr="UPPER(segment_code)",
+                ),
+            ],
+            entities=[Entity(name="rental", type="primary", expr="rental_sk")],
+        )
+
+    def test_fields(self):
+        """Test columns and names map to dimension, _raw and entity fields."""
+        index = FieldIndex.from_model(self._model())
+
+        assert index.fields == {
+            "transaction_type": "transaction_type",
+            "rental_event_type": "transaction_type",
+            "created_at": "created_at_raw",
+            "rental_created_at_utc": "created_at_raw",
+            "starts_at_utc": "starts_at_utc_raw",
+            "starts_utc": "starts_at_utc_raw",
+            "starts_at_local": "starts_at_local_raw",
+            "starts_local": "starts_at_local_raw",
+            "segment": "segment",
+            "rental": "rental",
+            "rental_sk": "rental",
+        }
+
+    def test_columns_names_and_raw_fields(self):
+        """Test the column, name and _raw views of the index."""
+        index = FieldIndex.from_model(self._model())
+
+        assert index.columns["rental_event_type"] == "transaction_type"
+        assert "transaction_type" not in index.columns
+        assert index.names["rental"] == "rental"
+        assert "rental_sk" not in index.names
+        assert index.raw_fields == {
+            "created_at": "created_at_raw",
+            "starts_at_utc": "starts_at_utc_raw",
+            "starts_at_local": "starts_at_local_raw",
+        }
+
+    def test_parses_each_expression_once(self, monkeypatch):
+        """Test each expression is parsed once across index and renderers."""
+        cache = SqlParseCache()
+        monkeypatch.setattr(sql_cache, "_cache", cache)
+        model = self._model()
+
+        index = FieldIndex.from_model(model)
+        # Plain columns skip the parser; only UPPER(segment_code) is parsed
+        assert cache.misses == 1
+
+        renderer = ViewRenderer()
+        renderer.render_base_view(model, index)
+        renderer.render_metrics_refinement(model, index)
+        first_render = cache.misses
+        renderer.render_base_view(model, index)
+        renderer.render_metrics_refinement(model, index)
+
+        assert cache.misses == first_render
+
+
 class TestViewRenderer:
     """Tests for view rendering."""
 
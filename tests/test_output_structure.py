@@ -217,6 +217,9 @@ schema: test
 model:
   connection: test_conn
 
+input_options:
+  cache_dir: {tmp_path / ".sp-cache"}
+
 output_options:
   clean: clean
   manifest: true
@@ -311,6 +314,8 @@ output: {tmp_path / "output"}
 schema: test
 model:
   connection: test_conn
+input_options:
+  cache_dir: {tmp_path / ".sp-cache"}
 output_options:
   clean: clean
 """
@@ -0,0 +1,124 @@
+"""Scale benchmarks guarding against super-linear build behaviour.
+
+Each benchmark times the same operation on a project and on one four
+times larger. Linear code lands near a 4x ratio; an accidental
+O(n^2) path lands near 16x, so the bound leaves plenty of room for
+timing noise while still catching regressions.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from semantic_patterns.adapters.lookml.renderers.explore import ExploreRenderer
+from semantic_patterns.adapters.lookml.types import ExploreConfig
+from semantic_patterns.domain import EntityGraph
+from semantic_patterns.ingestion import DomainBuilder
+
+pytestmark = pytest.mark.performance
+
+SCALE = 4
+MAX_RATIO = 8.0
+
+
+def best_time(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the fastest of several timed runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def synthetic_project(models: int, metrics_per_model: int = 7) -> dict[str, Any]:
+    """Build a document with one primary entity and several metrics per model."""
+    semantic_models = []
+    metrics = []
+    for i in range(models):
+        semantic_models.append(
+            {
+                "name": f"model_{i}",
+                "entities": [{"name": f"entity_{i}", "type": "primary", "expr": "id"}],
+                "dimensions": [
+                    {"name": "status", "type": "categorical", "expr": "status"}
+                ],
+                "measures": [{"name": "row_count", "agg": "count"}],
+            }
+        )
+        for j in range(metrics_per_model):
+            metrics.append(
+                {
+                    "name": f"metric_{i}_{j}",
+                    "type": "simple",
+                    "entity": f"entity_{i}",
+                    "measure": "row_count",
+                }
+            )
+    return {"semantic_models": semantic_models, "metrics": metrics}
+
+
+class TestDomainBuilderScale:
+    """Benchmarks for DomainBuilder.build()."""
+
+    def test_build_scales_linearly(self) -> None:
+        """Test build time grows linearly with models and metrics."""
+        small = synthetic_project(200)
+        large = synthetic_project(200 * SCALE)
+
+        small_time = best_time(lambda: DomainBuilder.from_dict(small))
+        large_time = best_time(lambda: DomainBuilder.from_dict(large))
+
+        assert large_time / small_time < MAX_RATIO
+
+    def test_metrics_assigned_by_primary_entity(self) -> None:
+        """Test the entity index assigns each model only its own metrics."""
+        models = DomainBuilder.from_dict(synthetic_project(50, metrics_per_model=3))
+
+        for i, model in enumerate(models):
+            assert [m.name for m in model.metrics] == [
+                f"metric_{i}_{j}" for j in range(3)
+            ]
+
+
+def chain_project(models: int) -> dict[str, Any]:
+    """Build a chain where each model has a foreign key to the previous one."""
+    semantic_models = []
+    for i in range(models):
+        entities = [{"name": f"entity_{i}", "type": "primary", "expr": "id"}]
+        if i:
+            entities.append(
+                {"name": f"entity_{i - 1}", "type": "foreign", "expr": "parent_id"}
+            )
+        semantic_models.append(
+            {
+                "name": f"model_{i}",
+                "entities": entities,
+                "measures": [{"name": "row_count", "agg": "count"}],
+            }
+        )
+    return {"semantic_models": semantic_models}
+
+
+class TestJoinInferenceScale:
+    """Benchmarks for join inference across every explore."""
+
+    def infer_all(self, models: dict[str, Any], join_depth: int) -> None:
+        graph = EntityGraph(models.values())
+        renderer = ExploreRenderer()
+        for name, model in models.items():
+            config = ExploreConfig(name=name, fact=name, join_depth=join_depth)
+            renderer.infer_joins(model, models, config, graph)
+
+    @pytest.mark.parametrize("join_depth", [1, 3])
+    def test_infer_joins_scales_linearly(self, join_depth: int) -> None:
+        """Test one explore per model stays linear with a shared entity graph."""
+        small = {m.name: m for m in DomainBuilder.from_dict(chain_project(150))}
+        large = {m.name: m for m in DomainBuilder.from_dict(chain_project(150 * SCALE))}
+
+        small_time = best_time(lambda: self.infer_all(small, join_depth))
+        large_time = best_time(lambda: self.infer_all(large, join_depth))
+
+        assert large_time / small_time < MAX_RATIO
@@ -0,0 +1,183 @@
+"""Golden tests: the native LookML writer must match lkml.dump byte-for-byte."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import lkml
+import pytest
+
+from semantic_patterns.adapters.dialect import Dialect
+from semantic_patterns.adapters.lookml import ExploreGenerator, LookMLGenerator
+from semantic_patterns.adapters.lookml.serializer import (
+    LookMLWriter,
+    dump_lookml,
+)
+from semantic_patterns.adapters.lookml.types import ExploreConfig
+from semantic_patterns.config import OptionsConfig
+from semantic_patterns.domain import ProcessedModel
+from semantic_patterns.ingestion import DbtLoader, DbtMapper, DomainBuilder
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _fixture_models() -> dict[str, list[ProcessedModel]]:
+    semantic_models, metrics = DbtLoader(FIXTURES_DIR / "dbt").load_all()
+    mapper = DbtMapper()
+    mapper.add_semantic_models(semantic_models)
+    mapper.add_metrics(metrics)
+    return {
+        "integration": DomainBuilder.from_directory(FIXTURES_DIR / "integration"),
+        "dbt": DomainBuilder.from_documents(mapper.get_documents()),
+    }
+
+
+def _generate_all(serializer: str) -> dict[str, str]:
+    """Every view and explore file for the fixture projects."""
+    files: dict[str, str] = {}
+    for project, models in _fixture_models().items():
+        by_name = {model.name: model for model in models}
+        facts = {name: name for name in by_name}
+        for pop_strategy in ["dynamic", "native"]:
+            for dialect in [Dialect.REDSHIFT, Dialect.BIGQUERY]:
+                prefix = f"{project}/{pop_strategy}/{dialect.value}"
+                generator = LookMLGenerator(
+                    dialect=dialect,
+                    pop_strategy_type=pop_strategy,
+                    model_to_explore=facts,
+                    model_to_fact=facts,
+                    serializer=serializer,
+                )
+                for name, content in generator.generate(models).items():
+                    files[f"{prefix}/{name}"] = content
+
+                explore_gen = ExploreGenerator(dialect=dialect, serializer=serializer)
+                configs = [ExploreConfig(name=name, fact=name) for name in by_name]
+                for name, content in explore_gen.generate(configs, by_name).items():
+                    files[f"{prefix}/{name}"] = content
+    return files
+
+
+# Shapes lkml treats specially, beyond what the fixtures exercise
+EDGE_CASES: list[dict[str, Any]] = [
+    {"views": [{"name": "empty"}]},
+    {"views": [{"name": "a"}, {"name": "b", "dimensions": []}]},
+    {
+        "views": [
+            {
+                "name": "orders",
+                "extends": ["base"],
+                "label": 'Say "hi"',
+                "description": 'Already \\"escaped\\"',
+                "sql_table_name": "  schema.orders  ",
+                "drill_fields": [],
+                "sets": [
+                    {"name": "short", "fields": ["a", "b"]},
+                    {"name": "long", "fields": ["a", "b", "c", "d", "e"]},
+                ],
+                "dimensions": [
+                    {
+                        "name": "status",
+                        "suggestions": ["open", "closed"],
+                        "tags": ["x"],
+                        "link": {"label": "Go", "url": "https://x"},
+                    },
+                    {"name": "plain"},
+                ],
+                "filters": [{"name": "region", "type": "string"}],
+                "measures": [
+                    {
+                        "name": "count_open",
+                        "type": "count",
+                        "filters": [{"status": "open"}, {"plain": "-NULL"}],
+                    },
+                    {
+                        "name": "legacy",
+                        "type": "count",
+                        "filters": [{"field": "status", "value": "open"}],
+                    },
+                ],
+                "hidden": "yes",
+            }
+        ]
+    },
+    {
+        "explores": [
+            {
+                "name": "orders",
+                "always_filter": {"filters": [{"created_date": "7 days"}]},
+                "joins": [
+                    {
+                        "name": "customers",
+                        "sql_on": "${orders.customer_id} = ${customers.id}",
+                        "relationship": "many_to_one",
+                        "fields": ["customers.name"],
+                    },
+                    {"name": "empty_join"},
+                ],
+            }
+        ]
+    },
+    {
+        "access_grants": [
+            {"name": "can_see", "user_attribute": "dept", "allowed_values": ["a"]}
+        ],
+        "explores": [{"name": "x", "required_access_grants": ["can_see"]}],
+    },
+]
+
+
+class TestNativeSerializerGolden:
+    """Byte-for-byte equality with lkml.dump."""
+
+    def test_fixture_outputs_identical(self) -> None:
+        """Test every fixture view and explore file matches the lkml output."""
+        native = _generate_all("native")
+        reference = _generate_all("lkml")
+
+        assert len(native) > 20
+        assert native.keys() == reference.keys()
+        for name, content in reference.items():
+            assert native[name] == content, name
+
+    @pytest.mark.parametrize("obj", EDGE_CASES)
+    def test_edge_cases_identical(self, obj: dict[str, Any]) -> None:
+        """Test special lkml shapes serialize identically."""
+        assert LookMLWriter().dump(obj) == lkml.dump(obj)
+
+    def test_input_not_mutated(self) -> None:
+        """Test filter-only fields keep their name key after serializing."""
+        obj = {"views": [{"name": "v", "filters": [{"name": "f", "type": "string"}]}]}
+        LookMLWriter().dump(obj)
+        assert obj["views"][0]["filters"][0]["name"] == "f"
+
+    def test_writer_reusable(self) -> None:
+        """Test one writer produces independent documents."""
+        writer = LookMLWriter()
+        first = writer.dump({"views": [{"name": "a"}]})
+        assert writer.dump({"views": [{"name": "a"}]}) == first
+
+
+class TestSerializerMode:
+    """Tests for the serializer mode flag."""
+
+    def test_default_is_native(self) -> None:
+        """Test generators and options default to the native writer."""
+        assert LookMLGenerator().serializer == "native"
+        assert ExploreGenerator().serializer == "native"
+        assert OptionsConfig().serializer == "native"
+
+    def test_invalid_serializer(self) -> None:
+        """Test unknown serializer names are rejected up front."""
+        with pytest.raises(ValueError, match="Invalid serializer"):
+            LookMLGenerator(serializer="fast")
+        with pytest.raises(ValueError, match="Invalid serializer"):
+            OptionsConfig(serializer="fast")
+        with pytest.raises(ValueError, match="Invalid serializer"):
+            dump_lookml({}, "fast")
+
+    def test_unsupported_value_type(self) -> None:
+        """Test non-string scalars raise like lkml.dump does."""
+        with pytest.raises(TypeError):
+            dump_lookml({"views": [{"name": "v", "hidden": True}]})
@@ -0,0 +1,188 @@
+"""Tests for LookML SQL qualification."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from sqlglot.dialects.dialect import Dialect as SqlglotDialect
+
+from semantic_patterns.adapters.dialect import Dialect
+from semantic_patterns.adapters.lookml import sql_qualifier
+from semantic_patterns.adapters.lookml.sql_qualifier import (
+    LookMLSqlQualifier,
+    qualify_table_columns,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Identifiers sqlglot treats specially in some dialects
+TRICKY = [
+    "user",
+    "sysdate",
+    "localtime",
+    "current_date",
+    "date",
+    "day",
+    "null",
+    "true",
+    "Foo",
+    "names",
+    "level",
+    "rownum",
+    "_x1",
+    "a.b",
+    "orders.status",
+    "a.b.c",
+    " padded ",
+    "a . b",
+    '"quoted"',
+    "`quoted`",
+    "1col",
+    "amount * 2",
+    "",
+]
+
+
+def _fixture_expressions() -> list[str]:
+    """Every expr / sql value in the YAML fixture corpus."""
+
+    def walk(node: Any) -> Iterator[str]:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ("expr", "sql") and isinstance(value, str):
+                    yield value
+                else:
+                    yield from walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                yield from walk(item)
+
+    found: set[str] = set()
+    for path in FIXTURES_DIR.rglob("*.yml"):
+        found.update(walk(yaml.safe_load(path.read_text(encoding="utf-8"))))
+    return sorted(found)
+
+
+def _function_names() -> list[str]:
+    """Every sqlglot function name, used as a bare identifier."""
+    return sorted({name.lower() for name in SqlglotDialect().parser_class.FUNCTIONS})
+
+
+CORPUS = _fixture_expressions() + TRICKY + _function_names()
+
+
+@pytest.fixture
+def no_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force every expression through sqlglot."""
+    monkeypatch.setattr(sql_qualifier, "_simple_reference", lambda expr, d: None)
+
+
+def _qualify_all(dialect: Dialect) -> list[tuple[str, str, str]]:
+    qualifier = LookMLSqlQualifier(dialect)
+    fields = {"status": "status", "rental_segment": "segment", "Foo": "foo_dim"}
+    return [
+        (
+            expr,
+            qualify_table_columns(expr, dialect),
+            qualifier.qualify(expr, fields),
+        )
+        for expr in CORPUS
+    ]
+
+
+class TestFastPathDifferential:
+    """The fast path must produce exactly what sqlglot produces."""
+
+    def test_corpus_is_non_trivial(self) -> None:
+        """Test the corpus includes real fixture expressions."""
+        assert len(_fixture_expressions()) > 10
+
+    @pytest.mark.parametrize("dialect", list(Dialect))
+    def test_identical_output(
+        self, dialect: Dialect, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test fast-path output matches the sqlglot path for every dialect."""
+        fast = _qualify_all(dialect)
+        monkeypatch.setattr(sql_qualifier, "_simple_reference", lambda expr, d: None)
+        slow = _qualify_all(dialect)
+
+        assert fast == slow
+
+
+class TestFastPath:
+    """Tests for which expressions take the fast path."""
+
+    def test_bare_column(self, no_fast_path: None) -> None:
+        """Test the sqlglot path agrees with the documented outputs."""
+        assert qualify_table_columns("amount") == "${TABLE}.amount"
+
+    def test_fast_path_skips_parse(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test plain references never reach sqlglot."""
+
+        def fail(expr: str, dialect: str = "") -> None:
+            raise AssertionError(f"parsed {expr!r}")
+
+        monkeypatch.setattr(sql_qualifier, "parse_sql", fail)
+        qualifier = LookMLSqlQualifier(Dialect.REDSHIFT)
+
+        assert qualify_table_columns("amount") == "${TABLE}.amount"
+        assert qualify_table_columns("orders.amount") == "orders.amount"
+        assert qualifier.qualify("status", {"status": "order_status"}) == (
+            "${order_status}"
+        )
+        assert qualifier.qualify("amount", {}) == "${TABLE}.amount"
+
+    def test_reserved_words_use_sqlglot(self) -> None:
+        """Test keywords and no-paren functions are not treated as columns."""
+        redshift = sql_qualifier._get_sqlglot_dialect(Dialect.REDSHIFT)
+        assert sql_qualifier._simple_reference("sysdate", redshift) is None
+        assert sql_qualifier._simple_reference("user", redshift) is None
+        assert sql_qualifier._simple_reference("current_date", redshift) is None
+        assert sql_qualifier._simple_reference("rental_id", redshift) == (
+            "",
+            "rental_id",
+        )
+
+
+class TestLookMLGeneration:
+    """Tests for emitting ${field} / ${TABLE}.col in one generation pass."""
+
+    def test_mixed_references(self) -> None:
+        """Test defined fields, raw columns and qualified columns together."""
+        qualifier = LookMLSqlQualifier(Dialect.REDSHIFT)
+        result = qualifier.qualify(
+            "CASE WHEN status = 'active' THEN o.amount + fee END",
+            {"status": "order_status"},
+        )
+        assert result == (
+            "CASE WHEN ${order_status} = 'active' THEN o.amount + ${TABLE}.fee END"
+        )
+
+    def test_functions_and_date_parts(self) -> None:
+        """Test date-part keywords stay keywords inside functions."""
+        result = qualify_table_columns("DATEADD(day, -1, created_at)", Dialect.REDSHIFT)
+        assert result == "DATEADD(DAY, -1, ${TABLE}.created_at)"
+
+    @pytest.mark.parametrize(
+        ("dialect", "expr", "expected"),
+        [
+            (Dialect.REDSHIFT, '"My Col" + 1', '${TABLE}."My Col" + 1'),
+            (Dialect.SNOWFLAKE, '"status"', '${TABLE}."status"'),
+            (Dialect.BIGQUERY, "`my col` * 2", "${TABLE}.`my col` * 2"),
+        ],
+    )
+    def test_quoted_identifiers_kept(
+        self, dialect: Dialect, expr: str, expected: str
+    ) -> None:
+        """Test quoted column names keep their quotes after ${TABLE}."""
+        assert qualify_table_columns(expr, dialect) == expected
+
+    def test_reserved_word_not_quoted(self) -> None:
+        """Test unquoted columns are written as authored, never re-quoted."""
+        assert qualify_table_columns("left + 1", Dialect.BIGQUERY) == (
+            "${TABLE}.left + 1"
+        )
@@ -0,0 +1,231 @@
+"""Tests for sp build --watch."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from semantic_patterns import credentials
+from semantic_patterns.__main__ import cli
+from semantic_patterns.config import LookerConfig, SPConfig
+from semantic_patterns.core.watch import Watcher, changed_files, snapshot
+from semantic_patterns.destinations.looker import destination
+from semantic_patterns.destinations.looker.github import GitHubClient
+from semantic_patterns.destinations.looker.http import HttpSessions
+from tests.test_github import FakeGitHub, serve
+
+ORDERS = """
+semantic_models:
+  - name: orders
+    entities:
+      - name: order
+        type: primary
+        expr: order_id
+    dimensions:
+      - name: status
+        type: categorical
+        expr: status
+"""
+
+
+@pytest.fixture
+def config(tmp_path: Path) -> SPConfig:
+    """Config for a two-model project under tmp_path."""
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "orders.yml").write_text(ORDERS)
+    (models / "users.yml").write_text(ORDERS.replace("order", "user"))
+    return SPConfig.from_yaml(
+        f"""
+project: shop
+input: {models}
+output: {tmp_path / "output"}
+schema: test
+"""
+    )
+
+
+class TestSnapshot:
+    """Tests for snapshot and changed_files."""
+
+    def test_detects_added_removed_and_modified(self, tmp_path: Path) -> None:
+        """Test all three kinds of change are reported."""
+        (tmp_path / "a.yml").write_text("a: 1")
+        (tmp_path / "b.yml").write_text("b: 1")
+        before = snapshot(tmp_path)
+
+        (tmp_path / "a.yml").write_text("a: 22")
+        (tmp_path / "b.yml").unlink()
+        (tmp_path / "c.yml").write_text("c: 1")
+        after = snapshot(tmp_path)
+
+        assert {p.name for p in changed_files(before, after)} == {
+            "a.yml",
+            "b.yml",
+            "c.yml",
+        }
+        assert changed_files(after, after) == set()
+
+
+class TestWatcher:
+    """Tests for the Watcher rebuild loop."""
+
+    def test_debounce_collects_burst(self, config: SPConfig) -> None:
+        """Test changes arriving during the debounce window are batched."""
+        watcher = Watcher(config)
+        watcher.build()
+        orders = config.input_path / "orders.yml"
+        users = config.input_path / "users.yml"
+        edits = [
+            lambda: orders.write_text(ORDERS + "\n# edit"),
+            lambda: users.write_text(ORDERS.replace("order", "user") + "\n# edit"),
+        ]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if edits:
+                edits.pop(0)()
+
+        changed = watcher.wait_for_changes(sleep=fake_sleep)
+
+        assert {p.name for p in changed} == {"orders.yml", "users.yml"}
+        # One poll, then debounce until a quiet window
+        assert sleeps == [watcher.poll_interval, watcher.debounce, watcher.debounce]
+
+    def test_rebuild_rewrites_only_affected_views(self, config: SPConfig) -> None:
+        """Test a rebuild renders the changed model and reuses the rest."""
+        watcher = Watcher(config)
+        stats, _ = watcher.build()
+        assert stats.reused == 0
+
+        users_view = config.output_path / "shop/views/users/users.view.lkml"
+        users_view.touch()
+        mtime = users_view.stat().st_mtime_ns
+        (config.input_path / "orders.yml").write_text(ORDERS.replace("status", "state"))
+
+        stats, elapsed = watcher.build()
+
+        assert elapsed >= 0
+        assert stats.reused == stats.files - 1  # only orders.view.lkml
+        assert users_view.stat().st_mtime_ns == mtime
+        orders_view = config.output_path / "shop/views/orders/orders.view.lkml"
+        assert "state" in orders_view.read_text()
+
+    def test_parsed_documents_kept_in_memory(self, config: SPConfig) -> None:
+        """Test unchanged files are not re-parsed between rebuilds."""
+        watcher = Watcher(config)
+        watcher.build()
+        (config.input_path / "orders.yml").write_text(ORDERS + "\n# edit")
+        watcher.build()
+
+        cache = watcher.session.parse_cache
+        assert cache is not None
+        assert (cache.hits, cache.misses) == (1, 3)
+
+
+class TestWatchPush:
+    """Tests for pushing watch rebuilds to Looker."""
+
+    def test_rebuilds_reuse_connections_and_token(
+        self, config: SPConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test every push after a rebuild reuses the pools and Looker token."""
+        github = FakeGitHub({"README.md": "readme"})
+        logins: list[str] = []
+        looker_connections: set[tuple[str, int]] = set()
+
+        def looker(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/4.0/login":
+                logins.append(request.url.path)
+                return httpx.Response(
+                    200, json={"access_token": "token", "expires_in": 3600}
+                )
+            if request.url.path.endswith("/validate"):
+                return httpx.Response(200, json={"errors": []})
+            return httpx.Response(200, json={})
+
+        monkeypatch.setattr(credentials, "CREDENTIALS_DIR", tmp_path)
+        monkeypatch.setattr(credentials, "CREDENTIALS_FILE", tmp_path / "c.json")
+        monkeypatch.setattr(credentials, "TOKEN_CACHE_FILE", tmp_path / "t.json")
+        monkeypatch.setattr(credentials, "_default_store", None)
+        monkeypatch.setenv("GITHUB_TOKEN", "gh-token")
+        monkeypatch.setenv("LOOKER_CLIENT_ID", "id")
+        monkeypatch.setenv("LOOKER_CLIENT_SECRET", "secret")
+        sessions = HttpSessions(http2=False)
+        monkeypatch.setattr(destination, "get_http_sessions", lambda: sessions)
+
+        with github.serve() as github_url, serve(looker, looker_connections) as url:
+            monkeypatch.setattr(GitHubClient, "GITHUB_API_BASE", github_url)
+            looker_config = LookerConfig(
+                enabled=True,
+                repo="org/looker",
+                branch="sp-generated",
+                base_url="https://looker.test",
+                project_id="shop",
+            ).model_copy(update={"base_url": url})  # Plain HTTP fake
+            watcher = Watcher(
+                config.model_copy(update={"looker": looker_config}),
+                push=True,
+                poll_interval=0.01,
+                debounce=0.01,
+            )
+            watcher.build()
+            assert watcher.push()
+            orders = config.input_path / "orders.yml"
+            orders.write_text(ORDERS.replace("status", "state"))
+            watcher.run(max_rebuilds=1)
+            sessions.close()
+
+        pushed = github.branch_files()
+        assert any("orders.view.lkml" in p and "state" in c for p, c in pushed.items())
+        assert len(logins) == 1
+        assert len(github.connections) == 1
+        assert len(looker_connections) == 1
+
+
+class TestWatchCommand:
+    """Tests for the --watch CLI flag."""
+
+    def test_watch_with_push(
+        self, config: SPConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test --watch --push pushes the initial build before watching."""
+        pushes: list[Watcher] = []
+
+        def interrupt(self: Watcher) -> None:
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(Watcher, "run", interrupt)
+        monkeypatch.setattr(Watcher, "push", lambda self: pushes.append(self))
+        (tmp_path / "sp.yml").write_text(
+            f"input: {config.input}\noutput: {config.output}\nschema: s\n"
+        )
+        result = CliRunner().invoke(
+            cli, ["build", "-c", str(tmp_path / "sp.yml"), "--watch", "--push"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(pushes) == 1
+
+    def test_watch_builds_then_stops(
+        self, config: SPConfig, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the initial build runs and Ctrl+C stops watching cleanly."""
+
+        def interrupt(self: Watcher) -> None:
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(Watcher, "run", interrupt)
+        (tmp_path / "sp.yml").write_text(
+            f"input: {config.input}\noutput: {config.output}\nschema: s\n"
+            f"input_options:\n  cache: false\n"
+        )
+        result = CliRunner().invoke(
+            cli, ["build", "-c", str(tmp_path / "sp.yml"), "-w"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Watching" in result.output
+        assert "Stopped watching" in result.output
@@ -0,0 +1,247 @@
+"""Tests for the skip-unchanged atomic output writer."""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from semantic_patterns.core.writer import (
+    FilesOnDisk,
+    OutputWriteError,
+    OutputWriter,
+    atomic_write,
+)
+from semantic_patterns.manifest import OutputInfo, SPManifest, compute_content_hash
+
+
+def _manifest(project: Path, files: dict[str, str]) -> SPManifest:
+    return SPManifest.create(
+        project=project.name,
+        config_hash="x",
+        outputs=[
+            OutputInfo(path=path, hash=compute_content_hash(content), type="view")
+            for path, content in files.items()
+        ],
+    )
+
+
+class TestOutputWriter:
+    """Tests for OutputWriter."""
+
+    def test_first_write_creates_files(self, tmp_path: Path) -> None:
+        """Test new files and missing parent directories are written."""
+        writer = OutputWriter(tmp_path)
+        target = tmp_path / "views" / "orders" / "orders.view.lkml"
+
+        assert writer.write(target, "view: orders {}") is True
+        assert target.read_text() == "view: orders {}"
+        assert writer.written == [target]
+        assert writer.unchanged == []
+
+    def test_unchanged_content_not_rewritten(self, tmp_path: Path) -> None:
+        """Test identical content leaves the file (and its mtime) alone."""
+        target = tmp_path / "a.view.lkml"
+        target.write_text("same")
+        os.utime(target, ns=(0, 0))
+        writer = OutputWriter.from_manifest(
+            tmp_path, _manifest(tmp_path, {"a.view.lkml": "same"})
+        )
+
+        assert writer.write(target, "same") is False
+        assert target.stat().st_mtime_ns == 0
+        assert writer.unchanged == [target]
+
+    def test_hand_edit_overwritten(self, tmp_path: Path) -> None:
+        """Test a file edited since the last build is restored."""
+        target = tmp_path / "a.view.lkml"
+        target.write_text("edited")
+        writer = OutputWriter.from_manifest(
+            tmp_path, _manifest(tmp_path, {"a.view.lkml": "generated"})
+        )
+
+        assert writer.write(target, "generated") is True
+        assert target.read_text() == "generated"
+
+    def test_manifest_change_skips_disk_read(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a changed manifest hash writes without reading the old file."""
+        target = tmp_path / "a.view.lkml"
+        target.write_text("old")
+        writer = OutputWriter.from_manifest(
+            tmp_path, _manifest(tmp_path, {"a.view.lkml": "old"})
+        )
+
+        def fail(self: Path) -> bytes:
+            raise AssertionError("read old file")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        assert writer.write(target, "new") is True
+        monkeypatch.undo()
+        assert target.read_text() == "new"
+
+    def test_delete(self, tmp_path: Path) -> None:
+        """Test deletes are counted only for files that existed."""
+        target = tmp_path / "old.view.lkml"
+        target.write_text("x")
+        writer = OutputWriter(tmp_path)
+
+        assert writer.delete(target) is True
+        assert writer.delete(target) is False
+        assert writer.deleted == [target]
+        assert not target.exists()
+
+    def test_remove_orphans(self, tmp_path: Path) -> None:
+        """Test orphans are removed with their empty folders, and nothing outside."""
+        orphan = tmp_path / "views" / "returns" / "returns.view.lkml"
+        orphan.parent.mkdir(parents=True)
+        orphan.write_text("x")
+        kept = tmp_path / "views" / "orders" / "orders.view.lkml"
+        kept.parent.mkdir(parents=True)
+        kept.write_text("x")
+        outside = tmp_path.parent / f"{tmp_path.name}.lkml"
+        outside.write_text("x")
+        writer = OutputWriter(tmp_path)
+
+        removed = writer.remove_orphans(
+            ["views/returns/returns.view.lkml", "gone.lkml", f"../{outside.name}"]
+        )
+
+        assert removed == [orphan]
+        assert not orphan.parent.exists()
+        assert kept.exists()
+        assert outside.exists()
+
+
+class TestThreadedWriter:
+    """Tests for OutputWriter with a write thread pool."""
+
+    def files(self, root: Path) -> dict[Path, str]:
+        return {
+            root / "views" / f"m{i % 5}" / f"m{i}.view.lkml": f"view: m{i} {{}}"
+            for i in range(40)
+        }
+
+    def test_threaded_matches_serial(self, tmp_path: Path) -> None:
+        """Test pooled writes produce the same tree and counts as serial ones."""
+        results = []
+        for workers in (1, 4):
+            root = tmp_path / str(workers)
+            writer = OutputWriter(root, workers=workers)
+            for path, content in self.files(root).items():
+                writer.submit(path, content)
+            writer.close()
+            tree = {p.relative_to(root): p.read_text() for p in root.rglob("*.lkml")}
+            results.append((tree, len(writer.written)))
+
+        assert results[0] == results[1]
+        assert results[0][1] == 40
+
+    def test_directories_created_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each output folder is created once, not once per file."""
+        (tmp_path / "views").mkdir()
+        made: list[Path] = []
+        mkdir = Path.mkdir
+
+        def counting_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+            made.append(self)
+            mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        writer = OutputWriter(tmp_path, workers=4)
+        for path, content in self.files(tmp_path).items():
+            writer.submit(path, content)
+        writer.close()
+
+        assert sorted(p.name for p in made) == ["m0", "m1", "m2", "m3", "m4"]
+
+    def test_error_names_path(self, tmp_path: Path) -> None:
+        """Test a failed write raises OutputWriteError naming the file."""
+        (tmp_path / "views").write_text("not a folder")
+        target = tmp_path / "views" / "orders" / "orders.view.lkml"
+        writer = OutputWriter(tmp_path, workers=2)
+        writer.submit(target, "x")
+
+        with pytest.raises(OutputWriteError, match="orders.view.lkml") as exc:
+            writer.close()
+        assert exc.value.path == target
+
+    def test_fsync_batches_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test fsync syncs every file and each written folder once."""
+        synced: list[int] = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        writer = OutputWriter(tmp_path, workers=4, fsync=True)
+        for path, content in self.files(tmp_path).items():
+            writer.submit(path, content)
+        writer.close()
+
+        assert len(synced) == 40 + 5
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write."""
+
+    def test_no_temp_files_left(self, tmp_path: Path) -> None:
+        """Test the temp file is renamed into place."""
+        target = tmp_path / "a.lkml"
+        atomic_write(target, b"one")
+        atomic_write(target, b"two")
+
+        assert target.read_bytes() == b"two"
+        assert [p.name for p in tmp_path.iterdir()] == ["a.lkml"]
+
+    def test_permissions(self, tmp_path: Path) -> None:
+        """Test new files get umask permissions and existing ones keep theirs."""
+        new = tmp_path / "new.lkml"
+        atomic_write(new, b"x")
+        plain = tmp_path / "plain.lkml"
+        plain.write_bytes(b"x")
+        assert stat.S_IMODE(new.stat().st_mode) == stat.S_IMODE(plain.stat().st_mode)
+
+        plain.chmod(0o640)
+        atomic_write(plain, b"y")
+        assert stat.S_IMODE(plain.stat().st_mode) == 0o640
+
+    def test_failed_write_keeps_original(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an error before the rename leaves the old file intact."""
+        target = tmp_path / "a.lkml"
+        target.write_bytes(b"original")
+
+        def fail(src: str, dst: str) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            atomic_write(target, b"new")
+
+        assert target.read_bytes() == b"original"
+        assert [p.name for p in tmp_path.iterdir()] == ["a.lkml"]
+
+
+class TestFilesOnDisk:
+    """Tests for FilesOnDisk."""
+
+    def test_reads_on_access(self, tmp_path: Path) -> None:
+        """Test content is read from disk each time and unknown paths raise."""
+        a = tmp_path / "a.lkml"
+        b = tmp_path / "b.lkml"
+        a.write_text("one")
+        b.write_text("two")
+        files = FilesOnDisk([b, a, b])
+
+        assert list(files) == [b, a]
+        assert len(files) == 2
+        a.write_text("changed")
+        assert dict(files) == {a: "changed", b: "two"}
+        assert tmp_path / "c.lkml" not in files
+        with pytest.raises(KeyError):
+            files[tmp_path / "c.lkml"]